@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""Deface GUI anonimleştirme hattı için performans ölçümü.
+
+Sentetik görüntü ve videolar yerelde üretilir, GUI'nin kullandığı motor yolundan
+geçirilir ve sonuçlar JSON olarak yazdırılır. Kaydedilmiş bir temel ölçümle
+karşılaştırılarak gerilemeler tespit edilebilir.
+
+    python3 benchmark.py --save baseline.json
+    python3 benchmark.py --compare baseline.json --tolerance 0.1
+
+--render-only yalnızca blur/mosaic/solid çizim aşamasını, algılama ve kodlama
+olmadan aynı süreçte ölçer.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+import concurrent.futures
+import multiprocessing
+
+import defaceengine
+
+DEFAULT_RESOLUTIONS = "640x360,1280x720,1920x1080"
+DEFAULT_FACES = "0,1,4"
+DEFAULT_RENDER_FACES = "1,16,64"
+DEFAULT_FRAMES = 60
+DEFAULT_TOLERANCE = 0.10
+
+# Sentetik yüz renkleri (RGB)
+HAIR = (40, 30, 20)
+SKIN = (205, 160, 130)
+SHADOW = (175, 125, 100)
+EYE_WHITE = (245, 245, 245)
+FEATURE = (55, 38, 28)
+LIPS = (170, 80, 80)
+
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def parse_detection_size(value):
+    if value == "auto":
+        return defaceengine.DETECTION_SIZE_AUTO
+    if value == "native":
+        return defaceengine.DETECTION_SIZE_NATIVE
+    return int(value)
+
+
+def parse_list(text, convert):
+    return [convert(item) for item in text.split(",") if item.strip()]
+
+
+def face_layout(width, height, faces):
+    """Yüzleri kareye ızgara düzeninde yerleştirir: (merkez x, merkez y, yarıçap)"""
+    if faces == 0:
+        return []
+    columns = int(faces ** 0.5 + 0.999)
+    rows = (faces + columns - 1) // columns
+    cell_w, cell_h = width / columns, height / rows
+    radius = int(min(cell_w, cell_h) * 0.35)
+    return [
+        (int(cell_w * (i % columns + 0.5)), int(cell_h * (i // columns + 0.5)), radius)
+        for i in range(faces)
+    ]
+
+
+def draw_face(frame, x, y, r):
+    """CenterFace'in yakalayabileceği kadar belirgin, basit bir yüz çizer"""
+    import cv2
+
+    cv2.ellipse(frame, (x, y - r // 6), (int(r * 0.95), int(r * 1.05)), 0, 180, 360, HAIR, -1)
+    cv2.ellipse(frame, (x, y), (int(r * 0.78), r), 0, 0, 360, SKIN, -1)
+    for side in (-1, 1):
+        ex, ey = x + side * int(r * 0.33), y - int(r * 0.18)
+        cv2.ellipse(frame, (ex, ey), (int(r * 0.17), int(r * 0.08)), 0, 0, 360, EYE_WHITE, -1)
+        cv2.circle(frame, (ex, ey), int(r * 0.07), FEATURE, -1)
+        cv2.line(frame, (ex - int(r * 0.18), ey - int(r * 0.17)),
+                 (ex + int(r * 0.18), ey - int(r * 0.2)), FEATURE, max(2, r // 14))
+    cv2.ellipse(frame, (x, y + int(r * 0.12)), (int(r * 0.1), int(r * 0.18)), 0, 0, 360, SHADOW, -1)
+    cv2.ellipse(frame, (x, y + int(r * 0.5)), (int(r * 0.28), int(r * 0.09)), 0, 0, 360, LIPS, -1)
+
+
+def draw_frame(width, height, faces, shift=0):
+    """Gürültülü arka plan üzerinde yüz çizimleri içeren bir kare üretir"""
+    import numpy as np
+    import cv2
+
+    rng = np.random.default_rng(shift)
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    gradient = np.linspace(60, 160, width, dtype=np.uint8)
+    frame[:] = gradient[None, :, None]
+    for x, y, r in face_layout(width, height, faces):
+        # Videoda yüzler kareden kareye hafifçe kayar
+        draw_face(frame, x + shift % max(1, r // 2), y, r)
+    frame = cv2.GaussianBlur(frame, (0, 0), 1.5)
+    frame += rng.integers(0, 16, frame.shape, dtype=np.uint8)
+    return frame
+
+
+def make_image(path, width, height, faces):
+    import imageio.v2 as iio
+
+    iio.imwrite(path, draw_frame(width, height, faces))
+
+
+def make_video(path, width, height, faces, frames, fps=25):
+    import imageio_ffmpeg
+
+    writer = imageio_ffmpeg.write_frames(
+        path, (width, height), fps=fps, macro_block_size=1,
+        codec=defaceengine.DEFAULT_FFMPEG_CONFIG["codec"],
+    )
+    writer.send(None)
+    for index in range(frames):
+        writer.send(draw_frame(width, height, faces, index))
+    writer.close()
+
+
+def make_fixtures(work_dir, resolutions, face_counts, frames, kinds):
+    """Her çözünürlük ve yüz sayısı için örnek dosyaları üretir"""
+    cases = []
+    for width, height in resolutions:
+        for faces in face_counts:
+            for kind in kinds:
+                name = f"{kind}_{width}x{height}_f{faces}"
+                if kind == "image":
+                    path = os.path.join(work_dir, name + ".png")
+                    make_image(path, width, height, faces)
+                else:
+                    path = os.path.join(work_dir, name + ".mp4")
+                    make_video(path, width, height, faces, frames)
+                cases.append({"name": name, "kind": kind, "path": path,
+                              "width": width, "height": height, "faces": faces})
+    return cases
+
+
+def peak_rss_mb():
+    import resource
+
+    # Linux'ta ru_maxrss kilobayt, macOS'ta bayt cinsindendir
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def run_case(case, options, repeat):
+    """Tek bir örneği ayrı bir süreçte işler; tepe bellek bu sürece aittir"""
+    start = time.perf_counter()
+    engine = defaceengine.get_engine(options.backend)
+    load_seconds = time.perf_counter() - start
+    root, ext = os.path.splitext(case["path"])
+    output_path = root + defaceengine.OUTPUT_SUFFIX + ext
+
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        metrics = engine.process(case["path"], output_path, options)
+        runs.append((time.perf_counter() - start, metrics.to_dict()))
+    # En hızlı koşu raporlanır; diğerleri ısınma ve gürültüyü emer
+    seconds, metrics = min(runs, key=lambda run: run[0])
+    frames = metrics["counters"].get("frames", 0)
+    result = {key: value for key, value in case.items() if key != "path"}
+    return dict(
+        result,
+        seconds=seconds,
+        frames=frames,
+        fps=frames / seconds if seconds > 0 else 0.0,
+        faces_found=metrics["counters"].get("faces", 0),
+        stages=metrics["stages"],
+        model_load_seconds=load_seconds,
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+
+def face_boxes(width, height, faces):
+    """Yüz düzenini algılama çıktısı biçiminde kutulara çevirir"""
+    import numpy as np
+
+    boxes = [(x - r * 0.78, y - r, x + r * 0.78, y + r, 1.0) for x, y, r in face_layout(width, height, faces)]
+    return np.array(boxes, dtype=np.float32).reshape(-1, 5)
+
+
+def run_render_case(width, height, faces, options, frames, repeat):
+    """Çizim aşamasını tek başına ölçer; her karede kaynak kare tampona geri kopyalanır"""
+    import numpy as np
+
+    source = draw_frame(width, height, faces)
+    frame = np.empty_like(source)
+    dets = face_boxes(width, height, faces)
+    renderer = defaceengine.FrameRenderer.from_options(options)
+    runs = []
+    for _ in range(repeat):
+        seconds = 0.0
+        for _ in range(frames):
+            np.copyto(frame, source)
+            start = time.perf_counter()
+            renderer.render(frame, dets)
+            seconds += time.perf_counter() - start
+        runs.append(seconds)
+    seconds = min(runs)
+    return {
+        "name": f"render_{options.method}_{width}x{height}_f{faces}",
+        "kind": "render",
+        "width": width,
+        "height": height,
+        "faces": faces,
+        "seconds": seconds,
+        "frames": frames,
+        "fps": frames / seconds if seconds > 0 else 0.0,
+        "mean_ms": seconds / frames * 1000 if frames else 0.0,
+        "boxes_per_second": faces * frames / seconds if seconds > 0 else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def measure_startup(backend):
+    """Yeni bir yorumlayıcıda motorun içe aktarma ve model yükleme süresini ölçer"""
+    code = (
+        "import time, json; t0 = time.perf_counter(); import defaceengine; "
+        "t1 = time.perf_counter(); defaceengine.get_engine(%r); t2 = time.perf_counter(); "
+        "print(json.dumps({'import_seconds': t1 - t0, 'model_load_seconds': t2 - t1}))" % backend
+    )
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    total = time.perf_counter() - start
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1:] or ["failed"]}
+    startup = json.loads(result.stdout.strip().splitlines()[-1])
+    startup["process_seconds"] = total
+    return startup
+
+
+def environment(args):
+    import numpy as np
+
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "backend": args.backend,
+    }
+    try:
+        import onnxruntime
+        info["onnxruntime"] = onnxruntime.__version__
+    except ImportError:
+        info["onnxruntime"] = None
+    try:
+        import cv2
+        info["opencv"] = cv2.__version__
+    except ImportError:
+        info["opencv"] = None
+    return info
+
+
+def compare(results, baseline, tolerance):
+    """Ölçümleri temel ölçümle karşılaştırır; fps düşüşü ve bellek artışı gerilemedir"""
+    previous = {case["name"]: case for case in baseline.get("cases", [])}
+    rows = []
+    for case in results["cases"]:
+        base = previous.get(case["name"])
+        if base is None:
+            continue
+        fps_ratio = case["fps"] / base["fps"] if base["fps"] else None
+        rss_ratio = case["peak_rss_mb"] / base["peak_rss_mb"] if base["peak_rss_mb"] else None
+        regressed = []
+        if fps_ratio is not None and fps_ratio < 1 - tolerance:
+            regressed.append("fps")
+        if rss_ratio is not None and rss_ratio > 1 + tolerance:
+            regressed.append("peak_rss_mb")
+        rows.append({
+            "name": case["name"],
+            "fps": case["fps"],
+            "baseline_fps": base["fps"],
+            "fps_ratio": fps_ratio,
+            "rss_ratio": rss_ratio,
+            "regressed": regressed,
+        })
+    base_load = baseline.get("startup", {}).get("model_load_seconds")
+    load = results["startup"].get("model_load_seconds")
+    startup_ratio = load / base_load if load and base_load else None
+    return {
+        "tolerance": tolerance,
+        "cases": rows,
+        "startup_ratio": startup_ratio,
+        "startup_regressed": startup_ratio is not None and startup_ratio > 1 + tolerance,
+        "regressions": sum(1 for row in rows if row["regressed"]),
+    }
+
+
+def print_summary(results):
+    for case in results["cases"]:
+        stages = ", ".join(
+            f"{name} {stage['mean_ms']:.1f}ms" for name, stage in sorted(case.get("stages", {}).items())
+        ) or f"draw {case['mean_ms']:.2f}ms"
+        print(f"{case['name']:<24} {case['fps']:8.1f} fps  {case['peak_rss_mb']:7.0f} MB  {stages}",
+              file=sys.stderr)
+    comparison = results.get("comparison")
+    if comparison:
+        for row in comparison["cases"]:
+            if row["fps_ratio"] is None:
+                continue
+            mark = " REGRESSION" if row["regressed"] else ""
+            print(f"{row['name']:<24} {row['fps_ratio']:6.2f}x baseline{mark}", file=sys.stderr)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Deface GUI anonymization benchmark")
+    parser.add_argument("--resolutions", default=DEFAULT_RESOLUTIONS,
+                        help=f"comma separated WxH list (default {DEFAULT_RESOLUTIONS})")
+    parser.add_argument("--faces",
+                        help=f"comma separated face counts (default {DEFAULT_FACES}, "
+                             f"{DEFAULT_RENDER_FACES} with --render-only)")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="frames per video")
+    parser.add_argument("--kinds", default="image,video", help="image, video or both")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per case, fastest is reported")
+    parser.add_argument("--method", choices=["blur", "solid", "mosaic"], default="blur")
+    parser.add_argument("--mosaic-size", type=int, default=20)
+    parser.add_argument("--encoder-preset", choices=list(defaceengine.ENCODER_PRESETS),
+                        default=defaceengine.DEFAULT_ENCODER_PRESET)
+    parser.add_argument("--encoder-threads", type=int, default=0, help="ffmpeg encoder threads (0: auto)")
+    parser.add_argument("--render-only", action="store_true",
+                        help="time only the blur/mosaic/solid drawing stage, in process")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--detect-interval", type=int, default=1)
+    parser.add_argument("--detection-size", default="native",
+                        help="detection long side in pixels, 'auto' or 'native'")
+    parser.add_argument("--backend", choices=["auto", "onnxrt", "opencv"], default="auto")
+    parser.add_argument("--work-dir", help="keep fixtures and outputs in this directory")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--save", help="save the report as a baseline file")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare against a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative slowdown before failing (default 0.10)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    options = defaceengine.JobOptions(
+        method=args.method, threshold=args.threshold, keep_audio=False, mosaic_size=args.mosaic_size,
+        encoder_preset=args.encoder_preset, encoder_threads=args.encoder_threads,
+        backend=args.backend, detection_cache=False, detect_interval=args.detect_interval,
+        detection_size=parse_detection_size(args.detection_size),
+    )
+    resolutions = parse_list(args.resolutions, parse_size)
+    faces = parse_list(args.faces or (DEFAULT_RENDER_FACES if args.render_only else DEFAULT_FACES), int)
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment(args),
+        "options": {"method": args.method, "threshold": args.threshold,
+                    "detect_interval": args.detect_interval, "frames": args.frames,
+                    "detection_size": args.detection_size, "mosaic_size": args.mosaic_size,
+                    "encoder_preset": args.encoder_preset, "encoder_threads": args.encoder_threads,
+                    "render_only": args.render_only},
+        "startup": {},
+        "cases": [],
+    }
+    if args.render_only:
+        # Model yüklenmez; yalnızca çizim aşaması bu süreçte ölçülür
+        for width, height in resolutions:
+            for count in faces:
+                results["cases"].append(run_render_case(width, height, count, options, args.frames, args.repeat))
+    else:
+        work_dir = args.work_dir or tempfile.mkdtemp(prefix="defacegui-bench-")
+        os.makedirs(work_dir, exist_ok=True)
+        try:
+            cases = make_fixtures(work_dir, resolutions, faces, args.frames, parse_list(args.kinds, str.strip))
+            results["startup"] = measure_startup(args.backend)
+            # Her örnek temiz bir süreçte çalışır; böylece tepe bellek örneğe özgü olur
+            context = multiprocessing.get_context("spawn")
+            for case in cases:
+                with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+                    results["cases"].append(pool.submit(run_case, case, options, args.repeat).result())
+        finally:
+            if not args.work_dir:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+    status = 0
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            results["comparison"] = compare(results, json.load(f), args.tolerance)
+        if results["comparison"]["regressions"] or results["comparison"]["startup_regressed"]:
+            status = 1
+
+    report = json.dumps(results, indent=2)
+    for path in filter(None, (args.output, args.save)):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    print(report)
+    print_summary(results)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3343 @@
+#!/usr/bin/env python3
+"""Deface GUI için Qt bağımsız anonimleştirme motoru.
+
+CenterFace modeli süreç başına bir kez yüklenir ve sonraki işlerde yeniden
+kullanılır; böylece her dosya için yeni bir yorumlayıcı ve model yükleme
+maliyeti ödenmez.
+"""
+import os
+import sys
+import time
+import re
+import shutil
+import hashlib
+import subprocess
+import queue
+import mimetypes
+import threading
+import contextlib
+import functools
+import json
+from datetime import datetime
+from dataclasses import dataclass, field
+
+# deface ve bağlı paketlerin varsayılan ayarları
+DEFAULT_MASK_SCALE = 1.3
+DEFAULT_FFMPEG_CONFIG = {"codec": "libx264"}
+
+# Video çıkışı kodlama ön ayarları: kodek, CRF ve x264 hız ön ayarı. Zaman
+# aralığı modunda işlenen parçalar kaynaktan kopyalananlarla birleştiğinden
+# hepsi H.264 üretir.
+ENCODER_PRESETS = {
+    "fast": {"codec": "libx264", "crf": 28, "speed": "veryfast"},
+    "balanced": {"codec": "libx264", "crf": 23, "speed": "medium"},
+    "archival": {"codec": "libx264", "crf": 18, "speed": "slow"},
+}
+DEFAULT_ENCODER_PRESET = "balanced"
+
+# Klasörler taranırken kuyruğa alınan uzantılar
+VIDEO_EXTENSIONS = {".mp4", ".avi", ".mov", ".mkv", ".webm", ".m4v"}
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp"}
+MEDIA_EXTENSIONS = VIDEO_EXTENSIONS | IMAGE_EXTENSIONS
+
+OUTPUT_SUFFIX = "_anonimlestirilmis"
+# Parçalı video işinin çalışma klasörü uzantısı (çıkış yolu + uzantı)
+PARTS_SUFFIX = ".parts"
+
+# Algılama önbelleği
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "defacegui")
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Klasör izleme: dosya bu kadar saniye değişmeden kalınca yazılmış sayılır
+DEFAULT_SETTLE_SECONDS = 2.0
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Daha önce üretilmiş çıkışların içerik özeti kaydı
+MANIFEST_PATH = os.path.join(CACHE_DIR, "manifest.sqlite3")
+# Yarım kalan toplu işlerin durum kaydı
+JOB_STORE_PATH = os.path.join(CACHE_DIR, "jobs.sqlite3")
+
+# İşlem geçmişi önbellek değil kullanıcı verisidir
+DATA_DIR = os.path.join(os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share")), "defacegui")
+HISTORY_PATH = os.path.join(DATA_DIR, "history.sqlite3")
+DEFAULT_HISTORY_MAX_ENTRIES = 10000
+DEFAULT_HISTORY_MAX_DAYS = 365
+HISTORY_PAGE_SIZE = 50
+
+# cProfile dökümleri
+PROFILE_DIR = os.path.join(CACHE_DIR, "profiles")
+
+# Çözme, algılama ve kodlama aşamaları arasındaki kuyruk boyu (kare)
+PIPELINE_QUEUE_SIZE = 8
+
+# İptal ve duraklatma bayraklarının en sık kontrol edilme aralığı (sn)
+CONTROL_CHECK_INTERVAL = 0.1
+
+# Hızlı video modu: anahtar kareler arasında kutu ara değerleme
+DEFAULT_SCENE_THRESHOLD = 30.0
+DEFAULT_TRACK_MARGIN = 0.15
+
+# Küçültülmüş algılama: 0 tam çözünürlük, DETECTION_SIZE_AUTO girişe göre seçer
+DETECTION_SIZE_NATIVE = 0
+DETECTION_SIZE_AUTO = -1
+AUTO_DETECTION_SIZE = 1280
+AUTO_DETECTION_MIN_SIDE = 1920
+
+# Çok büyük görüntüler örtüşen karolarda işlenir; 0 eşik karo modunu kapatır
+DEFAULT_TILE_MIN_PIXELS = 100_000_000
+TILE_SIZE = 1024
+TILE_OVERLAP = 256
+
+# Durağan görüntü toplu işleme: ileri geçiş başına görüntü, önden çözülen
+# görüntü sayısı ve işçi süreçlerine tek görevde gönderilen en fazla dosya
+DEFAULT_BATCH_SIZE = 8
+IMAGE_PREFETCH = 16
+IMAGE_CHUNK_SIZE = 64
+
+# Hızlı önizleme: örnek kare sayısı, gösterim boyu ve algılamanın yapıldığı
+# en yüksek eşik (daha yüksek eşikler önbellekteki skorlardan süzülür)
+PREVIEW_FRAMES = 6
+PREVIEW_MAX_SIDE = 480
+PREVIEW_DETECT_THRESHOLD = 0.1
+
+
+@dataclass
+class JobOptions:
+    """GUI'nin topladığı anonimleştirme seçenekleri"""
+    method: str = "blur"
+    threshold: float = 0.2
+    mosaic_size: int = 20
+    keep_audio: bool = True
+    mask_scale: float = DEFAULT_MASK_SCALE
+    ellipse: bool = True
+    backend: str = "auto"
+    detection_cache: bool = True
+    cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    detect_interval: int = 1
+    scene_threshold: float = DEFAULT_SCENE_THRESHOLD
+    track_margin: float = DEFAULT_TRACK_MARGIN
+    segments: int = 1
+    profile: bool = False
+    detection_size: int = DETECTION_SIZE_NATIVE
+    tile_min_pixels: int = DEFAULT_TILE_MIN_PIXELS
+    batch_size: int = DEFAULT_BATCH_SIZE
+    skip_unchanged: bool = True
+    dedup: str = "copy"
+    # [[başlangıç, bitiş], ...] saniye; bitiş None ise videonun sonuna kadar
+    time_ranges: list = field(default_factory=list)
+    # [[x, y, genişlik, yükseklik], ...] kare boyutuna oranla; roi_mask maske görüntüsü
+    roi: list = field(default_factory=list)
+    roi_mask: str = ""
+    encoder_preset: str = DEFAULT_ENCODER_PRESET
+    # 0: kaynak yöneticisinin işçi payı, o da yoksa ffmpeg'in kendi seçimi
+    encoder_threads: int = 0
+
+    def encoder_args(self):
+        """Seçilen ön ayarın ffmpeg video kodlama argümanları"""
+        preset = ENCODER_PRESETS.get(self.encoder_preset, ENCODER_PRESETS[DEFAULT_ENCODER_PRESET])
+        args = ["-c:v", preset["codec"], "-crf", str(preset["crf"]), "-preset", preset["speed"]]
+        threads = self.encoder_threads or thread_limit()
+        if threads > 0:
+            args += ["-threads", str(threads)]
+        return args
+
+    def ffmpeg_config(self):
+        """imageio yazıcısı ve deface --ffmpeg-config için kodlama ayarları
+
+        imageio'nun kendi kalite ayarı kapatılır; kalite yalnızca CRF ile belirlenir.
+        """
+        args = self.encoder_args()
+        return {"codec": args[1], "quality": None, "output_params": args[2:]}
+
+    def roi_key(self):
+        """İlgi bölgesi için kısa anahtar; maske dosyası değişince anahtar da değişir"""
+        if not self.roi and not self.roi_mask:
+            return ""
+        try:
+            mtime = os.stat(self.roi_mask).st_mtime_ns if self.roi_mask else 0
+        except OSError:
+            mtime = 0
+        data = json.dumps([self.roi, self.roi_mask, mtime])
+        return "_roi" + hashlib.sha1(data.encode()).hexdigest()[:10]
+
+    def detection_key(self):
+        """Algılama sonucunu etkileyen seçeneklerden önbellek anahtarı üretir"""
+        key = f"t{self.threshold:.3f}"
+        if self.detection_size == DETECTION_SIZE_AUTO:
+            key += "_dauto"
+        elif self.detection_size > 0:
+            key += f"_d{self.detection_size}"
+        if self.detect_interval > 1:
+            key += f"_k{self.detect_interval}_s{self.scene_threshold:g}_m{self.track_margin:g}"
+        return key + self.roi_key()
+
+    def to_dict(self):
+        from dataclasses import asdict
+
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Kaydedilmiş seçenekleri yükler; bilinmeyen alanlar yok sayılır"""
+        from dataclasses import fields
+
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    def output_key(self):
+        """Çıkış dosyasını etkileyen tüm seçeneklerden manifest anahtarı üretir"""
+        key = (
+            f"{self.detection_key()}_{self.method}_m{self.mosaic_size}_a{int(self.keep_audio)}"
+            f"_s{self.mask_scale:g}_e{int(self.ellipse)}_p{self.tile_min_pixels}"
+        )
+        if self.time_ranges:
+            key += "_r" + hashlib.sha1(json.dumps(self.time_ranges).encode()).hexdigest()[:10]
+        if self.encoder_preset != DEFAULT_ENCODER_PRESET:
+            key += f"_v{self.encoder_preset}"
+        return key
+
+
+@dataclass
+class Job:
+    """Kuyruktaki tek bir giriş/çıkış dosyası çifti"""
+    input_path: str
+    output_path: str
+    job_id: int = 0
+    status: str = "queued"
+    error: str = ""
+    seconds: float = 0.0
+    metrics: dict = field(default_factory=dict)
+    digest: str = ""
+    # Bilinen tahmini kare sayısı; 0 ise video işlenmeden önce sayılır
+    total_frames: int = 0
+
+
+@dataclass
+class _PendingImage:
+    """Toplu görüntü işlemede çözülmüş ve algılama bekleyen bir dosya"""
+    job: Job
+    metrics: "JobMetrics"
+    start: float
+    frame: object = None
+    detect_frame: object = None
+    scale: float = 1.0
+    cache: object = None
+    digest: str = None
+    cached: list = None
+    tiled: bool = False
+    error: Exception = None
+
+
+def suggest_output_path(input_path):
+    """Giriş yolundan varsayılan çıkış yolunu üretir"""
+    if os.path.isfile(input_path):
+        base, ext = os.path.splitext(input_path)
+        return f"{base}{OUTPUT_SUFFIX}{ext}"
+    return input_path + OUTPUT_SUFFIX
+
+
+def is_media_file(path):
+    return os.path.splitext(path)[1].lower() in MEDIA_EXTENSIONS
+
+
+def is_input_file(path):
+    """Önceki çalıştırmaların çıktıları dışındaki medya dosyaları"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return is_media_file(path) and not stem.endswith(OUTPUT_SUFFIX)
+
+
+def collect_inputs(paths):
+    """Dosya ve klasör listesini sıralı, tekrarsız medya dosyası listesine açar"""
+    found = []
+    seen = set()
+    for path in paths:
+        if os.path.isdir(path):
+            candidates = []
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.endswith((OUTPUT_SUFFIX, PARTS_SUFFIX)))
+                for name in sorted(files):
+                    candidates.append(os.path.join(root, name))
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            # Önceki çalıştırmaların çıktılarını tekrar kuyruğa alma
+            if not is_input_file(candidate):
+                continue
+            candidate = os.path.abspath(candidate)
+            if candidate not in seen:
+                seen.add(candidate)
+                found.append(candidate)
+    return found
+
+
+def make_jobs(input_paths):
+    return [Job(path, suggest_output_path(path), job_id=i) for i, path in enumerate(input_paths)]
+
+
+def default_worker_count():
+    return max(1, os.cpu_count() or 1)
+
+
+def detection_scale(shape, detection_size):
+    """Algılamanın yapılacağı ölçek çarpanını döndürür (1.0: tam çözünürlük)
+
+    detection_size algılama kopyasının uzun kenarıdır. Otomatik modda yalnızca
+    uzun kenarı AUTO_DETECTION_MIN_SIDE değerini aşan girişler küçültülür.
+    Görüntü hiçbir zaman büyütülmez.
+    """
+    longest = max(shape[:2])
+    if detection_size == DETECTION_SIZE_AUTO:
+        if longest <= AUTO_DETECTION_MIN_SIDE:
+            return 1.0
+        detection_size = AUTO_DETECTION_SIZE
+    if detection_size <= 0 or longest <= detection_size:
+        return 1.0
+    return detection_size / longest
+
+
+def format_duration(seconds):
+    """Saniyeyi SS:DD:ss biçiminde yazar"""
+    if seconds is None:
+        return "--:--:--"
+    seconds = int(round(seconds))
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def parse_time(value):
+    """'90', '1:30' veya '0:01:30.5' biçimindeki zamanı saniyeye çevirir"""
+    parts = value.strip().split(":")
+    if not 1 <= len(parts) <= 3:
+        raise ValueError(f"Invalid time: {value!r}")
+    seconds = 0.0
+    for part in parts:
+        try:
+            number = float(part)
+        except ValueError:
+            raise ValueError(f"Invalid time: {value!r}") from None
+        if number < 0:
+            raise ValueError(f"Invalid time: {value!r}")
+        seconds = seconds * 60 + number
+    return seconds
+
+
+def parse_time_ranges(text):
+    """'0:30-2:15, 1:10:00-' gibi virgülle ayrılmış aralıkları [[başlangıç, bitiş], ...] olarak döndürür
+
+    Bitişi boş bırakılan aralık videonun sonuna kadar sürer.
+    """
+    ranges = []
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        start, sep, end = item.partition("-")
+        if not sep:
+            raise ValueError(f"Invalid time range: {item.strip()!r}")
+        start = parse_time(start)
+        end = parse_time(end) if end.strip() else None
+        if end is not None and end <= start:
+            raise ValueError(f"Invalid time range: {item.strip()!r}")
+        ranges.append([start, end])
+    return sorted(ranges, key=lambda r: r[0])
+
+
+def format_time_ranges(ranges):
+    return ", ".join(f"{format_duration(start)}-{format_duration(end) if end is not None else ''}"
+                     for start, end in ranges)
+
+
+def range_spans(ranges, keyframes, duration):
+    """Zaman aralıklarını anahtar karelere genişletip birleştirir
+
+    Dönen [başlangıç, bitiş] aralıkları akış kopyasıyla kesilebilir; aralık
+    dışındaki bölümler yeniden kodlanmadan olduğu gibi kalır.
+    """
+    keys = sorted({0.0, *(t for t in keyframes if t < duration)})
+    spans = []
+    for start, end in sorted(ranges, key=lambda r: r[0]):
+        end = duration if end is None else min(end, duration)
+        if end <= start:
+            continue
+        start = max(t for t in keys if t <= start)
+        end = min((t for t in keys if t >= end), default=duration)
+        if spans and start <= spans[-1][1]:
+            spans[-1][1] = max(spans[-1][1], end)
+        else:
+            spans.append([start, end])
+    return spans
+
+
+def format_size(num_bytes):
+    """Bayt sayısını okunabilir birimle yazar"""
+    size = float(num_bytes or 0)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """Dosya içeriğinin BLAKE2b özetini döndürür"""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DetectionCache:
+    """Kare başına algılamaları (kutular ve skorlar) diskte saklar
+
+    Kayıtlar giriş içeriğinin özeti ve algılama anahtarıyla adlandırılır;
+    toplam boyut sınırı aşıldığında en uzun süredir kullanılmayanlar silinir.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.directory = directory or os.path.join(CACHE_DIR, "detections")
+        self.max_bytes = max_bytes
+
+    def path_for(self, digest, key):
+        return os.path.join(self.directory, f"{digest}_{key}.npz")
+
+    def load(self, digest, key):
+        """Kayıtlı algılamaları kare listesi olarak döndürür, yoksa None"""
+        import numpy as np
+
+        path = self.path_for(digest, key)
+        try:
+            with np.load(path) as data:
+                boxes, offsets = data["boxes"], data["offsets"]
+            # Son kullanım zamanını güncelle (LRU tahliyesi için)
+            os.utime(path)
+        except (OSError, KeyError, ValueError):
+            return None
+        return [boxes[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+    def store(self, digest, key, detections):
+        import numpy as np
+
+        os.makedirs(self.directory, exist_ok=True)
+        offsets = np.zeros(len(detections) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(dets) for dets in detections])
+        if detections:
+            boxes = np.concatenate([np.asarray(dets, dtype=np.float32).reshape(-1, 5) for dets in detections])
+        else:
+            boxes = np.empty((0, 5), dtype=np.float32)
+        path = self.path_for(digest, key)
+        # Yarım yazılmış kayıt okunmasın diye geçici dosya üzerinden yaz
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, boxes=boxes, offsets=offsets)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        total = 0
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+            total += stat.st_size
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+                total -= size
+            except OSError:
+                # Başka bir işçi süreci aynı kaydı silmiş olabilir
+                pass
+
+
+class Manifest:
+    """Üretilmiş çıkışları giriş özeti ve seçenek anahtarıyla kaydeder
+
+    Aynı giriş aynı seçeneklerle yeniden işlenmek istendiğinde çıkış hâlâ
+    yerinde ve değişmemişse iş atlanır; özdeş içerikli başka bir giriş için
+    önceki çıkış kopyalanır veya sabit bağlanır. Yalnızca ana süreçte
+    kullanılır.
+    """
+
+    def __init__(self, path=None):
+        import sqlite3
+
+        self.path = path or MANIFEST_PATH
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.db = sqlite3.connect(self.path, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS outputs ("
+            " digest TEXT NOT NULL, options TEXT NOT NULL, output_path TEXT NOT NULL,"
+            " size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, created REAL NOT NULL,"
+            " PRIMARY KEY (digest, options, output_path))"
+        )
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+    def outputs(self, digest, key):
+        """Kayıtlı ve hâlâ değişmeden duran çıkış yollarını döndürür"""
+        rows = self.db.execute(
+            "SELECT output_path, size, mtime_ns FROM outputs WHERE digest = ? AND options = ?"
+            " ORDER BY created DESC", (digest, key)
+        ).fetchall()
+        valid = []
+        for path, size, mtime_ns in rows:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+                valid.append(path)
+        return valid
+
+    def lookup(self, job, options):
+        """İş için ('unchanged', yol), ('duplicate', kaynak) veya (None, None) döndürür"""
+        if not job.digest:
+            job.digest = file_digest(job.input_path)
+        outputs = self.outputs(job.digest, options.output_key())
+        target = os.path.abspath(job.output_path)
+        for path in outputs:
+            if os.path.abspath(path) == target:
+                return "unchanged", path
+        if outputs:
+            return "duplicate", outputs[0]
+        return None, None
+
+    def record(self, job, options):
+        try:
+            stat = os.stat(job.output_path)
+        except OSError:
+            return
+        self.db.execute(
+            "INSERT OR REPLACE INTO outputs VALUES (?, ?, ?, ?, ?, ?)",
+            (job.digest or file_digest(job.input_path), options.output_key(),
+             os.path.abspath(job.output_path), stat.st_size, stat.st_mtime_ns, time.time())
+        )
+        self.db.commit()
+
+    def reuse(self, source, job, options):
+        """Önceki çıkışı işin çıkışına kopyalar veya sabit bağlar"""
+        if os.path.lexists(job.output_path):
+            os.remove(job.output_path)
+        if options.dedup == "link":
+            try:
+                os.link(source, job.output_path)
+            except OSError:
+                # Farklı dosya sistemi veya bağ desteklenmiyor
+                shutil.copy2(source, job.output_path)
+        else:
+            shutil.copy2(source, job.output_path)
+        self.record(job, options)
+
+
+class JobStore:
+    """Toplu işlerin ve her dosyanın durumunu çökmeye dayanıklı biçimde kaydeder
+
+    Her durum değişimi ayrı bir işlemle yazılır. Uygulama veya makine kapanırsa
+    bitmemiş toplu iş kayıtlı seçenekleriyle yeniden yüklenir; biten ve atlanan
+    dosyalar tekrar işlenmez. Biten toplu işler silinir. Yalnızca ana süreçte
+    kullanılır.
+    """
+
+    def __init__(self, path=None):
+        import sqlite3
+
+        self.path = path or JOB_STORE_PATH
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.db = sqlite3.connect(self.path, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS batches ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT, options TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " batch INTEGER NOT NULL, job_id INTEGER NOT NULL,"
+            " input_path TEXT NOT NULL, output_path TEXT NOT NULL, status TEXT NOT NULL,"
+            " error TEXT NOT NULL DEFAULT '', seconds REAL NOT NULL DEFAULT 0, metrics TEXT,"
+            " PRIMARY KEY (batch, job_id))"
+        )
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+    def create(self, jobs, options):
+        """Toplu işi ve dosyalarını kaydeder, toplu iş kimliğini döndürür"""
+        with self.db:
+            batch = self.db.execute(
+                "INSERT INTO batches (options, created) VALUES (?, ?)",
+                (json.dumps(options.to_dict()), time.time())
+            ).lastrowid
+            self.db.executemany(
+                "INSERT INTO jobs (batch, job_id, input_path, output_path, status, error, seconds, metrics)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(batch, job.job_id, job.input_path, job.output_path, job.status, job.error,
+                  job.seconds, json.dumps(job.metrics)) for job in jobs]
+            )
+        return batch
+
+    def update(self, batch, event):
+        """Durum veya bitiş olayını işin satırına yazar"""
+        if event["type"] == "status":
+            self.db.execute("UPDATE jobs SET status = ? WHERE batch = ? AND job_id = ?",
+                            (event["status"], batch, event["job"]))
+        elif event["type"] == "finished":
+            self.db.execute(
+                "UPDATE jobs SET status = ?, error = ?, seconds = ?, metrics = ? WHERE batch = ? AND job_id = ?",
+                (event["status"], event["error"], event["seconds"], json.dumps(event["metrics"]),
+                 batch, event["job"])
+            )
+        else:
+            return
+        self.db.commit()
+
+    def finish(self, batch):
+        with self.db:
+            self.db.execute("DELETE FROM jobs WHERE batch = ?", (batch,))
+            self.db.execute("DELETE FROM batches WHERE id = ?", (batch,))
+
+    def unfinished(self):
+        """Yarım kalmış toplu işleri (kimlik, seçenekler, işler) olarak döndürür
+
+        Çalışırken kesilen işler yeniden kuyruğa alınmış olarak gelir.
+        """
+        batches = []
+        for batch, options in self.db.execute("SELECT id, options FROM batches ORDER BY id").fetchall():
+            jobs = []
+            rows = self.db.execute(
+                "SELECT job_id, input_path, output_path, status, error, seconds, metrics FROM jobs"
+                " WHERE batch = ? ORDER BY job_id", (batch,)
+            ).fetchall()
+            for job_id, input_path, output_path, status, error, seconds, metrics in rows:
+                if status not in ("done", "skipped", "failed"):
+                    status, error, seconds, metrics = "queued", "", 0.0, None
+                jobs.append(Job(input_path, output_path, job_id=job_id, status=status, error=error,
+                                seconds=seconds, metrics=json.loads(metrics) if metrics else {}))
+            batches.append((batch, JobOptions.from_dict(json.loads(options)), jobs))
+        return batches
+
+
+class HistoryStore:
+    """İşlem geçmişini dizinli bir sqlite tablosunda tutar
+
+    Kayıt eklemek ve güncellemek tek satırlık işlemlerdir; geçmiş büyüdükçe
+    yazma maliyeti artmaz. Liste sayfa sayfa ve giriş yoluna göre aranarak
+    okunur. Saklama sınırı kayıt sayısı ve yaşa göre uygulanır.
+    """
+
+    COLUMNS = ("id", "date", "input", "output", "method", "status", "seconds", "metrics")
+
+    def __init__(self, path=None):
+        import sqlite3
+
+        self.path = path or HISTORY_PATH
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.db = sqlite3.connect(self.path, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS history ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT, created REAL NOT NULL, date TEXT NOT NULL,"
+            " input TEXT NOT NULL, output TEXT NOT NULL, method TEXT NOT NULL,"
+            " status TEXT NOT NULL DEFAULT '', seconds REAL NOT NULL DEFAULT 0, metrics TEXT)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS history_created ON history (created)")
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+    def add(self, entries):
+        """(giriş, çıkış, yöntem) kayıtlarını tek işlemde ekler, kimliklerini döndürür"""
+        now = time.time()
+        date = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M")
+        ids = []
+        with self.db:
+            for input_path, output_path, method in entries:
+                ids.append(self.db.execute(
+                    "INSERT INTO history (created, date, input, output, method) VALUES (?, ?, ?, ?, ?)",
+                    (now, date, input_path, output_path, method)
+                ).lastrowid)
+        return ids
+
+    def import_entries(self, entries):
+        """Eski JSON ayar dosyasındaki geçmiş listesini sırasıyla aktarır"""
+        now = time.time()
+
+        def created(entry):
+            try:
+                return datetime.strptime(entry.get("date", ""), "%Y-%m-%d %H:%M").timestamp()
+            except ValueError:
+                return now
+
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO history (created, date, input, output, method, status, seconds, metrics)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(created(entry), entry.get("date", ""), entry.get("input", ""),
+                  entry.get("output", ""), entry.get("method", ""), entry.get("status", ""),
+                  entry.get("seconds", 0.0), json.dumps(entry["metrics"]) if entry.get("metrics") else None)
+                 for entry in entries]
+            )
+
+    def update(self, entry_id, status, seconds, metrics):
+        with self.db:
+            self.db.execute(
+                "UPDATE history SET status = ?, seconds = ?, metrics = ? WHERE id = ?",
+                (status, seconds, json.dumps(metrics) if metrics else None, entry_id)
+            )
+
+    def _row(self, row):
+        entry = dict(zip(self.COLUMNS, row))
+        entry["metrics"] = json.loads(entry["metrics"]) if entry["metrics"] else {}
+        return entry
+
+    @staticmethod
+    def _where(search):
+        if not search:
+            return "", ()
+        return " WHERE input LIKE ? ESCAPE '\\'", (
+            "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%",)
+
+    def get(self, entry_id):
+        row = self.db.execute(
+            f"SELECT {', '.join(self.COLUMNS)} FROM history WHERE id = ?", (entry_id,)
+        ).fetchone()
+        return self._row(row) if row else None
+
+    def count(self, search=""):
+        where, params = self._where(search)
+        return self.db.execute(f"SELECT COUNT(*) FROM history{where}", params).fetchone()[0]
+
+    def page(self, offset=0, limit=HISTORY_PAGE_SIZE, search=""):
+        """En yeniden eskiye sıralı bir sayfa kayıt döndürür"""
+        where, params = self._where(search)
+        rows = self.db.execute(
+            f"SELECT {', '.join(self.COLUMNS)} FROM history{where} ORDER BY id DESC LIMIT ? OFFSET ?",
+            params + (limit, offset)
+        ).fetchall()
+        return [self._row(row) for row in rows]
+
+    def metrics_records(self):
+        """Ölçümü olan tüm kayıtlar; Prometheus dışa aktarımı için"""
+        rows = self.db.execute(
+            f"SELECT {', '.join(self.COLUMNS)} FROM history WHERE metrics IS NOT NULL ORDER BY id"
+        )
+        return [self._row(row) for row in rows]
+
+    def prune(self, max_entries=DEFAULT_HISTORY_MAX_ENTRIES, max_days=DEFAULT_HISTORY_MAX_DAYS):
+        """Saklama sınırını aşan en eski kayıtları siler (0: sınırsız)"""
+        with self.db:
+            if max_days:
+                self.db.execute("DELETE FROM history WHERE created < ?", (time.time() - max_days * 86400,))
+            if max_entries:
+                self.db.execute(
+                    "DELETE FROM history WHERE id <= (SELECT id FROM history ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                    (max_entries,)
+                )
+
+    def clear(self):
+        with self.db:
+            self.db.execute("DELETE FROM history")
+
+
+def release_output(path):
+    """Sabit bağlı bir çıkışın üzerine yazmadan önce bağı koparır
+
+    Aksi halde yeni sonuç aynı içeriği paylaşan diğer çıkışı da değiştirir.
+    """
+    try:
+        if os.stat(path).st_nlink > 1:
+            os.remove(path)
+    except OSError:
+        pass
+
+
+def expand_boxes(dets, margin):
+    """Kutuları merkezleri sabit kalacak şekilde her yönde margin oranında büyütür"""
+    if margin <= 0 or len(dets) == 0:
+        return dets
+    dets = dets.copy()
+    w = dets[:, 2] - dets[:, 0]
+    h = dets[:, 3] - dets[:, 1]
+    dets[:, 0] -= w * margin / 2
+    dets[:, 2] += w * margin / 2
+    dets[:, 1] -= h * margin / 2
+    dets[:, 3] += h * margin / 2
+    return dets
+
+
+def interpolate_boxes(start, end, steps, margin):
+    """İki anahtar karenin kutuları arasında steps ara kare için kutu üretir
+
+    Eşleşen kutular doğrusal olarak ara değerlenir; eşleşmeyen kutular
+    yüz kaçırmamak için aralık boyunca iki uçtan da korunur.
+    """
+    import numpy as np
+
+    pairs = []
+    if len(start) and len(end):
+        # Merkez uzaklığını kutu boyutuna oranlayarak açgözlü eşleştirme
+        start_centers = (start[:, :2] + start[:, 2:4]) / 2
+        end_centers = (end[:, :2] + end[:, 2:4]) / 2
+        sizes = np.maximum(start[:, 2:4] - start[:, :2], 1).max(axis=1)
+        distance = np.linalg.norm(start_centers[:, None, :] - end_centers[None, :, :], axis=2) / sizes[:, None]
+        used_start, used_end = set(), set()
+        for flat in np.argsort(distance, axis=None):
+            i, j = np.unravel_index(flat, distance.shape)
+            if distance[i, j] > 1.0:
+                break
+            if i in used_start or j in used_end:
+                continue
+            used_start.add(i)
+            used_end.add(j)
+            pairs.append((i, j))
+    matched_start = {i for i, _ in pairs}
+    matched_end = {j for _, j in pairs}
+    unmatched = [start[i] for i in range(len(start)) if i not in matched_start]
+    unmatched += [end[j] for j in range(len(end)) if j not in matched_end]
+
+    frames = []
+    for step in range(1, steps + 1):
+        t = step / (steps + 1)
+        boxes = [start[i] * (1 - t) + end[j] * t for i, j in pairs] + unmatched
+        if boxes:
+            dets = np.asarray(boxes, dtype=np.float32).reshape(-1, 5)
+            for k, (i, j) in enumerate(pairs):
+                dets[k, 4] = min(start[i, 4], end[j, 4])
+        else:
+            dets = np.empty((0, 5), dtype=np.float32)
+        frames.append(expand_boxes(dets, margin))
+    return frames
+
+
+class KeyframeDetector:
+    """Yalnızca her N karede bir veya sahne değişiminde algılama yapar
+
+    Aradaki kareler bir sonraki anahtar kareye kadar bekletilir ve kutuları
+    iki anahtar kare arasında ara değerlenir.
+    """
+
+    def __init__(self, detect, interval, scene_threshold=DEFAULT_SCENE_THRESHOLD, margin=DEFAULT_TRACK_MARGIN):
+        self.detect = detect
+        self.interval = interval
+        self.scene_threshold = scene_threshold
+        self.margin = margin
+        self.pending = []
+        self.key_dets = None
+        self.key_thumb = None
+
+    @staticmethod
+    def thumbnail(frame):
+        import cv2
+
+        small = cv2.resize(frame, (64, 36), interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_RGB2GRAY)
+        return small.astype("float32")
+
+    def is_scene_change(self, thumb):
+        if self.scene_threshold <= 0 or self.key_thumb is None:
+            return False
+        return float(abs(thumb - self.key_thumb).mean()) > self.scene_threshold
+
+    def feed(self, frame):
+        """Kareyi alır; kutuları kesinleşen (kare, algılama) çiftlerini döndürür"""
+        thumb = self.thumbnail(frame) if self.scene_threshold > 0 else None
+        if self.key_dets is not None and len(self.pending) + 1 < self.interval and not self.is_scene_change(thumb):
+            self.pending.append(frame)
+            return []
+        return self.keyframe(frame, thumb)
+
+    def flush(self):
+        """Akış sonunda bekleyen kareleri son kareyi anahtar kare yaparak boşaltır"""
+        if not self.pending:
+            return []
+        last = self.pending.pop()
+        return self.keyframe(last, None)
+
+    def keyframe(self, frame, thumb):
+        dets = self.detect(frame)
+        ready = []
+        if self.pending:
+            between = interpolate_boxes(self.key_dets, dets, len(self.pending), self.margin)
+            ready.extend(zip(self.pending, between))
+        ready.append((frame, dets))
+        self.pending = []
+        self.key_dets = dets
+        self.key_thumb = thumb if thumb is not None else (self.thumbnail(frame) if self.scene_threshold > 0 else None)
+        return ready
+
+
+def tile_origins(length, tile=TILE_SIZE, overlap=TILE_OVERLAP):
+    """Bir eksen boyunca örtüşen karoların başlangıç konumları"""
+    if length <= tile:
+        return [0]
+    return list(range(0, length - tile, tile - overlap)) + [length - tile]
+
+
+def merge_boxes(dets, overlap=0.5):
+    """Karo sınırlarında birden çok kez bulunan yüzleri tekilleştirir
+
+    Kesişimin küçük kutunun alanına oranı eşiği aşarsa düşük skorlu kutu
+    atılır; böylece dikiş yerinde yarım kalan yüz, tam kutunun içinde kaybolur.
+    """
+    import numpy as np
+
+    if len(dets) < 2:
+        return dets
+    dets = dets[np.argsort(-dets[:, 4])]
+    areas = (dets[:, 2] - dets[:, 0]) * (dets[:, 3] - dets[:, 1])
+    keep = []
+    for i, box in enumerate(dets):
+        if keep:
+            kept = dets[keep]
+            width = np.minimum(box[2], kept[:, 2]) - np.maximum(box[0], kept[:, 0])
+            height = np.minimum(box[3], kept[:, 3]) - np.maximum(box[1], kept[:, 1])
+            smaller = np.maximum(np.minimum(areas[i], areas[keep]), 1e-6)
+            ratio = np.clip(width, 0, None) * np.clip(height, 0, None) / smaller
+            if (ratio > overlap).any():
+                continue
+        keep.append(i)
+    return dets[keep]
+
+
+class RegionOfInterest:
+    """Algılamanın sınırlandığı sabit bölge
+
+    Dikdörtgenler kare boyutuna oranla verilir; maske görüntüsünde siyah
+    olmayan pikseller bölgeye dahildir. Algılama yalnızca bölgelerin
+    sınırlayıcı kutularında yapılır ve merkezi bölge dışında kalan yüzler atılır.
+    """
+
+    def __init__(self, shape, rects=(), mask_path=""):
+        import numpy as np
+
+        height, width = shape[:2]
+        self.mask = np.zeros((height, width), dtype=bool)
+        self.boxes = []
+        for x, y, w, h in rects:
+            x1, y1 = max(0, int(x * width)), max(0, int(y * height))
+            x2, y2 = min(width, int(round((x + w) * width))), min(height, int(round((y + h) * height)))
+            if x2 > x1 and y2 > y1:
+                self.mask[y1:y2, x1:x2] = True
+                self.boxes.append((x1, y1, x2, y2))
+        if mask_path:
+            import cv2
+            import imageio.v2 as iio
+
+            mask = iio.imread(mask_path)
+            if mask.ndim == 3:
+                mask = mask[..., :3].max(axis=2)
+            mask = cv2.resize((mask > 0).astype(np.uint8), (width, height), interpolation=cv2.INTER_NEAREST) > 0
+            ys, xs = np.nonzero(mask)
+            if len(xs):
+                self.boxes.append((int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1))
+            self.mask |= mask
+
+    def overlaps(self, x1, y1, x2, y2):
+        return any(x1 < bx2 and bx1 < x2 and y1 < by2 and by1 < y2 for bx1, by1, bx2, by2 in self.boxes)
+
+    def filter(self, dets):
+        """Merkezi bölge içinde kalan algılamaları döndürür"""
+        import numpy as np
+
+        if len(dets) == 0:
+            return dets
+        height, width = self.mask.shape
+        cx = np.clip(((dets[:, 0] + dets[:, 2]) / 2).astype(int), 0, width - 1)
+        cy = np.clip(((dets[:, 1] + dets[:, 3]) / 2).astype(int), 0, height - 1)
+        return dets[self.mask[cy, cx]]
+
+
+@functools.lru_cache(maxsize=8)
+def _region_of_interest(height, width, rects, mask_path, key):
+    return RegionOfInterest((height, width), rects, mask_path)
+
+
+def region_of_interest(options, shape):
+    """Seçeneklerdeki ilgi bölgesini kare boyutu için döndürür; bölge yoksa None"""
+    if not options.roi and not options.roi_mask:
+        return None
+    rects = tuple(tuple(rect) for rect in options.roi)
+    return _region_of_interest(shape[0], shape[1], rects, options.roi_mask, options.roi_key())
+
+
+def fill_block_means(region, block_height, block_width):
+    """Bölgeyi bloklara ayırır ve her bloğu kendi ortalama rengiyle yerinde doldurur
+
+    Bölge yüksekliği ve genişliği blok boyutunun katı olmalıdır. Tam sayı
+    oranlı INTER_AREA küçültme blok ortalamasının kendisidir; en yakın komşu
+    büyütmesi sonucu doğrudan bölgenin üzerine yazar.
+    """
+    import cv2
+
+    height, width = region.shape[:2]
+    means = cv2.resize(region, (width // block_width, height // block_height), interpolation=cv2.INTER_AREA)
+    cv2.resize(means, (width, height), dst=region, interpolation=cv2.INTER_NEAREST)
+
+
+class FrameRenderer:
+    """blur, mosaic ve solid yöntemlerini kare tamponu üzerinde yerinde uygulayan çizim aşaması
+
+    Kutular deface ile aynı kuralla tek bir vektör işleminde ölçeklenip
+    kırpılır. Bulanıklık yeniden kullanılan bir ara tampona hesaplanır, elips
+    maskeleri boyuta göre saklanır ve mozaik her blok için ortalama renkle
+    doldurulur. Ara tampon paylaşılmadığından örnekler iş parçacığına özeldir.
+    """
+
+    ELLIPSE_CACHE_SIZE = 256
+
+    def __init__(self, method="blur", mask_scale=DEFAULT_MASK_SCALE, ellipse=True, mosaic_size=20):
+        self.method = method
+        self.mask_scale = mask_scale
+        self.ellipse = ellipse
+        self.mosaic_size = max(1, int(mosaic_size))
+        self.scratch = None
+        self.ellipses = {}
+
+    @classmethod
+    def from_options(cls, options):
+        return cls(options.method, options.mask_scale, options.ellipse, options.mosaic_size)
+
+    def boxes(self, dets, shape):
+        """Algılamaları ölçeklenmiş, kırpılmış (x1, y1, x2, y2) tamsayı kutularına çevirir"""
+        import numpy as np
+
+        if len(dets) == 0:
+            return np.empty((0, 4), dtype=np.int64)
+        boxes = dets[:, :4].astype(np.int64).astype(np.float64)
+        grow = (boxes[:, 2:] - boxes[:, :2]) * (self.mask_scale - 1.0)
+        boxes[:, :2] -= grow
+        boxes[:, 2:] += grow
+        boxes = np.round(boxes).astype(np.int64)
+        np.maximum(boxes[:, :2], 0, out=boxes[:, :2])
+        np.minimum(boxes[:, 2], shape[1] - 1, out=boxes[:, 2])
+        np.minimum(boxes[:, 3], shape[0] - 1, out=boxes[:, 3])
+        return boxes[(boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])]
+
+    def render(self, frame, dets):
+        """Yüzleri karenin kendisi üzerinde anonimleştirir ve kareyi döndürür"""
+        draw = {"blur": self.blur, "mosaic": self.mosaic, "solid": self.solid}.get(self.method)
+        if draw is None:
+            return frame
+        for x1, y1, x2, y2 in self.boxes(dets, frame.shape).tolist():
+            draw(frame, x1, y1, x2, y2)
+        return frame
+
+    def solid(self, frame, x1, y1, x2, y2):
+        frame[y1:y2 + 1, x1:x2 + 1] = 0
+
+    def blur(self, frame, x1, y1, x2, y2):
+        import numpy as np
+        import cv2
+
+        region = frame[y1:y2, x1:x2]
+        height, width = region.shape[:2]
+        blurred = self.buffer(region)
+        cv2.blur(region, (max(1, width // 2), max(1, height // 2)), dst=blurred)
+        if self.ellipse:
+            np.copyto(region, blurred, where=self.ellipse_mask(height, width, region.ndim))
+        else:
+            region[...] = blurred
+
+    def mosaic(self, frame, x1, y1, x2, y2):
+        region = frame[y1:y2 + 1, x1:x2 + 1]
+        height, width = region.shape[:2]
+        size = self.mosaic_size
+        # Tam bloklar ve kenarda kalan kısmi bloklar ayrı bantlarda ortalanır
+        rows = (0, height - height % size, height)
+        columns = (0, width - width % size, width)
+        for top, bottom in zip(rows, rows[1:]):
+            for left, right in zip(columns, columns[1:]):
+                if bottom > top and right > left:
+                    fill_block_means(region[top:bottom, left:right], min(size, bottom - top), min(size, right - left))
+
+    def buffer(self, region):
+        """Bölge boyutunda ara tampon görünümü; tampon yalnızca büyümesi gerekince ayrılır"""
+        import numpy as np
+
+        shape = region.shape
+        scratch = self.scratch
+        if (scratch is None or scratch.dtype != region.dtype or scratch.shape[2:] != shape[2:]
+                or scratch.shape[0] < shape[0] or scratch.shape[1] < shape[1]):
+            if scratch is not None and scratch.dtype == region.dtype and scratch.shape[2:] == shape[2:]:
+                shape = (max(shape[0], scratch.shape[0]), max(shape[1], scratch.shape[1])) + shape[2:]
+            scratch = self.scratch = np.empty(shape, dtype=region.dtype)
+        return scratch[:region.shape[0], :region.shape[1]]
+
+    def ellipse_mask(self, height, width, ndim):
+        """Kutunun iç elipsi; deface'in skimage.draw.ellipse seçimiyle aynı pikseller"""
+        mask = self.ellipses.get((height, width, ndim))
+        if mask is None:
+            import numpy as np
+
+            if len(self.ellipses) >= self.ELLIPSE_CACHE_SIZE:
+                self.ellipses.clear()
+            cy, cx = height // 2, width // 2
+            rows, columns = np.ogrid[:height, :width]
+            mask = ((rows - cy) / max(cy, 1)) ** 2 + ((columns - cx) / max(cx, 1)) ** 2 < 1
+            mask = mask.reshape(mask.shape + (1,) * (ndim - 2))
+            self.ellipses[(height, width, ndim)] = mask
+        return mask
+
+
+def downscale(image, factor, band=1024):
+    """Görüntüyü bant bant küçültür; bellek eşlemeli giriş bir kerede okunmaz"""
+    import numpy as np
+    import cv2
+
+    height, width = image.shape[:2]
+    out_width, out_height = max(1, round(width * factor)), max(1, round(height * factor))
+    result = np.empty((out_height, out_width) + image.shape[2:], dtype=image.dtype)
+    for top in range(0, out_height, band):
+        bottom = min(out_height, top + band)
+        source = image[int(top / factor):min(height, int(np.ceil(bottom / factor)))]
+        result[top:bottom] = cv2.resize(
+            np.ascontiguousarray(source), (out_width, bottom - top), interpolation=cv2.INTER_AREA
+        ).reshape(result[top:bottom].shape)
+    return result
+
+
+def image_size(path):
+    """Görüntüyü çözmeden (genişlik, yükseklik) döndürür"""
+    if os.path.splitext(path)[1].lower() in (".tif", ".tiff"):
+        try:
+            import tifffile
+
+            with tifffile.TiffFile(path) as tif:
+                shape = tif.series[0].shape
+            return shape[1], shape[0]
+        except (ImportError, Exception):
+            pass
+    from PIL import Image
+
+    # Boyut okumak için Pillow'un büyük görüntü korumasını geçici olarak kaldır
+    limit = Image.MAX_IMAGE_PIXELS
+    Image.MAX_IMAGE_PIXELS = None
+    try:
+        with Image.open(path) as image:
+            return image.size
+    finally:
+        Image.MAX_IMAGE_PIXELS = limit
+
+
+def is_tiff(path):
+    return os.path.splitext(path)[1].lower() in (".tif", ".tiff")
+
+
+def open_large_image(path):
+    """8 bit RGB, sıkıştırılmamış TIFF'i bellek eşlemeyle, diğerlerini OpenCV ile açar"""
+    if is_tiff(path):
+        try:
+            import tifffile
+
+            image = tifffile.memmap(path, mode="r")
+            if image.ndim == 3 and image.shape[2] == 3 and image.dtype.name == "uint8":
+                return image
+        except (ImportError, ValueError):
+            pass
+    import cv2
+
+    image = cv2.imread(path, cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError(f"Cannot read image: {path}")
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+
+
+def copy_to_tiff(image, path):
+    """Girişi bant bant yeni bir TIFF bellek eşlemine kopyalar ve onu döndürür"""
+    import tifffile
+
+    output = tifffile.memmap(path, shape=image.shape, dtype=image.dtype, photometric="rgb")
+    for top in range(0, image.shape[0], TILE_SIZE):
+        output[top:top + TILE_SIZE] = image[top:top + TILE_SIZE]
+    return output
+
+
+def write_large_image(image, path):
+    """Bellekteki RGB görüntüyü yazar; BGR dönüşümü yerinde yapılır"""
+    import cv2
+
+    if is_tiff(path):
+        try:
+            import tifffile
+
+            tifffile.imwrite(path, image, photometric="rgb")
+            return
+        except ImportError:
+            pass
+    cv2.cvtColor(image, cv2.COLOR_RGB2BGR, dst=image)
+    if not cv2.imwrite(path, image):
+        raise ValueError(f"Cannot write image: {path}")
+
+
+class JobCancelled(Exception):
+    """İş kullanıcı tarafından iptal edildi"""
+
+
+class JobControl:
+    """Çalışan ve bekleyen işleri iptal etmek, duraklatmak için bayraklar
+
+    Bayraklar iş parçacığı olayları veya süreçler arası paylaşım için
+    Manager nesneleri olabilir. İşleme döngüleri checkpoint() çağırır:
+    duraklatılmışsa sürdürülene kadar bekler, iptal edilmişse JobCancelled
+    atar. Bekleyen iş hiçbir işlemci zamanı harcamaz; ffmpeg süreçleri de
+    borular dolunca kendiliğinden bekler.
+    """
+
+    def __init__(self, cancelled=None, running=None, cancelled_jobs=None):
+        self.cancelled = cancelled if cancelled is not None else threading.Event()
+        if running is None:
+            running = threading.Event()
+            running.set()
+        self.running = running
+        self.cancelled_jobs = cancelled_jobs if cancelled_jobs is not None else {}
+        self.job_id = None
+        # Alt işlere bölünen bir işte üst işin iptali de geçerlidir
+        self.parent_jobs = {}
+        self.scope = None
+        self.last_check = 0.0
+
+    def job(self, job_id):
+        """Aynı bayrakları paylaşan, tek bir işe bağlı kopya döndürür"""
+        import copy
+
+        bound = copy.copy(self)
+        bound.job_id = job_id
+        bound.last_check = 0.0
+        return bound
+
+    def scoped(self, job_id):
+        """Bir işin alt işleri (ör. video parçaları) için ayrı kimlik alanlı kopya"""
+        control = JobControl(self.cancelled, self.running)
+        control.parent_jobs = self.cancelled_jobs
+        control.scope = job_id
+        return control
+
+    def cancel(self, job_id=None):
+        """Tüm işleri veya yalnızca verilen işi iptal eder"""
+        if job_id is None:
+            self.cancelled.set()
+            # Duraklatılmış işler de uyanıp iptali görsün
+            self.running.set()
+        else:
+            self.cancelled_jobs[job_id] = True
+
+    def pause(self):
+        self.running.clear()
+
+    def resume(self):
+        self.running.set()
+
+    @property
+    def paused(self):
+        return not self.running.is_set()
+
+    def is_cancelled(self, job_id=None):
+        job_id = self.job_id if job_id is None else job_id
+        return (self.cancelled.is_set() or (self.scope is not None and self.scope in self.parent_jobs)
+                or (job_id is not None and job_id in self.cancelled_jobs))
+
+    def checkpoint(self):
+        now = time.monotonic()
+        if now - self.last_check < CONTROL_CHECK_INTERVAL:
+            return
+        while not self.running.wait(CONTROL_CHECK_INTERVAL * 5):
+            # Duraklatılmışken tek bir işin iptali de fark edilsin
+            if self.is_cancelled():
+                break
+        self.last_check = time.monotonic()
+        if self.is_cancelled():
+            raise JobCancelled()
+
+
+def discard_output(path):
+    """İptal edilen işin yarım kalmış çıkışını siler"""
+    with contextlib.suppress(OSError):
+        os.remove(path)
+
+
+class ProgressReporter:
+    """İşlenen kareleri sayar ve belirli aralıklarla ilerleme olayı üretir"""
+
+    def __init__(self, callback, total=None, interval=0.5):
+        self.callback = callback
+        self.total = total
+        self.interval = interval
+        self.frames = 0
+        self.start = self.last_time = time.perf_counter()
+        self.last_frames = 0
+
+    def update(self, frames=1):
+        self.frames += frames
+        now = time.perf_counter()
+        if now - self.last_time >= self.interval:
+            self.emit(now)
+
+    def finish(self):
+        if self.total is None or self.frames > self.total:
+            self.total = self.frames
+        self.emit(time.perf_counter())
+
+    def emit(self, now):
+        if self.callback is None:
+            return
+        # Anlık hız son aralıktan, ETA ise ortalama hızdan hesaplanır
+        window = now - self.last_time
+        fps = (self.frames - self.last_frames) / window if window > 0 else 0.0
+        elapsed = now - self.start
+        avg_fps = self.frames / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.total and avg_fps > 0:
+            eta = max(0.0, (self.total - self.frames) / avg_fps)
+        self.last_time = now
+        self.last_frames = self.frames
+        self.callback({
+            "type": "progress",
+            "frames": self.frames,
+            "total": self.total,
+            "fps": fps,
+            "avg_fps": avg_fps,
+            "elapsed": elapsed,
+            "eta": eta,
+        })
+
+
+class JobMetrics:
+    """Bir işin aşama başına süreleri ve sayaçları
+
+    Çözme ve kodlama ayrı iş parçacıklarında ölçüldüğünden kayıtlar kilitle
+    korunur.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+        self.profile_path = None
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name, seconds, calls=1):
+        with self._lock:
+            total, count = self.stages.get(name, (0.0, 0))
+            self.stages[name] = (total + seconds, count + calls)
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def count_bytes(self, input_path, output_path):
+        for name, path in (("bytes_read", input_path), ("bytes_written", output_path)):
+            if os.path.isfile(path):
+                self.count(name, os.path.getsize(path))
+
+    def merge(self, data):
+        """Başka bir işin to_dict() çıktısını bu kayda ekler"""
+        for name, stage in data.get("stages", {}).items():
+            self.add_time(name, stage["seconds"], stage["calls"])
+        for name, value in data.get("counters", {}).items():
+            self.count(name, value)
+
+    def to_dict(self):
+        with self._lock:
+            stages = {
+                name: {
+                    "seconds": total,
+                    "calls": count,
+                    "mean_ms": total / count * 1000 if count else 0.0,
+                }
+                for name, (total, count) in self.stages.items()
+            }
+            data = {"stages": stages, "counters": dict(self.counters)}
+            if self.profile_path:
+                data["profile"] = self.profile_path
+            return data
+
+
+def profile_path(input_path):
+    """Girişe ve zamana göre adlandırılmış bir profil dosyası yolu döndürür"""
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    name = os.path.splitext(os.path.basename(input_path))[0]
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return os.path.join(PROFILE_DIR, f"{name}-{stamp}-{os.getpid()}.prof")
+
+
+def prometheus_text(records):
+    """İş kayıtlarını Prometheus metin biçimine dönüştürür
+
+    Kayıtlar status, seconds ve metrics anahtarlarını taşıyan sözlüklerdir;
+    değerler tüm işler üzerinden toplanır.
+    """
+    jobs = {}
+    job_seconds = 0.0
+    stages = {}
+    counters = {}
+    for record in records:
+        status = record.get("status", "done")
+        jobs[status] = jobs.get(status, 0) + 1
+        job_seconds += record.get("seconds") or 0.0
+        metrics = record.get("metrics") or {}
+        for name, stage in metrics.get("stages", {}).items():
+            total, calls = stages.get(name, (0.0, 0))
+            stages[name] = (total + stage["seconds"], calls + stage["calls"])
+        for name, value in metrics.get("counters", {}).items():
+            counters[name] = counters.get(name, 0) + value
+
+    lines = [
+        "# HELP defacegui_jobs_total Finished jobs by status.",
+        "# TYPE defacegui_jobs_total counter",
+    ]
+    lines += [f'defacegui_jobs_total{{status="{status}"}} {count}' for status, count in sorted(jobs.items())]
+    lines += [
+        "# HELP defacegui_job_seconds_total Wall time spent in jobs.",
+        "# TYPE defacegui_job_seconds_total counter",
+        f"defacegui_job_seconds_total {job_seconds:.6f}",
+        "# HELP defacegui_stage_seconds_total Time spent per pipeline stage.",
+        "# TYPE defacegui_stage_seconds_total counter",
+    ]
+    lines += [f'defacegui_stage_seconds_total{{stage="{name}"}} {total:.6f}'
+              for name, (total, _) in sorted(stages.items())]
+    lines += [
+        "# HELP defacegui_stage_calls_total Calls per pipeline stage.",
+        "# TYPE defacegui_stage_calls_total counter",
+    ]
+    lines += [f'defacegui_stage_calls_total{{stage="{name}"}} {calls}'
+              for name, (_, calls) in sorted(stages.items())]
+    for name, value in sorted(counters.items()):
+        lines += [
+            f"# TYPE defacegui_{name}_total counter",
+            f"defacegui_{name}_total {value}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path, records):
+    """Metin dosyası toplayıcısı yarım dosya okumasın diye atomik yazar"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(prometheus_text(records))
+    os.replace(temp_path, path)
+
+
+def ffmpeg_exe():
+    import imageio_ffmpeg
+
+    return imageio_ffmpeg.get_ffmpeg_exe()
+
+
+def run_ffmpeg(args):
+    """ffmpeg'i verilen argümanlarla çalıştırır, hata olursa son çıktı satırlarıyla bildirir"""
+    result = subprocess.run(
+        [ffmpeg_exe(), "-hide_banner", "-nostdin", "-y"] + args,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True
+    )
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.strip().splitlines()[-5:])
+        raise RuntimeError(f"ffmpeg failed ({result.returncode}): {tail}")
+    return result
+
+
+def keyframe_times(path):
+    """Videonun anahtar karelerinin zamanlarını (saniye) döndürür; yalnızca anahtar kareler çözülür"""
+    result = run_ffmpeg([
+        "-skip_frame", "nokey", "-i", path, "-map", "0:v:0",
+        "-vf", "showinfo", "-f", "null", "-"
+    ])
+    return sorted(float(t) for t in re.findall(r"pts_time:\s*([0-9.]+)", result.stderr))
+
+
+def video_meta(path):
+    """ffmpeg'in bildirdiği codec, piksel biçimi, boyut ve süre bilgilerini döndürür"""
+    import imageio_ffmpeg
+
+    reader = imageio_ffmpeg.read_frames(path)
+    try:
+        return next(reader)
+    finally:
+        reader.close()
+
+
+def stream_signature(path):
+    """Akış kopyasıyla birleştirilecek H.264 parçalarında aynı olması gereken özellikler
+
+    Profil, seviye ve yeniden sıralama derinliği (B-kareler) ilk SPS'ten,
+    piksel biçimi, boyut ve zaman tabanı ffmpeg'in akış satırından okunur.
+    Yalnızca ilk paket kopyalanır; video çözülmez.
+    """
+    result = run_ffmpeg(["-i", path, "-map", "0:v:0", "-c", "copy", "-frames:v", "1",
+                         "-bsf:v", "trace_headers", "-f", "null", "-"])
+    signature = {"profile_idc": None, "level_idc": None, "max_num_reorder_frames": None}
+    for name, value in re.findall(r"\b(profile_idc|level_idc|max_num_reorder_frames)\s+[01]+ = (\d+)",
+                                  result.stderr):
+        if signature[name] is None:
+            signature[name] = int(value)
+    stream = re.search(r"Stream #0:\d+.*?: Video: (.*)", result.stderr)
+    line = stream.group(1) if stream else ""
+    pix_fmt = re.search(r"^[^,]*(?:\([^)]*\))*, (\w+)", line)
+    size = re.search(r", (\d+x\d+)", line)
+    tbn = re.search(r"([\d.]+k?) tbn", line)
+    signature.update(pix_fmt=pix_fmt and pix_fmt.group(1), size=size and size.group(1),
+                     tbn=tbn and tbn.group(1))
+    return signature
+
+
+def has_audio(path):
+    return bool(video_meta(path).get("audio_codec"))
+
+
+def get_file_type(path):
+    """Dosyanın video mu resim mi olduğunu MIME türünden belirler"""
+    if not os.path.isfile(path):
+        return "notfound"
+    mime = mimetypes.guess_type(path)[0]
+    if mime is None:
+        return None
+    if mime.startswith("video"):
+        return "video"
+    if mime.startswith("image"):
+        return "image"
+    return mime
+
+
+class AnonymizationEngine:
+    """CenterFace modelini bellekte tutarak işleri sırayla çalıştırır"""
+
+    def __init__(self, backend="auto"):
+        from deface.centerface import CenterFace
+
+        self.backend = backend
+        self.centerface = CenterFace(in_shape=None, backend=backend)
+        self.local = threading.local()
+        self.threads = 0
+
+    def set_threads(self, threads):
+        """ONNX Runtime oturumunu verilen iş içi iş parçacığı sayısıyla yeniden kurar
+
+        deface oturum seçeneklerini dışarı açmadığından model yeniden yüklenir;
+        OpenCV arka ucu limit_threads ile sınırlanır.
+        """
+        if threads == self.threads:
+            return
+        self.threads = threads
+        if self.centerface.backend != "onnxrt":
+            return
+        import onnx
+        import onnxruntime
+        from deface.centerface import default_onnx_path
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = threads
+        session_options.inter_op_num_threads = 1
+        model = self.centerface.dynamicize_shapes(onnx.load(default_onnx_path))
+        self.centerface.sess = onnxruntime.InferenceSession(
+            model.SerializeToString(), sess_options=session_options,
+            providers=self.centerface.sess.get_providers()
+        )
+
+    def detect(self, frame, options):
+        """Yüzleri algılar; gerekirse küçültülmüş kopyada arayıp kutuları ölçekler"""
+        roi = region_of_interest(options, frame.shape)
+        if roi is not None:
+            return self.detect_roi(frame, options, roi)
+        scale = detection_scale(frame.shape, options.detection_size)
+        if scale >= 1.0:
+            dets, _ = self.centerface(frame, threshold=options.threshold)
+            return dets
+        import cv2
+
+        small = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        dets, _ = self.centerface(small, threshold=options.threshold)
+        dets[:, :4] /= scale
+        return dets
+
+    def detect_roi(self, frame, options, roi):
+        """Yalnızca ilgi bölgelerinin kutularında algılar"""
+        import numpy as np
+        from dataclasses import replace
+
+        inner = replace(options, roi=[], roi_mask="")
+        found = []
+        for x1, y1, x2, y2 in roi.boxes:
+            # Model girişinden küçük parçalarda yüz aranmaz
+            if x2 - x1 < 16 or y2 - y1 < 16:
+                continue
+            dets = self.detect(np.ascontiguousarray(frame[y1:y2, x1:x2]), inner)
+            dets[:, [0, 2]] += x1
+            dets[:, [1, 3]] += y1
+            found.append(dets)
+        if not found:
+            return np.empty((0, 5), np.float32)
+        return roi.filter(merge_boxes(np.concatenate(found)))
+
+    def detect_batch(self, frames, options):
+        """Aynı model giriş boyutuna düşen kareleri tek ileri geçişte algılar
+
+        CenterFace her kareyi 32'nin katı bir boyuta yeniden boyutlandırdığından
+        bu boyutu paylaşan kareler tek tek algılanmış gibi aynı sonucu verir.
+        """
+        import numpy as np
+        import cv2
+        from deface.centerface import ensure_rgb
+
+        if len(frames) == 1 or options.roi or options.roi_mask:
+            return [self.detect(frame, options) for frame in frames]
+        centerface = self.centerface
+        frames = [ensure_rgb(frame) for frame in frames]
+        transforms = [centerface.shape_transform(frame.shape[1::-1], frame.shape[:2]) for frame in frames]
+        width, height = transforms[0][:2]
+        blob = cv2.dnn.blobFromImages(
+            frames, scalefactor=1.0, size=(width, height), mean=(0, 0, 0), swapRB=False, crop=False
+        )
+        if centerface.backend == "opencv":
+            centerface.net.setInput(blob)
+            heatmap, scale, offset, lms = centerface.net.forward(centerface.onnx_output_names)
+        else:
+            heatmap, scale, offset, lms = centerface.sess.run(
+                centerface.onnx_output_names, {centerface.onnx_input_name: blob})
+        results = []
+        for i, (_, _, scale_w, scale_h) in enumerate(transforms):
+            dets, _ = centerface.decode(
+                heatmap[i:i + 1], scale[i:i + 1], offset[i:i + 1], lms[i:i + 1],
+                (height, width), threshold=options.threshold
+            )
+            if len(dets) > 0:
+                dets[:, 0:4:2] /= scale_w
+                dets[:, 1:4:2] /= scale_h
+            else:
+                dets = np.empty((0, 5), dtype=np.float32)
+            results.append(dets)
+        return results
+
+    def iter_detections(self, frames, options, cached=(), metrics=None):
+        """Kareleri algılamalarıyla birlikte sırayla üretir
+
+        Önbellekte kaydı olan kareler için algılama yapılmaz; hızlı video
+        modunda yalnızca anahtar karelerde algılama yapılır.
+        """
+        metrics = metrics or JobMetrics()
+
+        def detect(frame):
+            with metrics.stage("detect"):
+                return self.detect(frame, options)
+
+        detector = None
+        if options.detect_interval > 1:
+            detector = KeyframeDetector(
+                detect, options.detect_interval,
+                options.scene_threshold, options.track_margin
+            )
+        for index, frame in enumerate(frames):
+            if index < len(cached):
+                yield frame, cached[index]
+            elif detector is None:
+                yield frame, detect(frame)
+            else:
+                yield from detector.feed(frame)
+        if detector is not None:
+            yield from detector.flush()
+
+    def renderer(self, options):
+        """Seçeneklere uygun, çağıran iş parçacığına özel çizim aşamasını döndürür"""
+        renderers = getattr(self.local, "renderers", None)
+        if renderers is None:
+            renderers = self.local.renderers = {}
+        key = (options.method, options.mask_scale, options.ellipse, options.mosaic_size)
+        renderer = renderers.get(key)
+        if renderer is None:
+            # Önizleme her ölçekte farklı mozaik boyutu ister; eski örnekler birikmesin
+            if len(renderers) >= 8:
+                renderers.clear()
+            renderer = renderers[key] = FrameRenderer.from_options(options)
+        return renderer
+
+    def anonymize(self, frame, dets, options):
+        return self.renderer(options).render(frame, dets)
+
+    def process(self, input_path, output_path, options, progress=None, control=None, total=None):
+        """Giriş dosyasını türüne göre işler ve çıkışa yazar
+
+        progress verilirse ilerleme olayları (kare, toplam, fps, ETA) sözlük
+        olarak bu fonksiyona gönderilir; videonun kare sayısı total ile
+        verilmişse ilerleme için ayrıca sayılmaz. Aşama süreleri ve sayaçlar
+        JobMetrics olarak döndürülür; options.profile açıksa çağıran iş
+        parçacığının cProfile dökümü PROFILE_DIR altına yazılır. control
+        (JobControl) iptal edilirse JobCancelled atılır ve yarım çıkış silinir.
+        """
+        metrics = JobMetrics()
+        control = control or JobControl()
+        file_type = get_file_type(input_path)
+        if file_type == "video":
+            handler = functools.partial(self.process_video, total=total)
+        elif file_type == "image":
+            handler = self.process_image
+        elif file_type == "notfound":
+            raise FileNotFoundError(input_path)
+        else:
+            raise ValueError(f"Unsupported file type: {input_path}")
+
+        if options.profile:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            try:
+                profiler.runcall(handler, input_path, output_path, options, progress, metrics, control)
+            finally:
+                metrics.profile_path = profile_path(input_path)
+                profiler.dump_stats(metrics.profile_path)
+        else:
+            handler(input_path, output_path, options, progress, metrics, control)
+        metrics.count_bytes(input_path, output_path)
+        return metrics
+
+    def open_cache(self, input_path, options, key=None):
+        """Giriş için önbellek, içerik özeti ve kayıtlı algılamaları döndürür"""
+        if not options.detection_cache:
+            return None, None, None
+        cache = DetectionCache(max_bytes=options.cache_max_bytes)
+        digest = file_digest(input_path)
+        return cache, digest, cache.load(digest, key or options.detection_key())
+
+    def process_image(self, input_path, output_path, options, progress=None, metrics=None, control=None):
+        import imageio.v2 as iio
+
+        metrics = metrics or JobMetrics()
+        control = control or JobControl()
+        control.checkpoint()
+        if options.tile_min_pixels > 0:
+            width, height = image_size(input_path)
+            if width * height >= options.tile_min_pixels:
+                self.process_tiled_image(input_path, output_path, options, progress, metrics, control)
+                return
+        reporter = ProgressReporter(progress, total=1)
+        cache, digest, cached = self.open_cache(input_path, options)
+        with metrics.stage("decode"):
+            frame = iio.imread(input_path)
+        if cached:
+            dets = cached[0]
+        else:
+            with metrics.stage("detect"):
+                dets = self.detect(frame, options)
+        with metrics.stage("draw"):
+            self.anonymize(frame, dets, options)
+        with metrics.stage("encode"):
+            iio.imwrite(output_path, frame)
+        metrics.count("frames")
+        metrics.count("faces", len(dets))
+        if cache is not None and not cached:
+            cache.store(digest, options.detection_key(), [dets])
+        reporter.update()
+        reporter.finish()
+
+    def process_images(self, jobs, options, on_event=None, control=None):
+        """Durağan görüntüleri toplu işler ve işleri sonuçlarıyla döndürür
+
+        Çözme bir iş parçacığı havuzunda önden yürür, aynı model giriş
+        boyutuna düşen görüntüler options.batch_size'lık gruplarla tek ileri
+        geçişte algılanır ve çıkışlar arka planda yazılır. Her iş için durum
+        ve bitiş olayları on_event'e gönderilir. İptal edilen görüntüler
+        algılamaya girmeden bırakılır.
+        """
+        import imageio.v2 as iio
+        import cv2
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        on_event = on_event or (lambda event: None)
+        control = control or JobControl()
+        event_lock = threading.Lock()
+        batch_size = max(1, options.batch_size)
+
+        def emit(event):
+            with event_lock:
+                on_event(event)
+
+        def finish(item, error=None):
+            job = item.job
+            if error is None:
+                job.metrics = item.metrics.to_dict()
+                job.status = "done"
+            elif isinstance(error, JobCancelled):
+                job.status = "cancelled"
+            else:
+                job.status = "failed"
+                job.error = str(error) or error.__class__.__name__
+            job.seconds = time.perf_counter() - item.start
+            emit({"type": "finished", "job": job.job_id, "status": job.status,
+                  "error": job.error, "seconds": job.seconds, "metrics": job.metrics})
+
+        def load(job):
+            item = _PendingImage(job, JobMetrics(), time.perf_counter())
+            emit({"type": "status", "job": job.job_id, "status": "running"})
+            try:
+                if options.tile_min_pixels > 0:
+                    width, height = image_size(job.input_path)
+                    if width * height >= options.tile_min_pixels:
+                        item.tiled = True
+                        return item
+                item.cache, item.digest, item.cached = self.open_cache(job.input_path, options)
+                with item.metrics.stage("decode"):
+                    item.frame = iio.imread(job.input_path)
+                item.detect_frame = item.frame
+                item.scale = detection_scale(item.frame.shape, options.detection_size)
+                if item.scale < 1.0:
+                    item.detect_frame = cv2.resize(item.frame, None, fx=item.scale, fy=item.scale,
+                                                   interpolation=cv2.INTER_AREA)
+            except Exception as e:
+                item.error = e
+            return item
+
+        def write(item, dets):
+            try:
+                with item.metrics.stage("encode"):
+                    iio.imwrite(item.job.output_path, item.frame)
+                item.metrics.count_bytes(item.job.input_path, item.job.output_path)
+                if item.cache is not None and not item.cached:
+                    item.cache.store(item.digest, options.detection_key(), [dets])
+                finish(item)
+            except Exception as e:
+                finish(item, e)
+
+        def complete(item, dets):
+            item.metrics.count("frames")
+            item.metrics.count("faces", len(dets))
+            with item.metrics.stage("draw"):
+                self.anonymize(item.frame, dets, options)
+            writes.append(writer.submit(write, item, dets))
+
+        def run_batch(items):
+            handed = 0
+            try:
+                start = time.perf_counter()
+                results = self.detect_batch([item.detect_frame for item in items], options)
+                # Toplu geçişin süresi görüntülere eşit paylaştırılır
+                share = (time.perf_counter() - start) / len(items)
+                for item, dets in zip(items, results):
+                    item.metrics.add_time("detect", share)
+                    item.metrics.count("batch_images", len(items))
+                    if item.scale < 1.0:
+                        dets[:, :4] /= item.scale
+                    complete(item, dets)
+                    handed += 1
+            except Exception as e:
+                # Hata yalnızca bu grubun henüz yazıcıya geçmemiş görüntülerini düşürür
+                for item in items[handed:]:
+                    finish(item, e)
+
+        threads = min(4, default_worker_count())
+        buckets = {}
+        writes = []
+        with ThreadPoolExecutor(threads) as reader, ThreadPoolExecutor(threads) as writer:
+            remaining = iter(jobs)
+            loading = deque(reader.submit(load, job) for job in
+                            (next(remaining, None) for _ in range(IMAGE_PREFETCH)) if job is not None)
+            while loading:
+                item = loading.popleft().result()
+                job = next(remaining, None)
+                if job is not None:
+                    loading.append(reader.submit(load, job))
+                try:
+                    control.job(item.job.job_id).checkpoint()
+                except JobCancelled as e:
+                    item.error = e
+                if item.error is not None:
+                    finish(item, item.error)
+                elif item.tiled:
+                    try:
+                        item.metrics = self.process(item.job.input_path, item.job.output_path, options,
+                                                    control=control.job(item.job.job_id))
+                        finish(item)
+                    except Exception as e:
+                        finish(item, e)
+                elif item.cached:
+                    complete(item, item.cached[0])
+                else:
+                    shape = item.detect_frame.shape
+                    key = self.centerface.shape_transform(shape[1::-1], shape[:2])[:2]
+                    bucket = buckets.setdefault(key, [])
+                    bucket.append(item)
+                    if len(bucket) >= batch_size:
+                        run_batch(buckets.pop(key))
+                    elif sum(len(b) for b in buckets.values()) > batch_size * 4:
+                        # Çok farklı boyut varsa en kalabalık grup beklemeden işlenir
+                        run_batch(buckets.pop(max(buckets, key=lambda k: len(buckets[k]))))
+            for key in list(buckets):
+                run_batch(buckets.pop(key))
+            for future in writes:
+                future.result()
+        return jobs
+
+    def detect_tiled(self, image, options, metrics, control=None):
+        """Görüntüyü örtüşen karolarda paralel arar ve kutuları birleştirir
+
+        Karolar tam çözünürlükte küçük yüzleri bulur. Örtüşmeden büyük yüzler
+        için görüntü her seviyede dörtte birine küçültülerek aynı karolama
+        tek karoya sığana kadar tekrarlanır.
+        """
+        import numpy as np
+        from dataclasses import replace
+        from concurrent.futures import ThreadPoolExecutor
+
+        tile_options = replace(options, detection_size=DETECTION_SIZE_NATIVE, roi=[], roi_mask="")
+        roi = region_of_interest(options, image.shape)
+        # onnxruntime oturumu iş parçacığı güvenlidir; OpenCV ağı değildir
+        threads = default_worker_count() if self.centerface.backend == "onnxrt" else 1
+
+        def detect(tile, x, y, scale):
+            with metrics.stage("detect"):
+                dets = self.detect(tile, tile_options)
+            dets[:, [0, 2]] += x
+            dets[:, [1, 3]] += y
+            dets[:, :4] /= scale
+            return dets
+
+        found = []
+        level, scale = image, 1.0
+        with ThreadPoolExecutor(threads) as pool:
+            while True:
+                height, width = level.shape[:2]
+                pending = []
+                for y in tile_origins(height):
+                    for x in tile_origins(width):
+                        if control is not None:
+                            control.checkpoint()
+                        if roi is not None and not roi.overlaps(
+                                x / scale, y / scale, (x + TILE_SIZE) / scale, (y + TILE_SIZE) / scale):
+                            continue
+                        tile = np.ascontiguousarray(level[y:y + TILE_SIZE, x:x + TILE_SIZE])
+                        metrics.count("tiles")
+                        pending.append(pool.submit(detect, tile, x, y, scale))
+                        # Bellekte bekleyen karo sayısı sınırlı kalsın
+                        while len(pending) >= threads * 2:
+                            found.append(pending.pop(0).result())
+                found.extend(future.result() for future in pending)
+                if max(height, width) <= TILE_SIZE:
+                    break
+                factor = TILE_OVERLAP / TILE_SIZE
+                with metrics.stage("downscale"):
+                    level = downscale(level, factor)
+                scale *= factor
+        if not found:
+            return np.empty((0, 5), np.float32)
+        dets = merge_boxes(np.concatenate(found))
+        return roi.filter(dets) if roi is not None else dets
+
+    def process_tiled_image(self, input_path, output_path, options, progress=None, metrics=None, control=None):
+        """Çok büyük görüntüleri karolarda algılar, yüz bölgelerini tek tek işler"""
+        import numpy as np
+
+        metrics = metrics or JobMetrics()
+        reporter = ProgressReporter(progress, total=1)
+        key = options.detection_key() + "_tiled"
+        cache, digest, cached = self.open_cache(input_path, options, key)
+        with metrics.stage("decode"):
+            image = open_large_image(input_path)
+        if cached:
+            dets = cached[0]
+        else:
+            dets = self.detect_tiled(image, options, metrics, control)
+        if isinstance(image, np.memmap) and is_tiff(output_path):
+            # Yüzler doğrudan çıkış dosyasının bellek eşlemine çizilir
+            with metrics.stage("encode"):
+                output = copy_to_tiff(image, output_path)
+            with metrics.stage("draw"):
+                self.anonymize(output, dets, options)
+            with metrics.stage("encode"):
+                output.flush()
+                del output
+        else:
+            image = np.array(image) if isinstance(image, np.memmap) else image
+            with metrics.stage("draw"):
+                self.anonymize(image, dets, options)
+            with metrics.stage("encode"):
+                write_large_image(image, output_path)
+        metrics.count("frames")
+        metrics.count("faces", len(dets))
+        if cache is not None and not cached:
+            cache.store(digest, key, [dets])
+        reporter.update()
+        reporter.finish()
+
+    def process_video(self, input_path, output_path, options, progress=None, metrics=None, control=None,
+                      total=None):
+        import imageio_ffmpeg
+
+        metrics = metrics or JobMetrics()
+        control = control or JobControl()
+        if options.time_ranges:
+            self.process_video_ranges(input_path, output_path, options, progress, metrics, control)
+            return
+        if not total:
+            try:
+                total = imageio_ffmpeg.count_frames_and_secs(input_path)[0]
+            except Exception:
+                total = None
+        reporter = ProgressReporter(progress, total=total)
+        cache, digest, cached = self.open_cache(input_path, options)
+        cached = cached or []
+        detections = []
+        try:
+            with VideoStream(input_path, output_path, options.keep_audio, metrics=metrics,
+                             ffmpeg_config=options.ffmpeg_config()) as stream:
+                for frame, dets in self.iter_detections(stream.frames(), options, cached, metrics):
+                    control.checkpoint()
+                    detections.append(dets)
+                    with metrics.stage("draw"):
+                        self.anonymize(frame, dets, options)
+                    stream.write(frame)
+                    metrics.count("frames")
+                    metrics.count("faces", len(dets))
+                    reporter.update()
+        except JobCancelled:
+            # ffmpeg süreçleri abort ile kapandı; yarım video bırakılmaz
+            discard_output(output_path)
+            raise
+        reporter.finish()
+        if cache is not None and len(detections) > len(cached):
+            cache.store(digest, options.detection_key(), detections)
+
+    def process_video_ranges(self, input_path, output_path, options, progress, metrics, control):
+        """Yalnızca zaman aralıklarına düşen parçaları bu süreçte işler, kalanını akış kopyasıyla geçirir"""
+        def on_event(event):
+            if event["type"] == "progress" and progress is not None:
+                progress(event)
+
+        ranged = SegmentedVideo(options, inline=True).run(
+            input_path, output_path, on_event, control.scoped(control.job_id))
+        data = ranged.to_dict()
+        # Bayt sayaçlarını process() ekler
+        data["counters"].pop("bytes_read", None)
+        data["counters"].pop("bytes_written", None)
+        metrics.merge(data)
+
+
+class _StreamAborted(BaseException):
+    """VideoStream iptalinde imageio ffmpeg üreteçlerine gönderilir"""
+
+
+class VideoStream:
+    """ffmpeg ile ham kare okuyan ve yazan, sınırlı kuyruklarla bağlı iş hattı
+
+    Çözme ve kodlama ayrı iş parçacıklarında çalışır: bir kare algılanırken
+    sonraki kare çözülür, önceki kare kodlanır. Kareler ffmpeg süreçlerine
+    borular üzerinden ham RGB olarak gider.
+    """
+
+    def __init__(self, input_path, output_path, keep_audio=True, queue_size=PIPELINE_QUEUE_SIZE,
+                 metrics=None, ffmpeg_config=None):
+        import imageio_ffmpeg
+
+        self.metrics = metrics or JobMetrics()
+        threads = thread_limit()
+        self.reader = imageio_ffmpeg.read_frames(
+            input_path, input_params=["-threads", str(threads)] if threads else None)
+        self.meta = next(self.reader)
+        self.width, self.height = self.meta["size"]
+
+        audio = {}
+        # Sesi yeniden kodlamadan kaynaktan kopyala
+        if keep_audio and self.meta.get("audio_codec"):
+            audio = {"audio_path": input_path, "audio_codec": "copy"}
+        # Boyut yalnızca yuv420p için çift sayıya tamamlanır; aksi halde imageio
+        # 16'nın katına büyütür ve kopyalanan parçalarla birleştirilemez
+        self.writer = imageio_ffmpeg.write_frames(
+            output_path, self.meta["size"], fps=self.meta["fps"], macro_block_size=2,
+            **(ffmpeg_config or DEFAULT_FFMPEG_CONFIG), **audio
+        )
+        self.writer.send(None)
+
+        self.decoded = queue.Queue(maxsize=queue_size)
+        self.encoded = queue.Queue(maxsize=queue_size)
+        self.stopped = threading.Event()
+        self.errors = []
+        self.decoder = threading.Thread(target=self._stage, args=(self._decode,), daemon=True)
+        self.encoder = threading.Thread(target=self._stage, args=(self._encode,), daemon=True)
+        self.decoder.start()
+        self.encoder.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.finish()
+        else:
+            self.abort()
+        return False
+
+    def _stage(self, target):
+        try:
+            target()
+        except Exception as e:
+            self.errors.append(e)
+            self.stopped.set()
+
+    def _put(self, target_queue, item):
+        # Karşı aşama durmuşsa sonsuza dek beklememek için zaman aşımıyla dene
+        while not self.stopped.is_set():
+            try:
+                target_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source_queue):
+        while True:
+            try:
+                return source_queue.get(timeout=0.1)
+            except queue.Empty:
+                if self.stopped.is_set():
+                    return None
+
+    def _decode(self):
+        import numpy as np
+
+        shape = (self.height, self.width, 3)
+        while True:
+            start = time.perf_counter()
+            data = next(self.reader, None)
+            if data is None:
+                break
+            frame = np.frombuffer(data, dtype=np.uint8).reshape(shape).copy()
+            self.metrics.add_time("decode", time.perf_counter() - start)
+            if not self._put(self.decoded, frame):
+                return
+        self._put(self.decoded, None)
+
+    def _encode(self):
+        while True:
+            frame = self._get(self.encoded)
+            if frame is None:
+                return
+            with self.metrics.stage("encode"):
+                self.writer.send(frame)
+
+    def raise_errors(self):
+        if self.errors:
+            raise self.errors[0]
+
+    def frames(self):
+        """Çözülmüş kareleri sırayla üretir"""
+        while True:
+            frame = self._get(self.decoded)
+            if frame is None:
+                self.raise_errors()
+                return
+            yield frame
+
+    def write(self, frame):
+        import numpy as np
+
+        if not self._put(self.encoded, np.ascontiguousarray(frame)):
+            self.raise_errors()
+
+    def finish(self):
+        """Kodlama kuyruğunu boşaltır ve ffmpeg süreçlerini kapatır"""
+        self._put(self.encoded, None)
+        self.encoder.join()
+        # Kalan kodlama ve ses birleştirme ffmpeg kapanırken tamamlanır
+        with self.metrics.stage("mux"):
+            self.writer.close()
+        self.stopped.set()
+        self.decoder.join()
+        self.reader.close()
+        self.raise_errors()
+
+    def abort(self):
+        """ffmpeg süreçlerini kodlamanın bitmesini beklemeden öldürür"""
+        self.stopped.set()
+        self.encoder.join()
+        self.decoder.join()
+        # close() ffmpeg'in çıkışı tamamlamasını bekler; başka bir BaseException
+        # imageio'nun süreci hemen öldürmesini sağlar
+        for generator in (self.writer, self.reader):
+            with contextlib.suppress(_StreamAborted, StopIteration, ValueError):
+                generator.throw(_StreamAborted())
+
+
+def read_frame_at(path, seconds):
+    """Videodan verilen zamandaki tek kareyi çözer; yalnızca o noktaya atlanır"""
+    import numpy as np
+    import imageio_ffmpeg
+
+    reader = imageio_ffmpeg.read_frames(path, input_params=["-ss", f"{seconds:.3f}"])
+    try:
+        meta = next(reader)
+        data = next(reader, None)
+    finally:
+        reader.close()
+    if data is None:
+        return None
+    width, height = meta["size"]
+    return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3).copy()
+
+
+class PreviewSampler:
+    """Ayar denemeleri için birkaç örnek kareyi çözer ve algılamalarını saklar
+
+    Kareler yalnızca bir kez çözülür. Algılama PREVIEW_DETECT_THRESHOLD
+    eşiğinde bir kez yapılır; CenterFace kutuları skor sırasıyla bastırdığı
+    için daha yüksek bir eşiğin sonucu bu kutuların süzülmesiyle aynıdır. Eşik,
+    yöntem veya mozaik boyu değişince yalnızca küçültülmüş kareler yeniden
+    çizilir.
+    """
+
+    def __init__(self, input_path, count=PREVIEW_FRAMES, start=0.0, window=0.0):
+        self.input_path = input_path
+        self.count = count
+        self.start = start
+        self.window = window
+        self.frames = []
+        self.times = []
+        self.thumbs = {}
+        self.detections = {}
+
+    def matches(self, input_path, count, start, window):
+        return (self.input_path, self.count, self.start, self.window) == (input_path, count, start, window)
+
+    def sample_times(self, duration):
+        """Seçilen aralığa eşit dağılmış örnek zamanlarını döndürür; window 0 videonun sonuna kadardır"""
+        start = min(max(self.start, 0.0), duration)
+        end = min(start + self.window, duration) if self.window > 0 else duration
+        step = (end - start) / self.count
+        return [start + (i + 0.5) * step for i in range(self.count)]
+
+    def load(self):
+        import imageio.v2 as iio
+        import imageio_ffmpeg
+
+        file_type = get_file_type(self.input_path)
+        if file_type == "image":
+            self.frames, self.times = [iio.imread(self.input_path)], [None]
+            return
+        if file_type == "notfound":
+            raise FileNotFoundError(self.input_path)
+        if file_type != "video":
+            raise ValueError(f"Unsupported file type: {self.input_path}")
+        reader = imageio_ffmpeg.read_frames(self.input_path)
+        try:
+            duration = next(reader).get("duration") or 0.0
+        finally:
+            reader.close()
+        for seconds in self.sample_times(duration):
+            frame = read_frame_at(self.input_path, seconds)
+            if frame is not None:
+                self.frames.append(frame)
+                self.times.append(seconds)
+        if not self.frames:
+            raise RuntimeError(f"No frames could be decoded: {self.input_path}")
+
+    def detect(self, engine, options):
+        """Örnek karelerin algılamalarını döndürür; algılama boyu veya ilgi bölgesi değişince yeniden algılar"""
+        from dataclasses import replace
+
+        floor = min(options.threshold, PREVIEW_DETECT_THRESHOLD)
+        key = (options.detection_size, options.roi_key())
+        cached = self.detections.get(key)
+        if cached is None or cached[0] > floor:
+            detect_options = replace(options, threshold=floor)
+            metrics = JobMetrics()
+            found = []
+            for frame in self.frames:
+                height, width = frame.shape[:2]
+                if 0 < options.tile_min_pixels <= width * height:
+                    found.append(engine.detect_tiled(frame, detect_options, metrics))
+                else:
+                    found.append(engine.detect(frame, detect_options))
+            cached = self.detections[key] = (floor, found)
+        return [dets[dets[:, 4] >= options.threshold] for dets in cached[1]]
+
+    def thumbnails(self, max_side):
+        """Çizim için küçültülmüş kareleri ve ölçeklerini döndürür"""
+        import cv2
+
+        if max_side not in self.thumbs:
+            thumbs = []
+            for frame in self.frames:
+                scale = min(1.0, max_side / max(frame.shape[:2]))
+                if scale < 1.0:
+                    frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+                thumbs.append((frame, scale))
+            self.thumbs[max_side] = thumbs
+        return self.thumbs[max_side]
+
+    def render(self, engine, options, max_side=PREVIEW_MAX_SIDE):
+        """Örnek karelerin anonimleştirilmiş küçük kopyalarını ve yüz sayılarını döndürür"""
+        from dataclasses import replace
+
+        if not self.frames:
+            self.load()
+        rendered = []
+        for (thumb, scale), dets in zip(self.thumbnails(max_side), self.detect(engine, options)):
+            dets = dets.copy()
+            dets[:, :4] *= scale
+            # Mozaik karesi küçültülmüş karede de aynı oranda görünsün
+            thumb_options = replace(options, mosaic_size=max(1, round(options.mosaic_size * scale)))
+            rendered.append((engine.anonymize(thumb.copy(), dets, thumb_options), len(dets)))
+        return rendered
+
+
+def parse_cpu_list(text):
+    """'0-3,6' biçimindeki çekirdek listesini sıralı tamsayı listesine çevirir"""
+    cpus = set()
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        try:
+            if "-" in part:
+                first, last = (int(value) for value in part.split("-", 1))
+            else:
+                first = last = int(part)
+        except ValueError:
+            raise ValueError(f"Invalid CPU list: {part!r}") from None
+        if first < 0 or last < first:
+            raise ValueError(f"Invalid CPU range: {part!r}")
+        cpus.update(range(first, last + 1))
+    return sorted(cpus)
+
+
+def format_cpu_list(cpus):
+    """parse_cpu_list'in tersi; ardışık çekirdekler aralık olarak yazılır"""
+    parts = []
+    for cpu in sorted(cpus):
+        if parts and parts[-1][1] == cpu - 1:
+            parts[-1][1] = cpu
+        else:
+            parts.append([cpu, cpu])
+    return ",".join(str(a) if a == b else f"{a}-{b}" for a, b in parts)
+
+
+@dataclass
+class ResourceGovernor:
+    """Eşzamanlı işler arasında işlemci kullanımını sınırlayan süreç ayarları
+
+    thread_budget tüm işçilerin toplam iş parçacığı sayısıdır (0: kullanılabilir
+    çekirdek sayısı) ve etkin işçilere eşit bölünür; her işçinin payı ONNX
+    Runtime iş içi iş parçacıklarına, OpenCV'ye ve ffmpeg'in kod çözücü ve
+    kodlayıcısına uygulanır. cpus boşsa tüm çekirdekler kullanılır; pin_workers
+    her işçiyi bu çekirdeklerin ayrı bir dilimine bağlar. nice ve ionice işçi
+    süreçlerine ve başlattıkları ffmpeg süreçlerine geçer.
+    """
+    thread_budget: int = 0
+    cpus: list = field(default_factory=list)
+    pin_workers: bool = False
+    nice: int = 0
+    # "": değiştirme, "low": best-effort sınıfının en düşük önceliği, "idle": yalnızca disk boştayken
+    ionice: str = ""
+
+    def to_dict(self):
+        from dataclasses import asdict
+
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Kaydedilmiş ayarları yükler; bilinmeyen alanlar yok sayılır"""
+        from dataclasses import fields
+
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    def available_cpus(self):
+        if self.cpus:
+            return list(self.cpus)
+        if hasattr(os, "sched_getaffinity"):
+            return sorted(os.sched_getaffinity(0))
+        return list(range(os.cpu_count() or 1))
+
+    def budget(self):
+        return self.thread_budget or len(self.available_cpus())
+
+    def threads_per_worker(self, workers):
+        return max(1, self.budget() // max(1, workers))
+
+    def worker_cpus(self, index, workers):
+        """İşçinin bağlanacağı çekirdekler; sınırlama yoksa boş liste"""
+        cpus = self.available_cpus() if self.cpus or self.pin_workers else []
+        if not self.pin_workers or not cpus:
+            return cpus
+        # Çekirdekler işçi sayısından azsa dilimler dönerek paylaşılır
+        size = max(1, len(cpus) // max(1, workers))
+        start = (index % max(1, workers)) * size % len(cpus)
+        return cpus[start:start + size]
+
+    def apply_process(self, cpus=None):
+        """nice, ionice ve çekirdek bağlamasını çağıran sürece uygular
+
+        Öncelik yalnızca düşürülür; yetkisiz kullanıcı onu geri yükseltemez.
+        """
+        if self.nice > 0 and hasattr(os, "setpriority"):
+            current = os.getpriority(os.PRIO_PROCESS, 0)
+            if self.nice > current:
+                os.setpriority(os.PRIO_PROCESS, 0, self.nice)
+        if self.ionice and shutil.which("ionice"):
+            args = ["-c", "3"] if self.ionice == "idle" else ["-c", "2", "-n", "7"]
+            subprocess.run(["ionice"] + args + ["-p", str(os.getpid())], capture_output=True)
+        cpus = self.available_cpus() if cpus is None and self.cpus else cpus
+        if cpus and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpus)
+
+    def apply_worker(self, index, workers):
+        """Havuzdaki bir işçi süreci için payını ve süreç ayarlarını uygular"""
+        set_governor(self)
+        self.apply_process(self.worker_cpus(index, workers))
+        limit_threads(self.threads_per_worker(workers))
+
+
+_governor = ResourceGovernor()
+_thread_limit = 0
+
+
+def set_governor(governor):
+    """Bu sürecin başlatacağı işçi havuzlarında kullanılacak kaynak ayarlarını belirler"""
+    global _governor
+    _governor = governor
+
+
+def current_governor():
+    return _governor
+
+
+def limit_threads(threads):
+    """Bu süreçteki hesaplama kütüphanelerinin iş parçacığı sayısını sınırlar; 0 sınırı kaldırır
+
+    Sonradan yüklenen BLAS/OpenMP kütüphaneleri ortam değişkenlerini okur;
+    ffmpeg argümanları thread_limit() ile, ONNX oturumu get_engine'de ayarlanır.
+    """
+    global _thread_limit
+    _thread_limit = max(0, threads)
+    for name in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        if _thread_limit:
+            os.environ[name] = str(_thread_limit)
+        else:
+            os.environ.pop(name, None)
+    try:
+        import cv2
+    except ImportError:
+        return
+    # OpenCV'de 0 iş parçacığını kapatır, negatif değer varsayılana döner
+    cv2.setNumThreads(_thread_limit or -1)
+
+
+def thread_limit():
+    """Süreç başına iş parçacığı payı; 0 ise kütüphaneler kendisi seçer"""
+    return _thread_limit
+
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(backend="auto"):
+    """Süreç başına tek bir motor örneği döndürür, gerekirse modeli yükler"""
+    with _engines_lock:
+        if backend not in _engines:
+            # CenterFace çalıştırıcı bilgisini stdout'a yazar; JSON çıktısını bozmasın
+            with contextlib.redirect_stdout(sys.stderr):
+                _engines[backend] = AnonymizationEngine(backend)
+        _engines[backend].set_threads(_thread_limit)
+        return _engines[backend]
+
+
+def engine_loaded(backend="auto"):
+    return backend in _engines
+
+
+def _ignore_sigint():
+    # Terminalde Ctrl+C tüm süreç grubuna gider; iptali yalnızca ana süreç yönetir
+    import signal
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _init_worker(backend, governor=None, workers=1, slots=None):
+    _ignore_sigint()
+    if governor is not None:
+        # Her işçi sırayla bir dilim alır; yeniden başlatılan işçi sıradakini alır
+        index = 0
+        if slots is not None:
+            with slots.get_lock():
+                index = slots.value
+                slots.value += 1
+        governor.apply_worker(index, workers)
+    # Model, havuzdaki her süreçte yalnızca bir kez yüklenir
+    get_engine(backend)
+
+
+def start_manager(context):
+    """Ctrl+C ile kapanmayan bir Manager süreci başlatır"""
+    from multiprocessing.managers import SyncManager
+
+    manager = SyncManager(ctx=context)
+    manager.start(_ignore_sigint)
+    return manager
+
+
+def shared_control(manager):
+    """İşçi süreçlerine gönderilebilen bir JobControl oluşturur"""
+    control = JobControl(manager.Event(), manager.Event(), manager.dict())
+    control.resume()
+    return control
+
+
+def _run_job(job, options, events, control=None):
+    events.put({"type": "status", "job": job.job_id, "status": "running"})
+    start = time.perf_counter()
+    control = control.job(job.job_id) if control is not None else None
+
+    def progress(event):
+        event["job"] = job.job_id
+        events.put(event)
+
+    try:
+        metrics = get_engine(options.backend).process(job.input_path, job.output_path, options, progress, control,
+                                                      job.total_frames or None)
+        job.metrics = metrics.to_dict()
+        job.status = "done"
+    except Exception as e:
+        # İptal sırasında kapanan ffmpeg borularının hataları da iptal sayılır
+        if isinstance(e, JobCancelled) or (control is not None and control.is_cancelled()):
+            job.status = "cancelled"
+        else:
+            job.status = "failed"
+            job.error = str(e) or e.__class__.__name__
+    job.seconds = time.perf_counter() - start
+    return job
+
+
+def _run_images(jobs, options, events, control=None):
+    # Görüntü grubu aynı süreçte toplu çıkarımla işlenir; olaylar işçiden gelir
+    return get_engine(options.backend).process_images(jobs, options, events.put, control)
+
+
+class BatchRunner:
+    """İşleri çok süreçli bir işçi havuzuna dağıtır ve durum olaylarını toplar"""
+
+    def __init__(self, options, workers=None, start_method="spawn"):
+        self.options = options
+        self.workers = workers or default_worker_count()
+        # Qt iş parçacıklarıyla fork güvenli olmadığından GUI spawn kullanır;
+        # Qt olmayan komut satırı modu daha hızlı başlayan fork'u seçebilir
+        self.start_method = start_method
+
+    def run(self, jobs, on_event=None, control=None):
+        """Tüm işleri çalıştırır; on_event her durum değişiminde bir sözlükle çağrılır
+
+        control (JobControl) çağıranın iş parçacığında tutulur; iptal ve
+        duraklatma isteklerini işçi süreçlerine bu yöntem iletir.
+        """
+        # Süreç havuzu modülleri yalnızca toplu işte yüklenir (GUI açılışını yavaşlatmasın)
+        import multiprocessing
+
+        on_event = on_event or (lambda event: None)
+        context = multiprocessing.get_context(self.start_method)
+        workers = min(self.workers, max(1, len(jobs)))
+        positions = {job.job_id: i for i, job in enumerate(jobs)}
+        start = time.perf_counter()
+        reported = set()
+
+        def handle(event):
+            # Bitiş olayı işçiden de havuzdan da gelebilir; her iş bir kez sayılır
+            if event["type"] != "finished":
+                on_event(event)
+                return
+            if event["job"] in reported:
+                return
+            reported.add(event["job"])
+            elapsed = time.perf_counter() - start
+            on_event(event)
+            on_event({"type": "throughput", "done": len(reported), "total": len(jobs),
+                      "files_per_sec": len(reported) / elapsed if elapsed > 0 else 0.0})
+
+        control = control or JobControl()
+        manifest = Manifest() if self.options.skip_unchanged else None
+        duplicates = {}
+        runnable = jobs
+        if manifest is not None:
+            runnable, duplicates = self.plan(jobs, manifest, handle, control)
+
+        def settle(job):
+            """Biten işi manifeste yazar ve onu bekleyen özdeş girişleri tamamlar"""
+            if manifest is None:
+                return
+            if job.status == "done":
+                manifest.record(job, self.options)
+            for duplicate in duplicates.pop(job.job_id, []):
+                if job.status == "done":
+                    self.reuse(manifest, job.output_path, duplicate, "duplicate", handle)
+                else:
+                    duplicate.status = job.status
+                    duplicate.error = job.error
+                    handle({"type": "finished", "job": duplicate.job_id, "status": duplicate.status,
+                            "error": duplicate.error, "seconds": 0.0, "metrics": {}})
+
+        try:
+            self.execute(runnable, workers, context, positions, jobs, handle, settle, control)
+        finally:
+            if manifest is not None:
+                manifest.close()
+        return jobs
+
+    def plan(self, jobs, manifest, handle, control):
+        """Değişmemiş işleri atlar, özdeş girişleri ilk örneklerine bağlar
+
+        Çalıştırılacak işleri ve ilk örneğin kimliğinden onu bekleyen
+        kopyalara giden sözlüğü döndürür.
+        """
+        runnable = []
+        duplicates = {}
+        first = {}
+        for job in jobs:
+            # Büyük toplu işlerde özet hesaplama da uzun sürebilir
+            if control.is_cancelled(job.job_id):
+                self.cancel(job, handle)
+                continue
+            try:
+                reason, source = manifest.lookup(job, self.options)
+            except OSError as e:
+                job.status = "failed"
+                job.error = str(e)
+                handle({"type": "finished", "job": job.job_id, "status": job.status,
+                        "error": job.error, "seconds": 0.0, "metrics": {}})
+                continue
+            if reason is not None:
+                self.reuse(manifest, source, job, reason, handle)
+            elif job.digest in first:
+                duplicates.setdefault(first[job.digest], []).append(job)
+            else:
+                first[job.digest] = job.job_id
+                release_output(job.output_path)
+                runnable.append(job)
+        return runnable, duplicates
+
+    def reuse(self, manifest, source, job, reason, handle):
+        start = time.perf_counter()
+        try:
+            if reason != "unchanged":
+                manifest.reuse(source, job, self.options)
+            job.status = "skipped"
+        except OSError as e:
+            job.status = "failed"
+            job.error = str(e)
+        job.seconds = time.perf_counter() - start
+        handle({"type": "finished", "job": job.job_id, "status": job.status, "error": job.error,
+                "seconds": job.seconds, "metrics": {}, "reason": reason, "source": source})
+
+    @staticmethod
+    def cancel(job, handle):
+        job.status = "cancelled"
+        handle({"type": "finished", "job": job.job_id, "status": job.status,
+                "error": "", "seconds": 0.0, "metrics": {}})
+
+    def execute(self, jobs, workers, context, positions, results, handle, settle, control):
+        """İşleri havuzda çalıştırır; sonuçlar results listesine yerleştirilir"""
+        from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+        if not jobs:
+            return
+        with start_manager(context) as manager:
+            events = manager.Queue()
+            shared = shared_control(manager)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                     initializer=_init_worker,
+                                     initargs=(self.options.backend, _governor, workers,
+                                               context.Value("i", 0))) as executor:
+                pending = {}
+                for task in self.tasks(jobs, workers):
+                    if len(task) == 1:
+                        future = executor.submit(_run_job, task[0], self.options, events, shared)
+                    else:
+                        future = executor.submit(_run_images, task, self.options, events, shared)
+                    pending[future] = task
+                synced = {"cancelled": False, "paused": False, "jobs": set()}
+                while pending:
+                    finished, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    self.sync(control, shared, synced, pending, handle, settle)
+                    self._drain(events, handle)
+                    for future in finished:
+                        task = pending.pop(future)
+                        try:
+                            result = future.result()
+                            task = result if isinstance(result, list) else [result]
+                        except Exception as e:
+                            # İşçi süreci çöktüğünde havuzdan gelen hata
+                            for job in task:
+                                job.status = "failed"
+                                job.error = str(e) or e.__class__.__name__
+                        for job in task:
+                            results[positions[job.job_id]] = job
+                            handle({"type": "finished", "job": job.job_id, "status": job.status,
+                                    "error": job.error, "seconds": job.seconds, "metrics": job.metrics})
+                            settle(job)
+                self._drain(events, handle)
+
+    def sync(self, control, shared, synced, pending, handle, settle):
+        """Çağıranın iptal ve duraklatma isteklerini işçilere iletir
+
+        Başlamamış görevlerin tüm işleri iptal edildiyse görev havuzdan
+        geri alınır; çalışan işler bir sonraki kontrol noktasında durur.
+        """
+        if control.is_cancelled() and not synced["cancelled"]:
+            synced["cancelled"] = True
+            shared.cancel()
+        for job_id in list(control.cancelled_jobs):
+            if job_id not in synced["jobs"]:
+                synced["jobs"].add(job_id)
+                shared.cancel(job_id)
+        if control.paused != synced["paused"]:
+            synced["paused"] = control.paused
+            if synced["paused"]:
+                shared.pause()
+            else:
+                shared.resume()
+        for future, task in list(pending.items()):
+            if all(control.is_cancelled(job.job_id) for job in task) and future.cancel():
+                del pending[future]
+                for job in task:
+                    self.cancel(job, handle)
+                    settle(job)
+
+    def tasks(self, jobs, workers):
+        """İşleri havuz görevlerine böler
+
+        Durağan görüntüler işçi başına gruplanır, böylece dosya başına görev ve
+        süreçler arası iletişim maliyeti ödenmez; videolar ve diğer dosyalar
+        tek başına birer görevdir.
+        """
+        images = [job for job in jobs if get_file_type(job.input_path) == "image"]
+        image_ids = {job.job_id for job in images}
+        tasks = [[job] for job in jobs if job.job_id not in image_ids]
+        if images:
+            size = max(1, min(IMAGE_CHUNK_SIZE, -(-len(images) // workers)))
+            tasks += [images[i:i + size] for i in range(0, len(images), size)]
+        return tasks
+
+    @staticmethod
+    def _drain(events, on_event):
+        while True:
+            try:
+                on_event(events.get_nowait())
+            except queue.Empty:
+                return
+
+
+@dataclass
+class WatchFolder:
+    """İzlenen bir klasör, çıkış ağacının kökü ve klasöre kayıtlı seçenekler"""
+    path: str
+    output_dir: str = ""
+    options: JobOptions = field(default_factory=JobOptions)
+
+    def output_path_for(self, input_path):
+        """Çıkış kökü verilmişse klasör yapısını orada aynen kurar"""
+        if not self.output_dir:
+            return suggest_output_path(input_path)
+        return os.path.join(self.output_dir, os.path.relpath(input_path, self.path))
+
+    def to_dict(self):
+        return {"path": self.path, "output_dir": self.output_dir, "options": self.options.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["path"], data.get("output_dir", ""), JobOptions.from_dict(data.get("options", {})))
+
+
+class FolderWatcher:
+    """İzlenen klasörlerde yeni veya değişen medya dosyalarını bulur
+
+    inotify_simple kuruluysa çekirdek bildirimleri, değilse periyodik tarama
+    kullanılır. Boyutu ve değişiklik zamanı settle_seconds boyunca sabit kalan
+    dosyalar yazılması bitmiş sayılır; ilk taramada mevcut dosyalar da bulunur.
+    """
+
+    def __init__(self, folders, settle_seconds=DEFAULT_SETTLE_SECONDS,
+                 poll_interval=DEFAULT_POLL_INTERVAL, exclude=()):
+        self.folders = [os.path.abspath(folder) for folder in folders]
+        self.exclude = [os.path.abspath(path) for path in exclude if path]
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval
+        self.candidates = {}
+        self.known = {}
+        self.watches = {}
+        self.last_scan = 0.0
+        self.inotify = self._open_inotify()
+        self.scan()
+
+    def _open_inotify(self):
+        try:
+            from inotify_simple import INotify
+        except ImportError:
+            return None
+        try:
+            return INotify()
+        except OSError:
+            return None
+
+    @property
+    def backend(self):
+        return "inotify" if self.inotify is not None else "polling"
+
+    def excluded(self, path):
+        return any(path == root or path.startswith(root + os.sep) for root in self.exclude)
+
+    def watch_directory(self, directory):
+        from inotify_simple import flags
+
+        if directory in self.watches.values():
+            return
+        try:
+            wd = self.inotify.add_watch(directory, flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE
+                                        | flags.DELETE | flags.MOVED_FROM)
+        except OSError:
+            return
+        self.watches[wd] = directory
+
+    def scan(self, roots=None):
+        """Klasörleri tarar; bilinmeyen veya değişmiş dosyaları aday yapar
+
+        Tam taramada artık bulunmayan dosyalar bilinenlerden çıkarılır.
+        """
+        self.last_scan = time.monotonic()
+        seen = set()
+        for folder in roots or self.folders:
+            for root, dirs, files in os.walk(folder):
+                dirs[:] = [d for d in dirs if not d.endswith((OUTPUT_SUFFIX, PARTS_SUFFIX))
+                           and not self.excluded(os.path.join(root, d))]
+                if self.inotify is not None:
+                    self.watch_directory(root)
+                for name in files:
+                    path = os.path.join(root, name)
+                    seen.add(path)
+                    self.notice(path)
+        if roots is None:
+            self.known = {path: signature for path, signature in self.known.items() if path in seen}
+
+    def forget(self, path, directory=False):
+        """Silinen veya taşınan dosyayı (klasörse içindekileri de) unutur"""
+        self.known.pop(path, None)
+        self.candidates.pop(path, None)
+        if directory:
+            prefix = path + os.sep
+            for name in [name for name in self.known if name.startswith(prefix)]:
+                del self.known[name]
+
+    def notice(self, path):
+        if not is_input_file(path) or self.excluded(path):
+            return
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        signature = (stat.st_size, stat.st_mtime_ns)
+        if self.known.get(path) != signature and path not in self.candidates:
+            self.candidates[path] = (signature, time.monotonic())
+
+    def read_events(self, timeout):
+        from inotify_simple import flags
+
+        for event in self.inotify.read(timeout=int(timeout * 1000)):
+            directory = self.watches.get(event.wd)
+            if directory is None or not event.name:
+                continue
+            path = os.path.join(directory, event.name)
+            if event.mask & (flags.DELETE | flags.MOVED_FROM):
+                self.forget(path, bool(event.mask & flags.ISDIR))
+            elif os.path.isdir(path):
+                # Yeni alt klasör: izlemeye ekle ve içine taşınmış dosyaları bul
+                self.scan([path])
+            else:
+                self.notice(path)
+
+    def poll(self, timeout=0.5):
+        """Yazılması biten dosyaların yollarını döndürür"""
+        if self.inotify is not None:
+            self.read_events(timeout)
+        else:
+            if time.monotonic() - self.last_scan >= self.poll_interval:
+                self.scan()
+            time.sleep(timeout)
+        ready = []
+        now = time.monotonic()
+        for path, (signature, since) in list(self.candidates.items()):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                del self.candidates[path]
+                continue
+            current = (stat.st_size, stat.st_mtime_ns)
+            if current != signature:
+                self.candidates[path] = (current, now)
+            elif now - since >= self.settle_seconds and stat.st_size > 0:
+                del self.candidates[path]
+                self.known[path] = current
+                ready.append(path)
+        return sorted(ready)
+
+    def close(self):
+        if self.inotify is not None:
+            self.inotify.close()
+
+
+class WatchService:
+    """İzlenen klasörlere düşen dosyaları kalıcı bir işçi havuzunda işler
+
+    Havuz ve model bir kez yüklenir, dosya başına süreç başlatılmaz. Her dosya
+    bulunduğu klasörün kayıtlı seçenekleriyle işlenir.
+    """
+
+    def __init__(self, folders, workers=None, start_method="spawn",
+                 settle_seconds=DEFAULT_SETTLE_SECONDS, poll_interval=DEFAULT_POLL_INTERVAL):
+        self.folders = sorted(folders, key=lambda folder: -len(os.path.abspath(folder.path)))
+        self.workers = workers or default_worker_count()
+        self.start_method = start_method
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval
+
+    def folder_for(self, path):
+        # İç içe klasörlerde en özel olan seçilir
+        for folder in self.folders:
+            root = os.path.abspath(folder.path)
+            if path.startswith(root + os.sep):
+                return folder
+        return self.folders[0]
+
+    def run(self, stop, on_event=None):
+        """stop (threading.Event) kurulana kadar klasörleri izler ve işler"""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        on_event = on_event or (lambda event: None)
+        context = multiprocessing.get_context(self.start_method)
+        watcher = FolderWatcher(
+            [folder.path for folder in self.folders], self.settle_seconds, self.poll_interval,
+            exclude=[folder.output_dir for folder in self.folders]
+        )
+        manifest = Manifest()
+        on_event({"type": "watching", "folders": [folder.path for folder in self.folders],
+                  "backend": watcher.backend})
+        # Yalnızca süren işler tutulur; izleme süresiz çalışabilir
+        jobs = {}
+        pending = {}
+        next_id = 0
+        try:
+            with start_manager(context) as manager:
+                events = manager.Queue()
+                with ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                         initializer=_init_worker,
+                                         initargs=(self.folders[0].options.backend, _governor, self.workers,
+                                                   context.Value("i", 0))) as executor:
+                    while not stop.is_set():
+                        for path in watcher.poll(0.5):
+                            job, future = self.submit(path, next_id, executor, manifest, events, on_event)
+                            next_id += 1
+                            if future is not None:
+                                jobs[job.job_id] = job
+                                pending[future] = job
+                        BatchRunner._drain(events, lambda event: on_event(self.describe(event, jobs)))
+                        for future in [future for future in pending if future.done()]:
+                            job = pending.pop(future)
+                            del jobs[job.job_id]
+                            self.complete(job, future, manifest, on_event)
+                    # Durdurulunca bekleyen dosyalar bırakılır, süren işler tamamlanır
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    BatchRunner._drain(events, lambda event: on_event(self.describe(event, jobs)))
+                    for future, job in pending.items():
+                        if not future.cancelled():
+                            self.complete(job, future, manifest, on_event)
+        finally:
+            watcher.close()
+            manifest.close()
+
+    @staticmethod
+    def describe(event, jobs):
+        job = jobs.get(event.get("job"))
+        if job is not None:
+            event = dict(event, input=job.input_path, output=job.output_path)
+        return event
+
+    @staticmethod
+    def finished(job, **extra):
+        event = {"type": "finished", "job": job.job_id, "status": job.status, "error": job.error,
+                 "seconds": job.seconds, "metrics": job.metrics,
+                 "input": job.input_path, "output": job.output_path}
+        event.update(extra)
+        return event
+
+    def submit(self, path, job_id, executor, manifest, events, on_event):
+        """Dosyayı kuyruğa alır; atlanan veya başlatılamayan işler için future None olur"""
+        options = self.folder_for(path).options
+        job = Job(path, self.folder_for(path).output_path_for(path), job_id=job_id)
+        on_event({"type": "queued", "job": job.job_id, "input": job.input_path, "output": job.output_path})
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(job.output_path)), exist_ok=True)
+            reason, source = manifest.lookup(job, options) if options.skip_unchanged else (None, None)
+            if reason is not None:
+                if reason != "unchanged":
+                    manifest.reuse(source, job, options)
+                job.status = "skipped"
+                on_event(self.finished(job, reason=reason, source=source))
+                return job, None
+            release_output(job.output_path)
+        except OSError as e:
+            job.status = "failed"
+            job.error = str(e)
+            on_event(self.finished(job))
+            return job, None
+        return job, executor.submit(_run_job, job, options, events)
+
+    def complete(self, job, future, manifest, on_event):
+        try:
+            job = future.result()
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e) or e.__class__.__name__
+        options = self.folder_for(job.input_path).options
+        if job.status == "done" and options.skip_unchanged:
+            manifest.record(job, options)
+        on_event(self.finished(job))
+
+
+class SegmentedVideo:
+    """Uzun bir videoyu parçalara bölüp işçi havuzunda paralel işler
+
+    Kesimler anahtar karelerde akış kopyalanarak yapılır; işlenen parçalar
+    concat ile yeniden kodlanmadan birleştirilir ve ses kaynaktan kopyalanır.
+    Zaman aralıkları verilmişse aralık dışındaki parçalar işlenmez; kaynak
+    H.264/yuv420p ise olduğu gibi, değilse yalnızca yeniden kodlanarak
+    birleştirilir. Biten parçalar çalışma klasöründeki günlüğe yazılır; iş
+    yarıda kesilirse aynı giriş ve seçeneklerle bir sonraki çalıştırma kalan
+    parçalardan sürer. inline açıksa parçalar havuz yerine bu süreçte işlenir.
+    """
+
+    JOURNAL = "segments.json"
+
+    def __init__(self, options, workers=None, start_method="spawn", inline=False):
+        self.options = options
+        self.workers = workers or default_worker_count()
+        self.start_method = start_method
+        self.inline = inline
+
+    def cut_points(self, keyframes, start, end, segments):
+        """Aralığı eşit sürelere en yakın anahtar karelerden bölen zamanları seçer"""
+        inside = [t for t in keyframes if start < t < end]
+        points = []
+        if not inside:
+            return points
+        for index in range(1, segments):
+            target = start + (end - start) * index / segments
+            nearest = min(inside, key=lambda t: abs(t - target))
+            if nearest not in points:
+                points.append(nearest)
+        return sorted(points)
+
+    def plan(self, input_path):
+        """Kesim zamanlarını, her parçanın işlenip işlenmeyeceğini ve tahmini kare sayılarını belirler
+
+        Süre ve kare hızı kapsayıcı bilgisinden okunur; video kare kare çözülmez.
+        """
+        keyframes = [t for t in keyframe_times(input_path) if t > 0]
+        meta = video_meta(input_path)
+        duration = meta.get("duration") or 0.0
+        if not 0 < duration < float("inf"):
+            # Süresi bildirilmeyen kapsayıcılarda son anahtar kare yeterli bir sınırdır
+            duration = keyframes[-1] + 1.0 if keyframes else 0.0
+        segments = 1 if self.inline else self.options.segments
+        if not self.options.time_ranges:
+            points = self.cut_points(keyframes, 0.0, duration, segments)
+            return points, [True] * (len(points) + 1), self.frame_estimates(points, duration, meta.get("fps"))
+        spans = range_spans(self.options.time_ranges, keyframes, duration)
+        # Paralel parçalar yalnızca işlenecek süre üzerinden paylaştırılır
+        active_total = sum(end - start for start, end in spans)
+        points = {t for span in spans for t in span if 0 < t < duration}
+        for start, end in spans:
+            share = max(1, round(segments * (end - start) / active_total))
+            points.update(self.cut_points(keyframes, start, end, share))
+        points = sorted(points)
+        active = [any(start <= t < end for start, end in spans) for t in [0.0] + points]
+        return points, active, self.frame_estimates(points, duration, meta.get("fps"))
+
+    @staticmethod
+    def frame_estimates(points, duration, fps):
+        """Kesim noktaları arasındaki her parçanın kare sayısını kare hızından tahmin eder"""
+        bounds = [0.0] + list(points) + [max(duration, points[-1] if points else 0.0)]
+        return [max(1, round((fps or 0) * (end - start))) if fps else 0 for start, end in zip(bounds, bounds[1:])]
+
+    @staticmethod
+    def can_copy(input_path):
+        """Aralık dışındaki parçalar işlenen parçalarla yeniden kodlanmadan birleştirilebilir mi
+
+        Bu yalnızca ön denetimdir; kopyalanan parçaların SPS'i işlenen
+        parçalarınkiyle birleştirmeden önce ayrıca karşılaştırılır.
+        """
+        meta = video_meta(input_path)
+        width, height = meta["size"]
+        return (meta.get("codec") == "h264" and str(meta.get("pix_fmt", "")).startswith("yuv420p")
+                and width % 2 == 0 and height % 2 == 0)
+
+    @staticmethod
+    def matches_encoded(jobs, copied):
+        """Kopyalanan kaynak parçalar işlenen parçalarla aynı akış özelliklerine mi sahip"""
+        encoded = next((job for job in jobs if job.output_path != job.input_path), None)
+        if encoded is None:
+            return True
+        reference = stream_signature(encoded.output_path)
+        return all(stream_signature(job.input_path) == reference for job in copied)
+
+    def transcode(self, input_path, output_path):
+        """Parçayı algılama yapmadan işlenen parçalarla aynı biçimde yeniden kodlar"""
+        run_ffmpeg(["-i", input_path, "-map", "0:v:0", "-an", "-vf", "scale=ceil(iw/2)*2:ceil(ih/2)*2"]
+                   + self.options.encoder_args() + ["-pix_fmt", "yuv420p", output_path])
+
+    def split(self, input_path, work_dir, points):
+        pattern = os.path.join(work_dir, "segment_%05d.mp4")
+        args = ["-i", input_path, "-map", "0:v:0", "-c", "copy", "-an"]
+        if points:
+            args += ["-f", "segment", "-segment_times", ",".join(f"{t:.6f}" for t in points),
+                     "-reset_timestamps", "1", pattern]
+        else:
+            args += [pattern % 0]
+        run_ffmpeg(args)
+        return sorted(
+            os.path.join(work_dir, name) for name in os.listdir(work_dir)
+            if name.startswith("segment_")
+        )
+
+    def concat(self, parts, input_path, output_path, work_dir):
+        list_path = os.path.join(work_dir, "concat.txt")
+        with open(list_path, "w", encoding="utf-8") as f:
+            for part in parts:
+                # Göreli yollar liste dosyasının klasörüne göre çözülür
+                escaped = os.path.abspath(part).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        args = ["-f", "concat", "-safe", "0", "-i", list_path]
+        if self.options.keep_audio and has_audio(input_path):
+            args += ["-i", input_path, "-map", "0:v:0", "-map", "1:a:0"]
+        args += ["-c", "copy", output_path]
+        run_ffmpeg(args)
+
+    def signature(self, input_path):
+        """Günlüğün hangi giriş ve seçeneklere ait olduğunu belirler"""
+        stat = os.stat(input_path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                "options": self.options.output_key(),
+                "segments": 1 if self.inline else self.options.segments}
+
+    def load_journal(self, work_dir, signature):
+        """Geçerli bir günlük varsa döndürür; giriş veya seçenekler değiştiyse None"""
+        try:
+            with open(os.path.join(work_dir, self.JOURNAL), "r", encoding="utf-8") as f:
+                journal = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if journal.get("signature") != signature:
+            return None
+        if not all(os.path.exists(os.path.join(work_dir, name)) for name in journal["segments"]):
+            return None
+        return journal
+
+    def save_journal(self, work_dir, journal):
+        path = os.path.join(work_dir, self.JOURNAL)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(journal, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+
+    def run(self, input_path, output_path, on_event=None, control=None):
+        """Videoyu parçalı işler; ilerleme olayları tüm video için birleştirilir
+
+        Parçaların ölçümleri bölme ve birleştirme süreleriyle toplanarak
+        JobMetrics olarak döndürülür. Çalışma klasörü yalnızca başarıyla
+        birleştirmeden sonra silinir; iptal edilen iş biten parçalarıyla
+        kaldığı yerden sürdürülebilir.
+        """
+        from dataclasses import replace
+
+        on_event = on_event or (lambda event: None)
+        control = control or JobControl()
+        metrics = JobMetrics()
+        work_dir = output_path + PARTS_SUFFIX
+        signature = self.signature(input_path)
+        journal = self.load_journal(work_dir, signature)
+        if journal is None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            os.makedirs(work_dir)
+            with metrics.stage("split"):
+                points, active, estimates = self.plan(input_path)
+                segments = self.split(input_path, work_dir, points)
+            if len(segments) != len(active):
+                raise RuntimeError(f"Expected {len(active)} segments, ffmpeg wrote {len(segments)}")
+            journal = {"signature": signature, "segments": [os.path.basename(path) for path in segments],
+                       "active": active, "frames": estimates,
+                       "copy": all(active) or self.can_copy(input_path), "done": {}}
+            self.save_journal(work_dir, journal)
+        else:
+            on_event({"type": "resumed", "done": len(journal["done"]), "count": len(journal["segments"])})
+        # Zaman aralığı desteğinden önceki günlüklerde tüm parçalar işlenir
+        active = journal.get("active") or [True] * len(journal["segments"])
+        journal.setdefault("copy", True)
+        # Kare tahmini olmayan eski günlüklerde parçalar işlenirken sayılır
+        estimates = journal.get("frames") or [0] * len(journal["segments"])
+        jobs = []
+        for i, name in enumerate(journal["segments"]):
+            path = os.path.join(work_dir, name)
+            # Aralık dışındaki parça kopyalanabiliyorsa kendisi birleştirilir
+            copied = not active[i] and journal["copy"]
+            jobs.append(Job(path, path if copied else os.path.join(work_dir, "done_" + name), job_id=i,
+                            status="done" if copied or str(i) in journal["done"] else "queued",
+                            metrics=journal["done"].get(str(i), {}), total_frames=estimates[i]))
+        # Toplam yalnızca işlenecek parçaların tahminidir; aralık dışı parçalar çözülmez
+        processed = [estimates[i] for i in range(len(active)) if active[i]]
+        total = sum(processed) if all(processed) else None
+        if not all(active):
+            metrics.count("skipped_segments", len(active) - sum(active))
+        # Parçalarda ses yoktur; ses birleştirme sırasında kaynaktan alınır.
+        # Geçici parçalar manifeste yazılmaz.
+        options = replace(self.options, keep_audio=False, skip_unchanged=False, time_ranges=[], segments=1)
+        # Önceki çalıştırmada biten parçaların kareleri ilerlemeye baştan sayılır
+        frames = {job.job_id: job.metrics.get("counters", {}).get("frames", 0)
+                  for job in jobs if job.status == "done" and active[job.job_id]}
+        fps = {}
+        start = time.perf_counter()
+        resumed = sum(frames.values())
+
+        def on_segment_event(event):
+            if event["type"] == "progress":
+                frames[event["job"]] = event["frames"]
+                fps[event["job"]] = event["fps"]
+                done = sum(frames.values())
+                elapsed = time.perf_counter() - start
+                rate = (done - resumed) / elapsed if elapsed > 0 else 0.0
+                on_event({
+                    "type": "progress",
+                    "frames": done,
+                    "total": total,
+                    "fps": sum(fps.values()),
+                    "avg_fps": rate,
+                    "elapsed": elapsed,
+                    "eta": max(0.0, (total - done) / rate) if total and rate > 0 else None,
+                    "segment": event["job"],
+                })
+            elif event["type"] == "finished":
+                fps.pop(event["job"], None)
+                if event["status"] == "done":
+                    # Parça diske yazılmadan günlüğe bitti olarak geçmez
+                    with open(jobs[event["job"]].output_path, "rb") as f:
+                        os.fsync(f.fileno())
+                    journal["done"][str(event["job"])] = event["metrics"]
+                    self.save_journal(work_dir, journal)
+                on_event({"type": "segment", "segment": event["job"], "count": len(jobs),
+                          "status": event["status"], "error": event["error"],
+                          "seconds": event["seconds"]})
+
+        for job in jobs:
+            if not active[job.job_id] and job.status != "done":
+                control.checkpoint()
+                with metrics.stage("encode"):
+                    self.transcode(job.input_path, job.output_path)
+                job.status = "done"
+                journal["done"][str(job.job_id)] = {}
+                self.save_journal(work_dir, journal)
+        pending = [job for job in jobs if job.status != "done"]
+        if pending and self.inline:
+            for job in pending:
+                self.run_inline(job, options, on_segment_event, control)
+        elif pending:
+            runner = BatchRunner(options, min(self.workers, len(pending)), self.start_method)
+            for job in runner.run(pending, on_segment_event, control):
+                jobs[job.job_id] = job
+        if control.is_cancelled():
+            raise JobCancelled()
+        failed = [job for job in jobs if job.status != "done"]
+        if failed:
+            raise RuntimeError(f"Segment {failed[0].job_id} failed: {failed[0].error}")
+        copied = [job for job in jobs if job.output_path == job.input_path]
+        if copied and not self.matches_encoded(jobs, copied):
+            # MP4 avcC başlığı ilk parçadan alınır; farklı profil, seviye veya
+            # B-kare düzenindeki kopyalar katı oynatıcılarda çözülemez
+            journal["copy"] = False
+            for job in copied:
+                control.checkpoint()
+                job.output_path = os.path.join(work_dir, "done_" + os.path.basename(job.input_path))
+                with metrics.stage("encode"):
+                    self.transcode(job.input_path, job.output_path)
+                journal["done"][str(job.job_id)] = {}
+                self.save_journal(work_dir, journal)
+        with metrics.stage("mux"):
+            self.concat([job.output_path for job in jobs], input_path, output_path, work_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+        # Parçaların bayt sayaçları yerine kaynak ve sonuç dosyası sayılır
+        for job in jobs:
+            job.metrics.get("counters", {}).pop("bytes_read", None)
+            job.metrics.get("counters", {}).pop("bytes_written", None)
+            metrics.merge(job.metrics)
+        metrics.count_bytes(input_path, output_path)
+        return metrics
+
+    @staticmethod
+    def run_inline(job, options, on_event, control):
+        """Parçayı bu süreçte işler; olaylar havuzdaki işlerinkiyle aynıdır"""
+        from types import SimpleNamespace
+
+        if control.is_cancelled():
+            return
+        _run_job(job, options, SimpleNamespace(put=on_event), control)
+        on_event({"type": "finished", "job": job.job_id, "status": job.status, "error": job.error,
+                  "seconds": job.seconds, "metrics": job.metrics})
+
+
+def run_segmented_job(job, options, workers=None, start_method="spawn", on_event=None, control=None):
+    """Tek bir video işini parçalı modda çalıştırır; olaylar işin kimliğiyle etiketlenir"""
+    on_event = on_event or (lambda event: None)
+    manifest = Manifest() if options.skip_unchanged else None
+    start = time.perf_counter()
+    try:
+        reason, source = manifest.lookup(job, options) if manifest else (None, None)
+        if reason is not None:
+            if reason != "unchanged":
+                manifest.reuse(source, job, options)
+            job.status = "skipped"
+            job.seconds = time.perf_counter() - start
+            on_event({"type": "finished", "job": job.job_id, "status": job.status, "error": "",
+                      "seconds": job.seconds, "metrics": {}, "reason": reason, "source": source})
+            return job
+        on_event({"type": "status", "job": job.job_id, "status": "running"})
+        release_output(job.output_path)
+        metrics = SegmentedVideo(options, workers, start_method).run(
+            job.input_path, job.output_path, lambda event: on_event(dict(event, job=job.job_id)),
+            control.scoped(job.job_id) if control is not None else None
+        )
+        job.metrics = metrics.to_dict()
+        job.status = "done"
+        if manifest is not None:
+            manifest.record(job, options)
+    except Exception as e:
+        # Ctrl+C ffmpeg'i de durdurur; iptal sırasında gelen hatalar iptal sayılır
+        if isinstance(e, JobCancelled) or (control is not None and control.is_cancelled(job.job_id)):
+            job.status = "cancelled"
+        else:
+            job.status = "failed"
+            job.error = str(e) or e.__class__.__name__
+    finally:
+        if manifest is not None:
+            manifest.close()
+    job.seconds = time.perf_counter() - start
+    on_event({"type": "finished", "job": job.job_id, "status": job.status,
+              "error": job.error, "seconds": job.seconds, "metrics": job.metrics})
+    return job
@@ -1,14 +1,300 @@
 #!/usr/bin/env python3
+import time
+
+# Açılış süresi ölçümü için başlangıç zamanı
+STARTUP_TIME = time.perf_counter()
+
 import sys
 import os
+import shutil
 import subprocess
-import threading
+import signal
+import multiprocessing
 import json
-import webbrowser
+import glob
 from datetime import datetime
-from PyQt5.QtWidgets import *
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
+import defaceengine
+
+
+def parse_detection_size(value):
+    """--detection-size için 'auto', 'native' veya piksel değerini çözer"""
+    if value == "auto":
+        return defaceengine.DETECTION_SIZE_AUTO
+    if value == "native":
+        return defaceengine.DETECTION_SIZE_NATIVE
+    return int(value)
+
+
+def parse_roi(value):
+    """--roi için kareye oranla verilen 'x,y,genişlik,yükseklik' dikdörtgenini çözer"""
+    rect = [float(part) for part in value.split(",")]
+    if len(rect) != 4 or not all(0 <= v <= 1 for v in rect) or rect[2] <= 0 or rect[3] <= 0:
+        raise ValueError(value)
+    return rect
+
+
+def parse_headless_args(argv):
+    """Arayüzdeki seçeneklerin komut satırı karşılıklarını ayrıştırır"""
+    import argparse
+
+    defaults = defaceengine.JobOptions()
+    parser = argparse.ArgumentParser(
+        prog="defacegui --headless",
+        description="Deface GUI işlerini ekran olmadan çalıştırır. "
+                    "Sonuçlar standart çıktıya satır başına bir JSON nesnesi olarak yazılır."
+    )
+    parser.add_argument("inputs", nargs="*", help="Dosyalar ve/veya klasörler")
+    parser.add_argument("--method", choices=["blur", "mosaic", "solid"], default=defaults.method)
+    parser.add_argument("--threshold", type=float, default=defaults.threshold)
+    parser.add_argument("--mosaic-size", type=int, default=defaults.mosaic_size)
+    parser.add_argument("--keep-audio", action=argparse.BooleanOptionalAction, default=defaults.keep_audio,
+                        help="Videoların sesini yeniden kodlamadan kopyala")
+    parser.add_argument("--encoder-preset", choices=list(defaceengine.ENCODER_PRESETS),
+                        default=defaults.encoder_preset,
+                        help="Video çıkışı kodlama ön ayarı: fast (hızlı, düşük kalite), balanced, "
+                             "archival (yavaş, yüksek kalite)")
+    parser.add_argument("--encoder-threads", type=int, default=defaults.encoder_threads,
+                        help="ffmpeg kodlayıcı iş parçacığı sayısı (0: işçinin iş parçacığı payı)")
+    parser.add_argument("--workers", type=int, default=defaceengine.default_worker_count())
+    parser.add_argument("--thread-budget", type=int, default=0,
+                        help="Tüm işçilerin toplam iş parçacığı sayısı; işçilere eşit bölünür "
+                             "(0: kullanılabilir çekirdek sayısı)")
+    parser.add_argument("--cpus", type=defaceengine.parse_cpu_list, default=[],
+                        help="İşleri yalnızca bu çekirdeklerde çalıştır (ör. '0-3,6')")
+    parser.add_argument("--pin-workers", action="store_true",
+                        help="Her işçiyi çekirdeklerin ayrı bir dilimine bağla")
+    parser.add_argument("--nice", type=int, default=0, choices=range(0, 20), metavar="0-19",
+                        help="İşçilerin ve ffmpeg'in işlemci önceliğini bu nice değerine düşür")
+    parser.add_argument("--ionice", choices=["low", "idle"], default="",
+                        help="İşçilerin disk önceliğini düşür: low (best-effort 7) veya idle")
+    parser.add_argument("--detect-interval", type=int, default=defaults.detect_interval)
+    parser.add_argument("--scene-threshold", type=float, default=defaults.scene_threshold)
+    parser.add_argument("--track-margin", type=float, default=defaults.track_margin)
+    parser.add_argument("--detection-size", type=parse_detection_size, default=defaults.detection_size,
+                        help="Algılama kopyasının uzun kenarı: piksel, 'auto' veya 'native' (varsayılan)")
+    parser.add_argument("--tile-threshold", type=float, default=defaults.tile_min_pixels / 1e6,
+                        help="Bu megapikselin üzerindeki görüntüleri karo modunda işle (0: kapalı)")
+    parser.add_argument("--skip-unchanged", action=argparse.BooleanOptionalAction, default=defaults.skip_unchanged,
+                        help="Aynı içerik ve seçeneklerle üretilmiş, değişmemiş çıkışları yeniden işleme")
+    parser.add_argument("--dedup", choices=["copy", "link"], default=defaults.dedup,
+                        help="Özdeş girişler için önceki çıkışı kopyala veya sabit bağla")
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size,
+                        help="Durağan görüntülerde tek ileri geçişteki görüntü sayısı (1: kapalı)")
+    parser.add_argument("--segments", type=int, default=defaults.segments,
+                        help="Videoları bu kadar parçaya bölüp paralel işle (1: kapalı)")
+    parser.add_argument("--ranges", type=defaceengine.parse_time_ranges, default=[],
+                        help="Videoların yalnızca bu aralıklarını işle, kalanını yeniden kodlamadan kopyala "
+                             "(ör. '0:30-2:15, 1:10:00-')")
+    parser.add_argument("--roi", type=parse_roi, action="append", default=[],
+                        help="Algılamayı kareye oranla verilen 'x,y,genişlik,yükseklik' bölgesiyle sınırla "
+                             "(birden çok kez verilebilir)")
+    parser.add_argument("--roi-mask", default="",
+                        help="Algılamayı bu maske görüntüsünün siyah olmayan pikselleriyle sınırla")
+    parser.add_argument("--detection-cache", action=argparse.BooleanOptionalAction, default=defaults.detection_cache)
+    parser.add_argument("--backend", choices=["auto", "onnxrt", "opencv"], default=defaults.backend)
+    parser.add_argument("--profile", action="store_true",
+                        help=f"Her iş için cProfile dökümü kaydet ({defaceengine.PROFILE_DIR})")
+    parser.add_argument("--metrics-file", help="Toplu ölçümleri Prometheus metin biçiminde bu dosyaya yaz")
+    parser.add_argument("--events", action="store_true", help="İlerleme ve durum olaylarını da yaz")
+    parser.add_argument("--watch", action="store_true",
+                        help="Verilen klasörleri izle ve yeni dosyaları geldikçe işle (Ctrl+C ile durur)")
+    parser.add_argument("--output-dir", default="",
+                        help="İzleme modunda çıkışları klasör yapısını koruyarak bu dizine yaz")
+    parser.add_argument("--watch-config",
+                        help="Klasör başına seçenekler içeren JSON dosyası: "
+                             "[{\"path\": ..., \"output_dir\": ..., \"options\": {...}}]")
+    parser.add_argument("--settle", type=float, default=defaceengine.DEFAULT_SETTLE_SECONDS,
+                        help="Dosya bu kadar saniye değişmeden kalınca yazılmış sayılır")
+    parser.add_argument("--resume", action="store_true",
+                        help="Yarıda kesilmiş toplu işleri kayıtlı seçenekleriyle kaldığı yerden sürdür")
+    args = parser.parse_args(argv)
+    if not args.inputs and not args.watch_config and not args.resume:
+        parser.error("en az bir giriş gerekli")
+    if args.watch_config:
+        args.watch = True
+    return args
+
+
+def run_headless(argv):
+    """GUI ile aynı iş kuyruğunu ve işçi havuzunu PyQt5 yüklemeden çalıştırır"""
+    args = parse_headless_args(argv)
+    options = defaceengine.JobOptions(
+        method=args.method,
+        threshold=args.threshold,
+        mosaic_size=args.mosaic_size,
+        keep_audio=args.keep_audio,
+        encoder_preset=args.encoder_preset,
+        encoder_threads=args.encoder_threads,
+        detection_cache=args.detection_cache,
+        detect_interval=args.detect_interval,
+        scene_threshold=args.scene_threshold,
+        track_margin=args.track_margin,
+        detection_size=args.detection_size,
+        tile_min_pixels=int(args.tile_threshold * 1e6),
+        segments=args.segments,
+        batch_size=args.batch_size,
+        skip_unchanged=args.skip_unchanged,
+        dedup=args.dedup,
+        backend=args.backend,
+        profile=args.profile,
+        time_ranges=args.ranges,
+        roi=args.roi,
+        roi_mask=os.path.abspath(args.roi_mask) if args.roi_mask else "",
+    )
+
+    def emit(record):
+        print(json.dumps(record, ensure_ascii=False), flush=True)
+
+    governor = defaceengine.ResourceGovernor(
+        thread_budget=args.thread_budget, cpus=args.cpus, pin_workers=args.pin_workers,
+        nice=args.nice, ionice=args.ionice,
+    )
+    defaceengine.set_governor(governor)
+    # Öncelik ve çekirdek kümesi tüm işçilere ve ffmpeg süreçlerine miras kalır
+    try:
+        governor.apply_process()
+    except OSError as e:
+        emit({"type": "error", "error": f"cannot apply resource limits: {e}"})
+        return 1
+    if args.watch:
+        return run_watch(args, options, emit)
+    control = install_control_signals()
+    store = defaceengine.JobStore()
+    try:
+        if args.resume:
+            batches = store.unfinished()
+        else:
+            jobs = defaceengine.make_jobs(defaceengine.collect_inputs(args.inputs))
+            batches = [(store.create(jobs, options), options, jobs)]
+        failed = False
+        for batch, batch_options, jobs in batches:
+            if control.is_cancelled():
+                break
+            if args.resume:
+                emit({"type": "resumed", "batch": batch, "total": len(jobs),
+                      "pending": sum(1 for job in jobs if job.status == "queued")})
+            failed = run_batch(args, batch_options, jobs, emit, store, batch, control) or failed
+    finally:
+        store.close()
+    if control.is_cancelled():
+        return 130
+    return 1 if failed else 0
+
+
+def install_control_signals():
+    """SIGINT/SIGTERM işleri temiz biçimde iptal eder, SIGUSR1/SIGUSR2 duraklatır ve sürdürür
+
+    İkinci Ctrl+C varsayılan davranışla süreci hemen sonlandırır.
+    """
+    control = defaceengine.JobControl()
+
+    def cancel(signum, frame):
+        control.cancel()
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    signal.signal(signal.SIGINT, cancel)
+    signal.signal(signal.SIGTERM, cancel)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda *_: control.pause())
+        signal.signal(signal.SIGUSR2, lambda *_: control.resume())
+    return control
+
+
+def run_batch(args, options, jobs, emit, store, batch, control):
+    """Bir toplu işi çalıştırır; her durum değişimi iş kaydına yazılır
+
+    İptal edilen toplu iş kayıtta kalır ve --resume ile sürdürülebilir.
+    """
+    def on_event(event):
+        store.update(batch, event)
+        if args.events or event["type"] == "finished":
+            job = jobs[event["job"]] if "job" in event else None
+            if job is not None:
+                event = dict(event, input=job.input_path, output=job.output_path)
+            emit(event)
+
+    start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+    # Önceki çalıştırmada biten veya atlanan dosyalar yeniden işlenmez
+    pending = [job for job in jobs if job.status == "queued"]
+    # Parçalı modda videolar tek tek tüm havuzu kullanır, diğer dosyalar birlikte işlenir
+    segmented = set()
+    if options.segments > 1:
+        segmented = {job.job_id for job in pending if defaceengine.get_file_type(job.input_path) == "video"}
+    pooled = [job for job in pending if job.job_id not in segmented]
+    if pooled:
+        runner = defaceengine.BatchRunner(options, args.workers, start_method)
+        runner.run(pooled, on_event, control)
+        for job in pooled:
+            jobs[job.job_id] = job
+    for job_id in sorted(segmented):
+        if control.is_cancelled():
+            jobs[job_id].status = "cancelled"
+            continue
+        defaceengine.run_segmented_job(jobs[job_id], options, args.workers, start_method, on_event, control)
+    failed = [job for job in jobs if job.status == "failed"]
+    skipped = [job for job in jobs if job.status == "skipped"]
+    cancelled = [job for job in jobs if job.status == "cancelled"]
+    if not cancelled:
+        store.finish(batch)
+    if args.metrics_file:
+        defaceengine.write_prometheus(args.metrics_file, [vars(job) for job in jobs])
+    emit({
+        "type": "summary",
+        "total": len(jobs),
+        "done": sum(1 for job in jobs if job.status == "done"),
+        "skipped": len(skipped),
+        "failed": len(failed),
+        "cancelled": len(cancelled),
+        "seconds": sum(job.seconds for job in jobs),
+    })
+    return bool(failed or not jobs)
+
+
+def run_watch(args, options, emit):
+    """Klasörleri SIGINT/SIGTERM gelene kadar izler; her olay bir JSON satırıdır"""
+    import threading
+
+    folders = [defaceengine.WatchFolder(os.path.abspath(path), os.path.abspath(args.output_dir)
+                                        if args.output_dir else "", options)
+               for path in args.inputs]
+    if args.watch_config:
+        with open(args.watch_config, "r", encoding="utf-8") as f:
+            folders += [defaceengine.WatchFolder.from_dict(entry) for entry in json.load(f)]
+    missing = [folder.path for folder in folders if not os.path.isdir(folder.path)]
+    if missing:
+        emit({"type": "error", "error": "not a directory", "paths": missing})
+        return 1
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+    counts = {"done": 0, "skipped": 0, "failed": 0}
+
+    def on_event(event):
+        if event["type"] == "finished":
+            counts[event["status"]] = counts.get(event["status"], 0) + 1
+        if args.events or event["type"] in ("finished", "watching"):
+            emit(event)
+
+    start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+    service = defaceengine.WatchService(folders, args.workers, start_method, settle_seconds=args.settle)
+    service.run(stop, on_event)
+    emit(dict({"type": "summary", "total": sum(counts.values())}, **counts))
+    return 1 if counts["failed"] else 0
+
+
+# Komut satırı modu PyQt5 yüklenmeden burada ayrılır
+if __name__ == "__main__" and "--headless" in sys.argv[1:]:
+    sys.exit(run_headless([arg for arg in sys.argv[1:] if arg != "--headless"]))
+
+from PyQt5.QtWidgets import (
+    QAbstractItemView, QAction, QApplication, QCheckBox, QComboBox, QDialog,
+    QDoubleSpinBox, QFileDialog, QGridLayout, QGroupBox, QHBoxLayout, QHeaderView, QLabel,
+    QLineEdit, QListWidget, QListWidgetItem, QMainWindow, QMessageBox, QProgressBar,
+    QProgressDialog, QPushButton, QScrollArea, QSpinBox, QTableWidget,
+    QTableWidgetItem, QPlainTextEdit, QVBoxLayout, QWidget
+)
+from PyQt5.QtCore import Qt, QRect, QRectF, QSettings, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QIcon, QImage, QPainter, QPen, QPixmap
 
 # Qt platform plugin sorununu çözmek için ortam değişkenlerini ayarla
 os.environ['QT_QPA_PLATFORM_PLUGIN_PATH'] = ''
@@ -35,6 +321,97 @@ def check_deface_installed():
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
 
+def deface_executable_signature():
+    """deface komutunun yolunu ve değiştirilme zamanını döndürür, bulunamazsa None"""
+    path = shutil.which("deface")
+    if path is None:
+        path = shutil.which("deface", path=os.path.expanduser("~/.local/bin"))
+    if path is None:
+        return None
+    try:
+        return {"path": os.path.realpath(path), "mtime": os.stat(path).st_mtime}
+    except OSError:
+        return None
+
+class LogBuffer:
+    """Günlük satırlarını arayüze sınırlı sayıda iletir, tamamını diske yazar
+
+    Arayüz yalnızca son max_lines satırı gösterir; satırların tümü dönen
+    günlük dosyalarına yazıldığından kaydetme işlemi hiçbir satırı kaybetmez.
+    """
+
+    def __init__(self, max_lines=5000, directory=None, max_bytes=20 * 1024 * 1024, backup_count=10):
+        self.max_lines = max_lines
+        self.pending = []
+        self.directory = directory or os.path.join(defaceengine.CACHE_DIR, "logs")
+        self.path = os.path.join(self.directory, f"session-{os.getpid()}.log")
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.file = None
+
+    def append(self, line):
+        self.pending.append(line)
+        # Arayüz boşaltmadan önce gelen taşkın da max_lines ile sınırlanır
+        if len(self.pending) > self.max_lines:
+            del self.pending[:-self.max_lines]
+        self.write(line)
+
+    def take_pending(self):
+        """Son boşaltmadan beri eklenen satırları (en fazla max_lines) döndürür"""
+        pending = self.pending[-self.max_lines:]
+        self.pending = []
+        return pending
+
+    def set_max_lines(self, max_lines):
+        self.max_lines = max_lines
+
+    def write(self, line):
+        try:
+            if self.file is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self.file = open(self.path, "a", encoding="utf-8")
+            self.file.write(line + "\n")
+            if self.file.tell() >= self.max_bytes:
+                self.rotate()
+        except OSError:
+            pass
+
+    def rotate(self):
+        self.file.close()
+        self.file = None
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def files(self):
+        """Günlük dosyalarını eskiden yeniye sıralı döndürür"""
+        rotated = [f"{self.path}.{index}" for index in range(self.backup_count, 0, -1)]
+        return [path for path in rotated + [self.path] if os.path.exists(path)]
+
+    def save(self, filename):
+        if self.file is not None:
+            self.file.flush()
+        with open(filename, "w", encoding="utf-8") as out:
+            for path in self.files():
+                with open(path, "r", encoding="utf-8") as f:
+                    shutil.copyfileobj(f, out)
+
+    def clear(self):
+        self.pending = []
+        self.close()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        for path in glob.glob(glob.escape(self.path) + "*"):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
 def install_dependencies():
     """Gerekli bağımlılıkları kurar"""
     try:
@@ -91,11 +468,483 @@ def install_dependencies():
 class DefaceGUI(QMainWindow):
     def __init__(self):
         super().__init__()
-        
 
+        # Dil ayarları
+        self.settings = QSettings("DefaceGUI", "DefaceGUI")
+        self.current_language = self.settings.value("language", "tr")
+
+        # Çeviri sözlüğü
+        self.translations = {
+            "tr": {
+                "window_title": "Deface GUI - Yüz Anonimleştirme Aracı",
+                "main_title": "Deface GUI",
+                "file_selection": "Dosya Seçimi",
+                "drag_drop": "Dosyayı buraya sürükleyip bırakın",
+                "input": "Giriş:",
+                "output": "Çıkış:",
+                "input_placeholder": "Video veya resim dosyası seçin...",
+                "output_placeholder": "Çıkış dosyası yolu...",
+                "browse": "Gözat",
+                "browse_output": "Kaydet",
+                "anonymization_options": "Anonimleştirme Seçenekleri",
+                "method": "Yöntem:",
+                "tooltip_blur": "Yüzleri bulanıklaştırır",
+                "tooltip_mosaic": "Yüzleri mozaik ile kaplar",
+                "tooltip_solid": "Yüzleri düz siyah kutu ile kaplar",
+                "keep_audio": "Sesi koru (videolar için)",
+                "tooltip_keep_audio": "Ses akışı yeniden kodlanmadan kaynaktan kopyalanır.",
+                "encoder_preset": "Çıkış kalitesi:",
+                "encoder_preset_fast": "Hızlı önizleme",
+                "encoder_preset_balanced": "Dengeli",
+                "encoder_preset_archival": "Arşiv kalitesi",
+                "tooltip_encoder_preset": "Video çıkışının H.264 kodlama ayarı. Hızlı önizleme: CRF 28, veryfast; dengeli: CRF 23, medium; arşiv: CRF 18, slow. Hızlı ayar kodlamayı belirgin biçimde kısaltır ama kalite düşer; arşiv ayarı yavaştır ve daha büyük dosyalar üretir.",
+                "encoder_threads": "Kodlayıcı iş parçacığı:",
+                "encoder_threads_auto": "Otomatik",
+                "tooltip_encoder_threads": "ffmpeg kodlayıcısının kullanacağı iş parçacığı sayısı. Otomatik modda gelişmiş ayarlardaki iş parçacığı bütçesinden işe düşen pay kullanılır.",
+                "preview_mode": "Önizleme modu",
+                "quick_preview": "Hızlı Önizleme",
+                "tooltip_quick_preview": "Girişten birkaç örnek kare çözer ve yalnızca onları anonimleştirir. Eşik, yöntem veya mozaik boyu değişince önizleme hemen yenilenir.",
+                "preview_button": "Önizle",
+                "preview_frames": "Kare:",
+                "preview_start": "Başlangıç:",
+                "preview_window": "Aralık:",
+                "preview_window_all": "Tümü",
+                "seconds_suffix": " sn",
+                "preview_loading": "Örnek kareler hazırlanıyor...",
+                "preview_status": "{} kare, {} yüz, {:.0f} ms",
+                "preview_caption": "{} · {} yüz",
+                "preview_error": "Önizleme hatası: {}",
+                "advanced_settings": "Gelişmiş Ayarlar",
+                "detection_threshold": "Algılama eşiği:",
+                "tooltip_threshold": "Düşük değerler daha fazla yüz algılar, yanlış pozitifler artabilir",
+                "detect_interval": "Algılama aralığı (kare):",
+                "tooltip_detect_interval": "Hızlı video modu: yüz algılama her N karede bir ve sahne değişimlerinde yapılır, aradaki karelerin kutuları güvenlik payıyla ara değerlenir. 1 her karede algılar.",
+                "detection_size": "Algılama boyutu:",
+                "detection_size_native": "Tam çözünürlük",
+                "detection_size_auto": "Otomatik",
+                "tooltip_detection_size": "Yüzler uzun kenarı bu boyuta küçültülmüş bir kopyada aranır; bulanıklaştırma tam çözünürlükte yapılır. Otomatik mod Full HD'den büyük girişleri {} piksele küçültür. Yüzler karede büyükse çok hızlandırır; küçük yüzler kaçabilir.",
+                "tile_threshold": "Karo modu eşiği:",
+                "time_ranges": "Zaman aralıkları:",
+                "time_ranges_placeholder": "Tüm video (ör. 0:30-2:15, 1:10:00-)",
+                "tooltip_time_ranges": "Videoların yalnızca bu aralıkları işlenir; kalan bölümler yeniden kodlanmadan kopyalanır. Aralıklar en yakın anahtar karelere genişletilir. Bitişi boş bırakılan aralık videonun sonuna kadar sürer.",
+                "invalid_time_ranges": "Geçersiz zaman aralığı: {}",
+                "roi": "İlgi bölgesi:",
+                "roi_draw": "Çiz...",
+                "roi_load_mask": "Maske Yükle...",
+                "roi_none": "Tüm kare",
+                "roi_rects": "{} dikdörtgen",
+                "roi_mask_name": "maske: {}",
+                "tooltip_roi": "Yüzler yalnızca çizilen dikdörtgenlerde veya maskenin siyah olmayan piksellerinde aranır. Sabit kamera görüntülerinde işlenecek alanı küçültür.",
+                "roi_dialog_title": "İlgi Bölgesini Çiz",
+                "roi_dialog_hint": "Yüz aranacak bölgeleri fareyle sürükleyerek çizin. Bölge dışındaki yüzler anonimleştirilmez.",
+                "ok": "Tamam",
+                "tile_threshold_off": "Kapalı",
+                "tooltip_tile_threshold": "Bu piksel sayısının üzerindeki görüntüler örtüşen karolarda paralel taranır ve yüzler tek tek anonimleştirilir; bellek kullanımı görüntü boyutundan bağımsız kalır. Sıkıştırılmamış TIFF dosyaları bellek eşlemeyle okunur.",
+                "batch_size": "Görüntü toplu boyutu:",
+                "tooltip_batch_size": "Kuyruktaki fotoğraflar, aynı model giriş boyutuna düşenler bu sayıda gruplanarak tek ileri geçişte algılanır. Çözme önden, yazma arka planda yapılır. 1 kapalıdır.",
+                "skip_unchanged": "Değişmeyen dosyaları atla",
+                "tooltip_skip_unchanged": "İçeriği ve seçenekleri aynı olan, çıkışı hâlâ yerinde duran dosyalar yeniden işlenmez. Özdeş içerikli girişler için önceki çıkış kullanılır.",
+                "dedup_mode": "Özdeş girişler:",
+                "dedup_copy": "Kopyala",
+                "dedup_link": "Sabit bağ",
+                "tooltip_dedup_mode": "Aynı içerikteki bir giriş için daha önce üretilmiş çıkış kopyalanır veya disk alanı kullanmayan bir sabit bağ oluşturulur.",
+                "job_skipped_unchanged": "{}: değişmedi, atlandı.",
+                "job_skipped_duplicate": "{}: özdeş giriş, önceki çıkış kullanıldı ({}).",
+                "batch_skipped": "{} dosya yeniden işlenmeden tamamlandı.",
+                "mosaic_size": "Mozaik boyutu:",
+                "tooltip_mosaic_size": "Mozaik blok boyutu (piksel)",
+                "engine_mode": "Süreç içi motor (modeli bir kez yükle)",
+                "tooltip_engine_mode": "CenterFace modelini bir kez yükler ve sonraki işlerde yeniden kullanır. Önizleme modu deface komutunu kullanır.",
+                "detection_cache": "Algılamaları önbelleğe al",
+                "tooltip_detection_cache": "Aynı dosya aynı eşikle yeniden işlendiğinde yüz algılama atlanır; yalnızca yöntem veya mozaik boyutu değiştiğinde kayıtlı kutular yeniden çizilir.",
+                "startup_time": "Açılış süresi: {:.0f} ms",
+                "log_line_limit": "Satır sınırı:",
+                "tooltip_log_line_limit": "Ekranda tutulan en fazla günlük satırı. Günlüğün tamamı diske yazılır ve Kaydet ile alınabilir.",
+                "start_process": "İşlemi Başlat",
+                "pause_process": "Duraklat",
+                "resume_process": "Sürdür",
+                "cancel_process": "İptal",
+                "cancel_selected": "Seçilenleri İptal Et",
+                "tooltip_pause_process": "İşlemi bir sonraki karede durdurur; işlemci ve bellek boşa harcanmaz.",
+                "tooltip_cancel_process": "Çalışan ve sıradaki işleri durdurur; yarım kalan çıkışlar silinir.",
+                "process_paused": "İşlem duraklatıldı.",
+                "process_resumed": "İşlem sürdürülüyor.",
+                "process_cancelling": "İptal ediliyor...",
+                "process_cancelled": "İşlem iptal edildi.",
+                "batch_cancelled": "{} iş iptal edildi; toplu iş bir sonraki açılışta sürdürülebilir.",
+                "process_log": "İşlem Günlüğü",
+                "clear": "Temizle",
+                "save": "Kaydet",
+                "process_history": "İşlem Geçmişi",
+                "clear_history": "Geçmişi Temizle",
+                "history_search": "Dosya adında ara...",
+                "history_page": "{} / {} ({} kayıt)",
+                "history_keep": "Sakla:",
+                "history_entries_suffix": " kayıt",
+                "history_days_suffix": " gün",
+                "unlimited": "Sınırsız",
+                "tooltip_history_keep": "Bu sayıyı veya yaşı aşan en eski geçmiş kayıtları silinir",
+                "file_menu": "Dosya",
+                "open": "Aç",
+                "language": "Dil",
+                "turkish": "Türkçe",
+                "english": "English",
+                "exit": "Çıkış",
+                "help_menu": "Yardım",
+                "about": "Hakkında",
+                "success": "Başarılı",
+                "error": "Hata",
+                "warning": "Uyarı",
+                "deface_install_required": "Deface Kurulumu Gerekli",
+                "deface_install_question": "Deface kurulu değil. Şimdi kurmak ister misiniz?",
+                "deface_install_info": "Kurulum için yönetici parolası istenebilir.",
+                "installing_deface": "Deface kuruluyor, lütfen bekleyin...",
+                "deface_installed_success": "Deface başarıyla kuruldu.",
+                "deface_install_success_restart": "Deface kuruldu. Lütfen uygulamayı yeniden başlatın.",
+                "deface_install_failed": "Deface kurulamadı. Lütfen elle kurun: pip install deface",
+                "deface_required_warning": "Deface olmadan işlem yapılamaz.",
+                "deface_not_found": "deface komutu bulunamadı.",
+                "save_log_title": "Günlüğü Kaydet",
+                "text_files": "Metin Dosyaları (*.txt)",
+                "log_saved": "Günlük kaydedildi.",
+                "video_image_files": "Video ve Resim Dosyaları (*.mp4 *.avi *.mov *.mkv *.jpg *.jpeg *.png *.bmp)",
+                "video_files": "Video Dosyaları (*.mp4 *.avi *.mov *.mkv)",
+                "image_files": "Resim Dosyaları (*.jpg *.jpeg *.png *.bmp)",
+                "select_valid_input": "Lütfen geçerli bir giriş dosyası seçin.",
+                "select_output": "Lütfen bir çıkış yolu belirtin.",
+                "process_starting": "İşlem başlatılıyor...",
+                "command": "Komut: {}",
+                "engine_loading": "Model yükleniyor ({})...",
+                "engine_processing": "İşleniyor: {}",
+                "job_queue": "İş Kuyruğu",
+                "add_files": "Dosya Ekle",
+                "add_folder": "Klasör Ekle",
+                "clear_queue": "Kuyruğu Temizle",
+                "queue_file": "Dosya",
+                "queue_status": "Durum",
+                "status_queued": "Sırada",
+                "status_running": "İşleniyor",
+                "status_done": "Tamamlandı",
+                "status_skipped": "Atlandı",
+                "status_failed": "Başarısız",
+                "status_cancelled": "İptal edildi",
+                "status_paused": "Duraklatıldı",
+                "video_segments": "Video parçaları:",
+                "tooltip_video_segments": "Tek bir uzun videoyu anahtar karelerden bu kadar parçaya böler, parçaları paralel işler ve yeniden kodlamadan birleştirir. 1 kapalıdır.",
+                "segment_splitting": "Video {} parçaya bölünüyor...",
+                "segment_done": "Parça {}/{} tamamlandı ({:.1f} sn)",
+                "segment_failed": "Parça {} başarısız: {}",
+                "worker_count": "İşçi sayısı:",
+                "tooltip_worker_count": "Aynı anda çalışan işçi süreci sayısı (varsayılan: CPU sayısı)",
+                "thread_budget": "İş parçacığı bütçesi:",
+                "thread_budget_all": "Tüm çekirdekler",
+                "tooltip_thread_budget": "Tüm işçilerin birlikte kullanacağı toplam iş parçacığı sayısı. Etkin işçilere eşit bölünür ve her işçide ONNX Runtime, OpenCV ve ffmpeg bu payla sınırlanır; böylece eşzamanlı işler makineyi aşırı yüklemez.",
+                "cpu_list": "Çekirdekler:",
+                "cpu_list_placeholder": "tümü (ör. 0-3,6)",
+                "tooltip_cpu_list": "İşçi süreçleri yalnızca bu çekirdeklerde çalışır. Boş bırakılırsa tüm çekirdekler kullanılır.",
+                "pin_workers": "İşçileri çekirdeklere bağla",
+                "tooltip_pin_workers": "Her işçi süreci çekirdeklerin ayrı bir dilimine bağlanır.",
+                "nice_level": "Öncelik (nice):",
+                "tooltip_nice_level": "İşçi süreçlerinin ve ffmpeg'in işlemci önceliği. Yüksek değer, makineyi paylaşan diğer hizmetlere öncelik verir. 0 değiştirmez.",
+                "io_priority": "Disk önceliği:",
+                "io_priority_normal": "Normal",
+                "io_priority_low": "Düşük",
+                "io_priority_idle": "Yalnızca boştayken",
+                "tooltip_io_priority": "İşçi süreçlerinin disk önceliği (ionice). Düşük: best-effort sınıfının en düşük düzeyi; yalnızca boştayken: disk başka iş yokken kullanılır.",
+                "invalid_cpu_list": "Geçersiz çekirdek listesi: {}",
+                "profile_jobs": "İşleri profille (cProfile)",
+                "tooltip_profile_jobs": "Her iş için bir cProfile dökümü kaydeder; snakeviz veya pstats ile incelenebilir",
+                "profile_saved": "Profil kaydedildi: {}",
+                "job_details": "İş Ayrıntıları",
+                "metric_stage": "Aşama",
+                "metric_seconds": "Toplam (sn)",
+                "metric_calls": "Çağrı",
+                "metric_mean": "Ortalama (ms)",
+                "metric_counters": "Kare: {} · Yüz: {} · Okunan: {} · Yazılan: {}",
+                "no_metrics": "Bu iş için ölçüm yok.",
+                "export_metrics": "Ölçümleri Dışa Aktar",
+                "prometheus_files": "Prometheus metin dosyaları (*.prom);;Tüm dosyalar (*)",
+                "metrics_exported": "Ölçümler dışa aktarıldı: {}",
+                "resume_title": "Yarım Kalan İşler",
+                "resume_question": "Önceki oturumda yarıda kalan bir toplu iş var ({} / {} dosya bekliyor).\nKaldığı yerden sürdürülsün mü?",
+                "batch_resumed": "Yarım kalan toplu iş sürdürülüyor: {} dosya bekliyor.",
+                "watch_folders": "Klasör İzleme",
+                "add_watch_folder": "Klasör Ekle",
+                "remove_watch_folder": "Kaldır",
+                "start_watch": "İzlemeyi Başlat",
+                "stop_watch": "İzlemeyi Durdur",
+                "watch_output_title": "Çıkış kökü seçin (iptal: dosyaların yanına yaz)",
+                "watch_next_to_input": "dosyaların yanına",
+                "tooltip_watch_folders": "Klasöre yeni düşen medya dosyaları yazılması bitince, klasör eklenirken seçili olan ayarlarla işlenir",
+                "watch_started": "{} klasör izleniyor ({}).",
+                "watch_stopping": "İzleme durduruluyor, süren işler tamamlanıyor...",
+                "watch_stopped": "Klasör izleme durdu.",
+                "watch_queued": "İzleme: {} kuyruğa alındı",
+                "watch_done": "İzleme: {} tamamlandı ({:.1f} sn)",
+                "files_added": "{} dosya kuyruğa eklendi.",
+                "batch_starting": "{} iş {} işçi ile başlatılıyor...",
+                "batch_job_failed": "{}: {}",
+                "batch_progress": "{}/{} dosya - {:.2f} dosya/sn - {:.1f} kare/sn",
+                "status_running_percent": "İşleniyor %{}",
+                "progress_status": "{}/{} kare - {:.1f} kare/sn - Kalan süre: {}",
+                "progress_status_unknown": "{} kare - {:.1f} kare/sn",
+                "batch_completed": "Toplu işlem tamamlandı: {} başarılı, {} başarısız.",
+                "process_completed": "İşlem tamamlandı.",
+                "process_success_msg": "Anonimleştirme başarıyla tamamlandı.",
+                "open_output_question": "Çıkış klasörünü açmak ister misiniz?",
+                "process_error": "Hata: {}",
+                "process_failed": "İşlem başarısız oldu:\n{}",
+                "process_failed_code": "İşlem {} hata koduyla sonlandı.",
+                "about_title": "Hakkında",
+                "version": "Sürüm 1.0.0",
+                "about_subtitle": "Yüz Anonimleştirme Aracı",
+                "features": "Özellikler",
+                "features_text": "• Videolarda ve resimlerde otomatik yüz algılama\n• Bulanıklaştırma, mozaik ve düz kutu yöntemleri\n• Ses koruma\n• Sürükle bırak desteği\n• İşlem geçmişi\n• Türkçe ve İngilizce arayüz",
+                "developer_info": "Geliştirici Bilgileri",
+                "company": "Şirket: ALG Yazılım & Elektronik",
+                "developer": "Geliştirici: Fatih ÖNDER (CekToR)",
+                "designer": "Tasarım: A. Serhet KILIÇOĞLU (Shampuan)",
+                "license_info": "Lisans",
+                "license_text": "ALG Software & Electronics Yazılım Lisansı. Kaynak kodu incelenebilir ve özgün haliyle dağıtılabilir; değiştirilmesi ve ticari kullanımı yasaktır.",
+                "disclaimer": "Bu yazılımın kullanımından doğan sorumluluk kullanıcıya aittir.",
+                "close": "Kapat",
+            },
+            "en": {
+                "window_title": "Deface GUI - Face Anonymization Tool",
+                "main_title": "Deface GUI",
+                "file_selection": "File Selection",
+                "drag_drop": "Drag and drop a file here",
+                "input": "Input:",
+                "output": "Output:",
+                "input_placeholder": "Select a video or image file...",
+                "output_placeholder": "Output file path...",
+                "browse": "Browse",
+                "browse_output": "Save As",
+                "anonymization_options": "Anonymization Options",
+                "method": "Method:",
+                "tooltip_blur": "Blurs the faces",
+                "tooltip_mosaic": "Covers the faces with a mosaic",
+                "tooltip_solid": "Covers the faces with a solid black box",
+                "keep_audio": "Keep audio (videos only)",
+                "tooltip_keep_audio": "The audio stream is copied from the source without re-encoding.",
+                "encoder_preset": "Output quality:",
+                "encoder_preset_fast": "Fast preview",
+                "encoder_preset_balanced": "Balanced",
+                "encoder_preset_archival": "Archival",
+                "tooltip_encoder_preset": "H.264 encoding settings for video output. Fast preview: CRF 28, veryfast; balanced: CRF 23, medium; archival: CRF 18, slow. The fast preset cuts encoding time noticeably at lower quality; archival is slow and produces larger files.",
+                "encoder_threads": "Encoder threads:",
+                "encoder_threads_auto": "Auto",
+                "tooltip_encoder_threads": "Number of threads the ffmpeg encoder uses. In auto mode the job's share of the thread budget in the advanced settings is used.",
+                "preview_mode": "Preview mode",
+                "quick_preview": "Quick Preview",
+                "tooltip_quick_preview": "Decodes a few sample frames from the input and anonymizes only those. The preview refreshes immediately when the threshold, method or mosaic size changes.",
+                "preview_button": "Preview",
+                "preview_frames": "Frames:",
+                "preview_start": "Start:",
+                "preview_window": "Window:",
+                "preview_window_all": "All",
+                "seconds_suffix": " s",
+                "preview_loading": "Preparing sample frames...",
+                "preview_status": "{} frames, {} faces, {:.0f} ms",
+                "preview_caption": "{} · {} faces",
+                "preview_error": "Preview error: {}",
+                "advanced_settings": "Advanced Settings",
+                "detection_threshold": "Detection threshold:",
+                "tooltip_threshold": "Lower values detect more faces but may add false positives",
+                "detect_interval": "Detection interval (frames):",
+                "tooltip_detect_interval": "Fast video mode: faces are detected every N frames and on scene changes, boxes for the frames in between are interpolated with a safety margin. 1 detects on every frame.",
+                "detection_size": "Detection size:",
+                "detection_size_native": "Full resolution",
+                "detection_size_auto": "Automatic",
+                "tooltip_detection_size": "Faces are searched on a copy whose long side is resized to this size; anonymization is applied at full resolution. Automatic mode resizes inputs larger than Full HD to {} pixels. Much faster when faces are large in the frame; small faces may be missed.",
+                "tile_threshold": "Tiled mode above:",
+                "time_ranges": "Time ranges:",
+                "time_ranges_placeholder": "Whole video (e.g. 0:30-2:15, 1:10:00-)",
+                "tooltip_time_ranges": "Only these parts of videos are processed; the rest is copied without re-encoding. Ranges are widened to the nearest keyframes. A range with no end runs to the end of the video.",
+                "invalid_time_ranges": "Invalid time range: {}",
+                "roi": "Region of interest:",
+                "roi_draw": "Draw...",
+                "roi_load_mask": "Load Mask...",
+                "roi_none": "Whole frame",
+                "roi_rects": "{} rectangles",
+                "roi_mask_name": "mask: {}",
+                "tooltip_roi": "Faces are searched only inside the drawn rectangles or the non-black pixels of the mask. Reduces the processed area for fixed camera views.",
+                "roi_dialog_title": "Draw Region of Interest",
+                "roi_dialog_hint": "Drag with the mouse to draw the regions to search for faces. Faces outside the region are not anonymized.",
+                "ok": "OK",
+                "tile_threshold_off": "Off",
+                "tooltip_tile_threshold": "Images above this pixel count are scanned in overlapping tiles in parallel and faces are anonymized one by one, so memory use stays bounded regardless of image size. Uncompressed TIFF files are memory-mapped.",
+                "batch_size": "Image batch size:",
+                "tooltip_batch_size": "Queued photos that fall on the same model input size are grouped by this many into a single forward pass. Decoding runs ahead and writing in the background. 1 disables it.",
+                "skip_unchanged": "Skip unchanged files",
+                "tooltip_skip_unchanged": "Files whose content and options are unchanged and whose output is still in place are not processed again. Inputs with identical content reuse the earlier output.",
+                "dedup_mode": "Identical inputs:",
+                "dedup_copy": "Copy",
+                "dedup_link": "Hard link",
+                "tooltip_dedup_mode": "For an input with the same content, the earlier output is copied or hard-linked without using extra disk space.",
+                "job_skipped_unchanged": "{}: unchanged, skipped.",
+                "job_skipped_duplicate": "{}: identical input, reused earlier output ({}).",
+                "batch_skipped": "{} files completed without reprocessing.",
+                "mosaic_size": "Mosaic size:",
+                "tooltip_mosaic_size": "Mosaic block size (pixels)",
+                "engine_mode": "In-process engine (load model once)",
+                "tooltip_engine_mode": "Loads the CenterFace model once and reuses it for later jobs. Preview mode uses the deface command.",
+                "detection_cache": "Cache detections",
+                "tooltip_detection_cache": "Skips face detection when the same file is processed again with the same threshold; changing only the method or mosaic size redraws the stored boxes.",
+                "startup_time": "Startup time: {:.0f} ms",
+                "log_line_limit": "Line limit:",
+                "tooltip_log_line_limit": "Maximum number of log lines kept on screen. The full log is written to disk and can be exported with Save.",
+                "start_process": "Start Processing",
+                "pause_process": "Pause",
+                "resume_process": "Resume",
+                "cancel_process": "Cancel",
+                "cancel_selected": "Cancel Selected",
+                "tooltip_pause_process": "Stops processing at the next frame without spending CPU or memory.",
+                "tooltip_cancel_process": "Stops running and queued jobs; partial outputs are removed.",
+                "process_paused": "Processing paused.",
+                "process_resumed": "Processing resumed.",
+                "process_cancelling": "Cancelling...",
+                "process_cancelled": "Processing cancelled.",
+                "batch_cancelled": "{} jobs cancelled; the batch can be resumed at next launch.",
+                "process_log": "Process Log",
+                "clear": "Clear",
+                "save": "Save",
+                "process_history": "Process History",
+                "clear_history": "Clear History",
+                "history_search": "Search file names...",
+                "history_page": "{} / {} ({} entries)",
+                "history_keep": "Keep:",
+                "history_entries_suffix": " entries",
+                "history_days_suffix": " days",
+                "unlimited": "Unlimited",
+                "tooltip_history_keep": "The oldest history entries beyond this count or age are deleted",
+                "file_menu": "File",
+                "open": "Open",
+                "language": "Language",
+                "turkish": "Türkçe",
+                "english": "English",
+                "exit": "Exit",
+                "help_menu": "Help",
+                "about": "About",
+                "success": "Success",
+                "error": "Error",
+                "warning": "Warning",
+                "deface_install_required": "Deface Installation Required",
+                "deface_install_question": "Deface is not installed. Do you want to install it now?",
+                "deface_install_info": "An administrator password may be requested.",
+                "installing_deface": "Installing deface, please wait...",
+                "deface_installed_success": "Deface was installed successfully.",
+                "deface_install_success_restart": "Deface was installed. Please restart the application.",
+                "deface_install_failed": "Deface could not be installed. Please install it manually: pip install deface",
+                "deface_required_warning": "Processing is not possible without deface.",
+                "deface_not_found": "The deface command was not found.",
+                "save_log_title": "Save Log",
+                "text_files": "Text Files (*.txt)",
+                "log_saved": "Log saved.",
+                "video_image_files": "Video and Image Files (*.mp4 *.avi *.mov *.mkv *.jpg *.jpeg *.png *.bmp)",
+                "video_files": "Video Files (*.mp4 *.avi *.mov *.mkv)",
+                "image_files": "Image Files (*.jpg *.jpeg *.png *.bmp)",
+                "select_valid_input": "Please select a valid input file.",
+                "select_output": "Please specify an output path.",
+                "process_starting": "Starting process...",
+                "command": "Command: {}",
+                "engine_loading": "Loading model ({})...",
+                "engine_processing": "Processing: {}",
+                "job_queue": "Job Queue",
+                "add_files": "Add Files",
+                "add_folder": "Add Folder",
+                "clear_queue": "Clear Queue",
+                "queue_file": "File",
+                "queue_status": "Status",
+                "status_queued": "Queued",
+                "status_running": "Running",
+                "status_done": "Done",
+                "status_skipped": "Skipped",
+                "status_failed": "Failed",
+                "status_cancelled": "Cancelled",
+                "status_paused": "Paused",
+                "video_segments": "Video segments:",
+                "tooltip_video_segments": "Splits a single long video into this many parts at keyframes, processes them in parallel and joins them without re-encoding. 1 disables it.",
+                "segment_splitting": "Splitting video into {} segments...",
+                "segment_done": "Segment {}/{} done ({:.1f} s)",
+                "segment_failed": "Segment {} failed: {}",
+                "worker_count": "Worker count:",
+                "tooltip_worker_count": "Number of worker processes running at once (default: CPU count)",
+                "thread_budget": "Thread budget:",
+                "thread_budget_all": "All cores",
+                "tooltip_thread_budget": "Total number of threads all workers may use together. It is split evenly across the active workers, and ONNX Runtime, OpenCV and ffmpeg in each worker are limited to that share, so concurrent jobs do not oversubscribe the machine.",
+                "cpu_list": "CPUs:",
+                "cpu_list_placeholder": "all (e.g. 0-3,6)",
+                "tooltip_cpu_list": "Worker processes only run on these CPUs. Leave empty to use every CPU.",
+                "pin_workers": "Pin workers to CPUs",
+                "tooltip_pin_workers": "Each worker process is pinned to its own slice of the CPUs.",
+                "nice_level": "Priority (nice):",
+                "tooltip_nice_level": "CPU priority of the worker processes and ffmpeg. Higher values give way to other services sharing the machine. 0 leaves it unchanged.",
+                "io_priority": "Disk priority:",
+                "io_priority_normal": "Normal",
+                "io_priority_low": "Low",
+                "io_priority_idle": "Idle only",
+                "tooltip_io_priority": "Disk priority of the worker processes (ionice). Low: lowest level of the best-effort class; idle only: the disk is used only when nothing else needs it.",
+                "invalid_cpu_list": "Invalid CPU list: {}",
+                "profile_jobs": "Profile jobs (cProfile)",
+                "tooltip_profile_jobs": "Saves a cProfile dump for every job; inspect it with snakeviz or pstats",
+                "profile_saved": "Profile saved: {}",
+                "job_details": "Job Details",
+                "metric_stage": "Stage",
+                "metric_seconds": "Total (s)",
+                "metric_calls": "Calls",
+                "metric_mean": "Mean (ms)",
+                "metric_counters": "Frames: {} · Faces: {} · Read: {} · Written: {}",
+                "no_metrics": "No metrics for this job.",
+                "export_metrics": "Export Metrics",
+                "prometheus_files": "Prometheus text files (*.prom);;All files (*)",
+                "metrics_exported": "Metrics exported: {}",
+                "resume_title": "Unfinished Jobs",
+                "resume_question": "A batch from the previous session was interrupted ({} of {} files pending).\nResume where it stopped?",
+                "batch_resumed": "Resuming interrupted batch: {} files pending.",
+                "watch_folders": "Watch Folders",
+                "add_watch_folder": "Add Folder",
+                "remove_watch_folder": "Remove",
+                "start_watch": "Start Watching",
+                "stop_watch": "Stop Watching",
+                "watch_output_title": "Select output root (cancel: write next to inputs)",
+                "watch_next_to_input": "next to inputs",
+                "tooltip_watch_folders": "New media files dropped into a folder are processed once fully written, with the settings selected when the folder was added",
+                "watch_started": "Watching {} folders ({}).",
+                "watch_stopping": "Stopping watch, finishing running jobs...",
+                "watch_stopped": "Folder watching stopped.",
+                "watch_queued": "Watch: {} queued",
+                "watch_done": "Watch: {} finished ({:.1f} s)",
+                "files_added": "{} files added to the queue.",
+                "batch_starting": "Starting {} jobs with {} workers...",
+                "batch_job_failed": "{}: {}",
+                "batch_progress": "{}/{} files - {:.2f} files/s - {:.1f} fps",
+                "status_running_percent": "Running {}%",
+                "progress_status": "{}/{} frames - {:.1f} fps - ETA: {}",
+                "progress_status_unknown": "{} frames - {:.1f} fps",
+                "batch_completed": "Batch completed: {} succeeded, {} failed.",
+                "process_completed": "Process completed.",
+                "process_success_msg": "Anonymization completed successfully.",
+                "open_output_question": "Do you want to open the output folder?",
+                "process_error": "Error: {}",
+                "process_failed": "Process failed:\n{}",
+                "process_failed_code": "Process exited with code {}.",
+                "about_title": "About",
+                "version": "Version 1.0.0",
+                "about_subtitle": "Face Anonymization Tool",
+                "features": "Features",
+                "features_text": "• Automatic face detection in videos and images\n• Blur, mosaic and solid box methods\n• Audio preservation\n• Drag and drop support\n• Process history\n• Turkish and English interface",
+                "developer_info": "Developer Information",
+                "company": "Company: ALG Software & Electronics",
+                "developer": "Developer: Fatih ÖNDER (CekToR)",
+                "designer": "Design: A. Serhet KILIÇOĞLU (Shampuan)",
+                "license_info": "License",
+                "license_text": "ALG Software & Electronics Software License. The source code may be examined and distributed in its original form; modification and commercial use are prohibited.",
+                "disclaimer": "The user is responsible for any use of this software.",
+                "close": "Close",
+            },
+        }
 
-             
-        
         self.setWindowTitle(self.tr("window_title"))
         self.setGeometry(100, 100, 950, 750)
         self.setMinimumSize(750, 550)
@@ -109,51 +958,75 @@ class DefaceGUI(QMainWindow):
         # Ayarlar dosyası
         self.settings_file = os.path.expanduser("~/.deface_gui_settings.json")
         self.load_settings()
-        
-        # Deface kurulum kontrolü
-        self.check_deface_installation()
+        self.history = defaceengine.HistoryStore()
+        self.migrate_history()
         
         self.init_ui()
+
+        # Deface kurulum kontrolü pencere açıldıktan sonra arka planda yapılır
+        QTimer.singleShot(0, self.check_deface_installation)
+        QTimer.singleShot(0, self.offer_resume)
     
     def check_deface_installation(self):
-        """Deface kurulumunu kontrol eder ve gerekirse run.sh çalıştırır"""
-        if not check_deface_installed():
-            # Deface kurulu değil, kurulum script'ini çalıştır
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Question)
-            msg.setWindowTitle(self.tr("deface_install_required"))
-            msg.setText(self.tr("deface_install_question"))
-            msg.setInformativeText(self.tr("deface_install_info"))
-            msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        """Deface kurulumunu arka planda kontrol eder
+
+        Olumlu sonuç deface komutunun yolu ve değiştirilme zamanıyla birlikte
+        saklanır; komut değişmediği sürece sonraki açılışlarda yeniden
+        denetlenmez.
+        """
+        signature = deface_executable_signature()
+        if signature is not None and self.file_settings.get("deface_check") == signature:
+            return
+        self.deface_checker = DefaceCheckWorker()
+        self.deface_checker.result.connect(self.deface_check_finished)
+        self.deface_checker.start()
+
+    def deface_check_finished(self, installed):
+        """Kontrol sonucunu saklar, deface yoksa kurulum önerir"""
+        if installed:
+            signature = deface_executable_signature()
+            if signature is not None:
+                self.file_settings["deface_check"] = signature
+                self.save_file_settings()
+            return
+        self.file_settings.pop("deface_check", None)
+
+        # Deface kurulu değil, kurulum script'ini çalıştır
+        msg = QMessageBox()
+        msg.setIcon(QMessageBox.Question)
+        msg.setWindowTitle(self.tr("deface_install_required"))
+        msg.setText(self.tr("deface_install_question"))
+        msg.setInformativeText(self.tr("deface_install_info"))
+        msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        
+        if msg.exec_() == QMessageBox.Yes:
+            # Kurulum progress dialogı göster
+            progress = QProgressDialog(self.tr("installing_deface"), None, 0, 0, self)
+            progress.setWindowModality(Qt.WindowModal)
+            progress.show()
+            QApplication.processEvents()
             
-            if msg.exec_() == QMessageBox.Yes:
-                # Kurulum progress dialogı göster
-                progress = QProgressDialog(self.tr("installing_deface"), None, 0, 0, self)
-                progress.setWindowModality(Qt.WindowModal)
-                progress.show()
-                QApplication.processEvents()
-                
-                # Bağımlılıkları kur
-                if install_dependencies():
-                    progress.close()
-                    # Kurulum sonrası tekrar kontrol et
+            # Bağımlılıkları kur
+            if install_dependencies():
+                progress.close()
+                # Kurulum sonrası tekrar kontrol et
+                if check_deface_installed():
+                    QMessageBox.information(self, self.tr("success"), self.tr("deface_installed_success"))
+                else:
+                    # PATH'i yenile ve tekrar dene
+                    user_bin = os.path.expanduser("~/.local/bin")
+                    if user_bin not in os.environ.get("PATH", ""):
+                        os.environ["PATH"] = user_bin + ":" + os.environ.get("PATH", "")
+                    
                     if check_deface_installed():
                         QMessageBox.information(self, self.tr("success"), self.tr("deface_installed_success"))
                     else:
-                        # PATH'i yenile ve tekrar dene
-                        user_bin = os.path.expanduser("~/.local/bin")
-                        if user_bin not in os.environ.get("PATH", ""):
-                            os.environ["PATH"] = user_bin + ":" + os.environ.get("PATH", "")
-                        
-                        if check_deface_installed():
-                            QMessageBox.information(self, self.tr("success"), self.tr("deface_installed_success"))
-                        else:
-                            QMessageBox.information(self, self.tr("success"), self.tr("deface_install_success_restart"))
-                else:
-                    progress.close()
-                    QMessageBox.critical(self, self.tr("error"), self.tr("deface_install_failed"))
+                        QMessageBox.information(self, self.tr("success"), self.tr("deface_install_success_restart"))
             else:
-                QMessageBox.warning(self, self.tr("warning"), self.tr("deface_required_warning"))
+                progress.close()
+                QMessageBox.critical(self, self.tr("error"), self.tr("deface_install_failed"))
+        else:
+            QMessageBox.warning(self, self.tr("warning"), self.tr("deface_required_warning"))
         
     def tr(self, key):
         return self.translations[self.current_language].get(key, key)
@@ -168,8 +1041,19 @@ class DefaceGUI(QMainWindow):
         left_panel = QVBoxLayout()
         left_panel.setSpacing(15)
         left_panel.setContentsMargins(20, 20, 10, 20)
-        
-     
+
+        # Başlık
+        header_layout = QHBoxLayout()
+        logo_label = QLabel()
+        icon_path = "/usr/share/pixmaps/defaceguilo.png"
+        if os.path.exists(icon_path):
+            pixmap = QPixmap(icon_path)
+            logo_label.setPixmap(pixmap.scaled(48, 48, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        header_layout.addWidget(logo_label)
+        self.title_label = QLabel(self.tr("main_title"))
+        self.title_label.setStyleSheet("font-size: 22px; font-weight: bold; color: #0078d4;")
+        header_layout.addWidget(self.title_label)
+        header_layout.addStretch()
         left_panel.addLayout(header_layout)
         
         # Dosya seçimi grubu
@@ -216,6 +1100,70 @@ class DefaceGUI(QMainWindow):
         file_layout.addLayout(output_layout)
         
         left_panel.addWidget(self.file_group)
+
+        # İş kuyruğu
+        self.jobs = []
+        self.shown_metrics = None
+        self.job_store = None
+        self.store_batch = None
+        self.resume_batch = None
+        self.queue_group = QGroupBox(self.tr("job_queue"))
+        queue_layout = QVBoxLayout(self.queue_group)
+
+        self.queue_table = QTableWidget(0, 2)
+        self.queue_table.setHorizontalHeaderLabels([self.tr("queue_file"), self.tr("queue_status")])
+        self.queue_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.queue_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        self.queue_table.verticalHeader().setVisible(False)
+        self.queue_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.queue_table.currentCellChanged.connect(lambda row, *_: self.show_job_details(row))
+        self.queue_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.queue_table.setMinimumHeight(120)
+        queue_layout.addWidget(self.queue_table)
+
+        queue_controls = QHBoxLayout()
+        self.add_files_btn = QPushButton(self.tr("add_files"))
+        self.add_files_btn.clicked.connect(self.browse_queue_files)
+        self.add_folder_btn = QPushButton(self.tr("add_folder"))
+        self.add_folder_btn.clicked.connect(self.browse_queue_folder)
+        self.clear_queue_btn = QPushButton(self.tr("clear_queue"))
+        self.clear_queue_btn.clicked.connect(self.clear_queue)
+        self.cancel_selected_btn = QPushButton(self.tr("cancel_selected"))
+        self.cancel_selected_btn.clicked.connect(self.cancel_selected_jobs)
+        self.cancel_selected_btn.setEnabled(False)
+        queue_controls.addWidget(self.add_files_btn)
+        queue_controls.addWidget(self.add_folder_btn)
+        queue_controls.addWidget(self.clear_queue_btn)
+        queue_controls.addWidget(self.cancel_selected_btn)
+        queue_controls.addStretch()
+        queue_layout.addLayout(queue_controls)
+
+        self.throughput_label = QLabel("")
+        queue_layout.addWidget(self.throughput_label)
+
+        left_panel.addWidget(self.queue_group)
+
+        # Klasör izleme
+        self.watch_worker = None
+        self.watch_group = QGroupBox(self.tr("watch_folders"))
+        self.watch_group.setToolTip(self.tr("tooltip_watch_folders"))
+        watch_layout = QVBoxLayout(self.watch_group)
+        self.watch_list = QListWidget()
+        self.watch_list.setMaximumHeight(80)
+        watch_layout.addWidget(self.watch_list)
+        watch_controls = QHBoxLayout()
+        self.add_watch_btn = QPushButton(self.tr("add_watch_folder"))
+        self.add_watch_btn.clicked.connect(self.add_watch_folder)
+        self.remove_watch_btn = QPushButton(self.tr("remove_watch_folder"))
+        self.remove_watch_btn.clicked.connect(self.remove_watch_folder)
+        self.watch_btn = QPushButton(self.tr("start_watch"))
+        self.watch_btn.clicked.connect(self.toggle_watch)
+        watch_controls.addWidget(self.add_watch_btn)
+        watch_controls.addWidget(self.remove_watch_btn)
+        watch_controls.addStretch()
+        watch_controls.addWidget(self.watch_btn)
+        watch_layout.addLayout(watch_controls)
+        left_panel.addWidget(self.watch_group)
         
         # Seçenekler grubu
         self.options_group = QGroupBox(self.tr("anonymization_options"))
@@ -233,15 +1181,70 @@ class DefaceGUI(QMainWindow):
         method_layout.addWidget(self.method_combo)
         method_layout.addStretch()
         options_layout.addLayout(method_layout)
+
+        # Video çıkışı kodlama ön ayarı ve kodlayıcı iş parçacıkları
+        encoder_layout = QHBoxLayout()
+        self.encoder_preset_label = QLabel(self.tr("encoder_preset"))
+        encoder_layout.addWidget(self.encoder_preset_label)
+        self.encoder_preset = QComboBox()
+        for preset in defaceengine.ENCODER_PRESETS:
+            self.encoder_preset.addItem(self.tr("encoder_preset_" + preset), preset)
+        self.encoder_preset.setCurrentIndex(self.encoder_preset.findData(defaceengine.DEFAULT_ENCODER_PRESET))
+        self.encoder_preset.setToolTip(self.tr("tooltip_encoder_preset"))
+        encoder_layout.addWidget(self.encoder_preset)
+        self.encoder_threads_label = QLabel(self.tr("encoder_threads"))
+        encoder_layout.addWidget(self.encoder_threads_label)
+        self.encoder_threads = QSpinBox()
+        self.encoder_threads.setRange(0, 64)
+        self.encoder_threads.setSpecialValueText(self.tr("encoder_threads_auto"))
+        self.encoder_threads.setToolTip(self.tr("tooltip_encoder_threads"))
+        encoder_layout.addWidget(self.encoder_threads)
+        encoder_layout.addStretch()
+        options_layout.addLayout(encoder_layout)
         
         # Ses koruma
         self.keep_audio = QCheckBox(self.tr("keep_audio"))
         self.keep_audio.setChecked(True)
+        self.keep_audio.setToolTip(self.tr("tooltip_keep_audio"))
         options_layout.addWidget(self.keep_audio)
         
         # Önizleme seçeneği
         self.preview_mode = QCheckBox(self.tr("preview_mode"))
         options_layout.addWidget(self.preview_mode)
+
+        # Yalnızca seçilen zaman aralıkları işlenir
+        ranges_layout = QHBoxLayout()
+        self.time_ranges_label = QLabel(self.tr("time_ranges"))
+        ranges_layout.addWidget(self.time_ranges_label)
+        self.time_ranges = []
+        self.time_ranges_edit = QLineEdit()
+        self.time_ranges_edit.setPlaceholderText(self.tr("time_ranges_placeholder"))
+        self.time_ranges_edit.setToolTip(self.tr("tooltip_time_ranges"))
+        self.time_ranges_edit.editingFinished.connect(lambda: self.check_time_ranges(warn=False))
+        ranges_layout.addWidget(self.time_ranges_edit)
+        options_layout.addLayout(ranges_layout)
+
+        # Algılama yalnızca ilgi bölgesinde yapılır
+        roi_layout = QHBoxLayout()
+        self.roi_label = QLabel(self.tr("roi"))
+        roi_layout.addWidget(self.roi_label)
+        self.roi_rects = []
+        self.roi_mask_path = ""
+        self.roi_draw_btn = QPushButton(self.tr("roi_draw"))
+        self.roi_draw_btn.clicked.connect(self.draw_roi)
+        roi_layout.addWidget(self.roi_draw_btn)
+        self.roi_mask_btn = QPushButton(self.tr("roi_load_mask"))
+        self.roi_mask_btn.clicked.connect(self.load_roi_mask)
+        roi_layout.addWidget(self.roi_mask_btn)
+        self.roi_clear_btn = QPushButton(self.tr("clear"))
+        self.roi_clear_btn.clicked.connect(lambda: self.set_roi([], ""))
+        roi_layout.addWidget(self.roi_clear_btn)
+        self.roi_summary = QLabel(self.tr("roi_none"))
+        roi_layout.addWidget(self.roi_summary)
+        roi_layout.addStretch()
+        for widget in (self.roi_label, self.roi_draw_btn, self.roi_mask_btn, self.roi_summary):
+            widget.setToolTip(self.tr("tooltip_roi"))
+        options_layout.addLayout(roi_layout)
         
         left_panel.addWidget(self.options_group)
         
@@ -261,6 +1264,77 @@ class DefaceGUI(QMainWindow):
         thresh_layout.addWidget(self.threshold_spin)
         thresh_layout.addStretch()
         advanced_layout.addLayout(thresh_layout)
+
+        # Hızlı video modu: anahtar kare aralığı
+        interval_layout = QHBoxLayout()
+        self.interval_label = QLabel(self.tr("detect_interval"))
+        interval_layout.addWidget(self.interval_label)
+        self.detect_interval = QSpinBox()
+        self.detect_interval.setRange(1, 30)
+        self.detect_interval.setValue(1)
+        self.detect_interval.setToolTip(self.tr("tooltip_detect_interval"))
+        interval_layout.addWidget(self.detect_interval)
+        interval_layout.addStretch()
+        advanced_layout.addLayout(interval_layout)
+
+        # Küçültülmüş kopyada algılama
+        detection_size_layout = QHBoxLayout()
+        self.detection_size_label = QLabel(self.tr("detection_size"))
+        detection_size_layout.addWidget(self.detection_size_label)
+        self.detection_size = QComboBox()
+        self.detection_size.addItem(self.tr("detection_size_native"), defaceengine.DETECTION_SIZE_NATIVE)
+        self.detection_size.addItem(self.tr("detection_size_auto"), defaceengine.DETECTION_SIZE_AUTO)
+        for size in (640, 960, 1280, 1920):
+            self.detection_size.addItem(f"{size} px", size)
+        self.detection_size.setToolTip(
+            self.tr("tooltip_detection_size").format(defaceengine.AUTO_DETECTION_SIZE))
+        detection_size_layout.addWidget(self.detection_size)
+        detection_size_layout.addStretch()
+        advanced_layout.addLayout(detection_size_layout)
+
+        # Çok büyük görüntüler için karo modu eşiği (megapiksel)
+        tile_layout = QHBoxLayout()
+        self.tile_threshold_label = QLabel(self.tr("tile_threshold"))
+        tile_layout.addWidget(self.tile_threshold_label)
+        self.tile_threshold = QSpinBox()
+        self.tile_threshold.setRange(0, 100000)
+        self.tile_threshold.setSingleStep(10)
+        self.tile_threshold.setSuffix(" MP")
+        self.tile_threshold.setSpecialValueText(self.tr("tile_threshold_off"))
+        self.tile_threshold.setValue(defaceengine.DEFAULT_TILE_MIN_PIXELS // 1_000_000)
+        self.tile_threshold.setToolTip(self.tr("tooltip_tile_threshold"))
+        tile_layout.addWidget(self.tile_threshold)
+        tile_layout.addStretch()
+        advanced_layout.addLayout(tile_layout)
+
+        # Fotoğraflar için toplu çıkarım
+        batch_layout = QHBoxLayout()
+        self.batch_size_label = QLabel(self.tr("batch_size"))
+        batch_layout.addWidget(self.batch_size_label)
+        self.batch_size = QSpinBox()
+        self.batch_size.setRange(1, 64)
+        self.batch_size.setValue(defaceengine.DEFAULT_BATCH_SIZE)
+        self.batch_size.setToolTip(self.tr("tooltip_batch_size"))
+        batch_layout.addWidget(self.batch_size)
+        batch_layout.addStretch()
+        advanced_layout.addLayout(batch_layout)
+
+        # Tekrarlanan çalıştırmalarda değişmeyen dosyaları atla
+        dedup_layout = QHBoxLayout()
+        self.skip_unchanged = QCheckBox(self.tr("skip_unchanged"))
+        self.skip_unchanged.setChecked(True)
+        self.skip_unchanged.setToolTip(self.tr("tooltip_skip_unchanged"))
+        dedup_layout.addWidget(self.skip_unchanged)
+        self.dedup_label = QLabel(self.tr("dedup_mode"))
+        dedup_layout.addWidget(self.dedup_label)
+        self.dedup_mode = QComboBox()
+        self.dedup_mode.addItem(self.tr("dedup_copy"), "copy")
+        self.dedup_mode.addItem(self.tr("dedup_link"), "link")
+        self.dedup_mode.setToolTip(self.tr("tooltip_dedup_mode"))
+        self.skip_unchanged.toggled.connect(self.dedup_mode.setEnabled)
+        dedup_layout.addWidget(self.dedup_mode)
+        dedup_layout.addStretch()
+        advanced_layout.addLayout(dedup_layout)
         
         # Mozaik boyutu
         mosaic_layout = QHBoxLayout()
@@ -273,19 +1347,129 @@ class DefaceGUI(QMainWindow):
         mosaic_layout.addWidget(self.mosaic_size)
         mosaic_layout.addStretch()
         advanced_layout.addLayout(mosaic_layout)
-        
+
+        # Süreç içi motor
+        self.engine_mode = QCheckBox(self.tr("engine_mode"))
+        self.engine_mode.setChecked(True)
+        self.engine_mode.setToolTip(self.tr("tooltip_engine_mode"))
+        advanced_layout.addWidget(self.engine_mode)
+
+        # Algılama önbelleği
+        self.detection_cache = QCheckBox(self.tr("detection_cache"))
+        self.detection_cache.setChecked(True)
+        self.detection_cache.setToolTip(self.tr("tooltip_detection_cache"))
+        advanced_layout.addWidget(self.detection_cache)
+
+        # Uzun videolar için paralel parça sayısı
+        segments_layout = QHBoxLayout()
+        self.segments_label = QLabel(self.tr("video_segments"))
+        segments_layout.addWidget(self.segments_label)
+        self.segments = QSpinBox()
+        self.segments.setRange(1, 64)
+        self.segments.setValue(1)
+        self.segments.setToolTip(self.tr("tooltip_video_segments"))
+        segments_layout.addWidget(self.segments)
+        segments_layout.addStretch()
+        advanced_layout.addLayout(segments_layout)
+
+        # İşçi sayısı
+        workers_layout = QHBoxLayout()
+        self.workers_label = QLabel(self.tr("worker_count"))
+        workers_layout.addWidget(self.workers_label)
+        self.worker_count = QSpinBox()
+        self.worker_count.setRange(1, max(64, defaceengine.default_worker_count()))
+        self.worker_count.setValue(defaceengine.default_worker_count())
+        self.worker_count.setToolTip(self.tr("tooltip_worker_count"))
+        workers_layout.addWidget(self.worker_count)
+        workers_layout.addStretch()
+        advanced_layout.addLayout(workers_layout)
+
+        # İşçiler arasında paylaştırılan işlemci kaynakları
+        governor = self.resource_governor_setting()
+        budget_layout = QHBoxLayout()
+        self.thread_budget_label = QLabel(self.tr("thread_budget"))
+        budget_layout.addWidget(self.thread_budget_label)
+        self.thread_budget = QSpinBox()
+        self.thread_budget.setRange(0, 1024)
+        self.thread_budget.setSpecialValueText(self.tr("thread_budget_all"))
+        self.thread_budget.setValue(governor.thread_budget)
+        self.thread_budget.setToolTip(self.tr("tooltip_thread_budget"))
+        budget_layout.addWidget(self.thread_budget)
+        self.cpu_list_label = QLabel(self.tr("cpu_list"))
+        budget_layout.addWidget(self.cpu_list_label)
+        self.cpu_list = QLineEdit(defaceengine.format_cpu_list(governor.cpus))
+        self.cpu_list.setPlaceholderText(self.tr("cpu_list_placeholder"))
+        self.cpu_list.setToolTip(self.tr("tooltip_cpu_list"))
+        budget_layout.addWidget(self.cpu_list)
+        self.pin_workers = QCheckBox(self.tr("pin_workers"))
+        self.pin_workers.setChecked(governor.pin_workers)
+        self.pin_workers.setToolTip(self.tr("tooltip_pin_workers"))
+        budget_layout.addWidget(self.pin_workers)
+        budget_layout.addStretch()
+        advanced_layout.addLayout(budget_layout)
+
+        priority_layout = QHBoxLayout()
+        self.nice_label = QLabel(self.tr("nice_level"))
+        priority_layout.addWidget(self.nice_label)
+        self.nice_level = QSpinBox()
+        self.nice_level.setRange(0, 19)
+        self.nice_level.setValue(governor.nice)
+        self.nice_level.setToolTip(self.tr("tooltip_nice_level"))
+        priority_layout.addWidget(self.nice_level)
+        self.io_priority_label = QLabel(self.tr("io_priority"))
+        priority_layout.addWidget(self.io_priority_label)
+        self.io_priority = QComboBox()
+        for mode in ("", "low", "idle"):
+            self.io_priority.addItem(self.tr("io_priority_" + (mode or "normal")), mode)
+        self.io_priority.setCurrentIndex(max(0, self.io_priority.findData(governor.ionice)))
+        self.io_priority.setToolTip(self.tr("tooltip_io_priority"))
+        priority_layout.addWidget(self.io_priority)
+        priority_layout.addStretch()
+        advanced_layout.addLayout(priority_layout)
+        defaceengine.set_governor(governor)
+        self.thread_budget.valueChanged.connect(self.set_resource_governor)
+        self.cpu_list.editingFinished.connect(self.set_resource_governor)
+        self.pin_workers.toggled.connect(self.set_resource_governor)
+        self.nice_level.valueChanged.connect(self.set_resource_governor)
+        self.io_priority.currentIndexChanged.connect(self.set_resource_governor)
+
+        # İş başına cProfile dökümü
+        self.profile_jobs = QCheckBox(self.tr("profile_jobs"))
+        self.profile_jobs.setToolTip(self.tr("tooltip_profile_jobs"))
+        advanced_layout.addWidget(self.profile_jobs)
+
         left_panel.addWidget(self.advanced_group)
         
         # İşlem butonu
         self.process_btn = QPushButton(self.tr("start_process"))
         self.process_btn.clicked.connect(self.start_processing)
         self.process_btn.setMinimumHeight(50)
-        left_panel.addWidget(self.process_btn)
+        # Duraklatma ve iptal yalnızca işlem sürerken etkindir
+        self.pause_btn = QPushButton(self.tr("pause_process"))
+        self.pause_btn.setCheckable(True)
+        self.pause_btn.setMinimumHeight(50)
+        self.pause_btn.setToolTip(self.tr("tooltip_pause_process"))
+        self.pause_btn.toggled.connect(self.toggle_pause)
+        self.cancel_btn = QPushButton(self.tr("cancel_process"))
+        self.cancel_btn.setMinimumHeight(50)
+        self.cancel_btn.setToolTip(self.tr("tooltip_cancel_process"))
+        self.cancel_btn.clicked.connect(self.cancel_processing)
+        process_layout = QHBoxLayout()
+        process_layout.addWidget(self.process_btn, 1)
+        process_layout.addWidget(self.pause_btn)
+        process_layout.addWidget(self.cancel_btn)
+        left_panel.addLayout(process_layout)
+        self.set_controls_active(False)
         
         # İlerleme çubuğu
         self.progress = QProgressBar()
         self.progress.setVisible(False)
         left_panel.addWidget(self.progress)
+
+        # İlerleme durumu (kare, hız, kalan süre)
+        self.status_label = QLabel("")
+        self.status_label.setVisible(False)
+        left_panel.addWidget(self.status_label)
         
         left_panel.addStretch()
         
@@ -293,6 +1477,52 @@ class DefaceGUI(QMainWindow):
         right_panel = QVBoxLayout()
         right_panel.setContentsMargins(10, 20, 20, 20)
         
+        # Hızlı önizleme: örnek kareler bir kez çözülür ve algılanır, ayar
+        # değişikliklerinde yalnızca küçük kopyalar yeniden çizilir
+        self.preview_sampler = None
+        self.preview_engine = None
+        self.preview_worker = None
+        self.preview_pending = False
+        self.preview_group = QGroupBox(self.tr("quick_preview"))
+        self.preview_group.setToolTip(self.tr("tooltip_quick_preview"))
+        preview_layout = QVBoxLayout(self.preview_group)
+        preview_controls = QHBoxLayout()
+        self.preview_btn = QPushButton(self.tr("preview_button"))
+        self.preview_btn.clicked.connect(self.update_preview)
+        preview_controls.addWidget(self.preview_btn)
+        self.preview_frames_label = QLabel(self.tr("preview_frames"))
+        preview_controls.addWidget(self.preview_frames_label)
+        self.preview_frames = QSpinBox()
+        self.preview_frames.setRange(1, 12)
+        self.preview_frames.setValue(defaceengine.PREVIEW_FRAMES)
+        preview_controls.addWidget(self.preview_frames)
+        self.preview_start_label = QLabel(self.tr("preview_start"))
+        preview_controls.addWidget(self.preview_start_label)
+        self.preview_start = QDoubleSpinBox()
+        self.preview_start.setRange(0, 86400)
+        self.preview_start.setDecimals(1)
+        self.preview_start.setSuffix(self.tr("seconds_suffix"))
+        preview_controls.addWidget(self.preview_start)
+        self.preview_window_label = QLabel(self.tr("preview_window"))
+        preview_controls.addWidget(self.preview_window_label)
+        self.preview_window = QDoubleSpinBox()
+        self.preview_window.setRange(0, 86400)
+        self.preview_window.setDecimals(1)
+        self.preview_window.setSuffix(self.tr("seconds_suffix"))
+        self.preview_window.setSpecialValueText(self.tr("preview_window_all"))
+        preview_controls.addWidget(self.preview_window)
+        preview_controls.addStretch()
+        preview_layout.addLayout(preview_controls)
+        self.preview_grid = QGridLayout()
+        preview_layout.addLayout(self.preview_grid)
+        self.preview_status = QLabel("")
+        preview_layout.addWidget(self.preview_status)
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(150)
+        self.preview_timer.timeout.connect(self.refresh_preview)
+        right_panel.addWidget(self.preview_group)
+
         # Log alanı
         self.log_group = QGroupBox(self.tr("process_log"))
         log_layout = QVBoxLayout(self.log_group)
@@ -300,26 +1530,67 @@ class DefaceGUI(QMainWindow):
         # Log kontrolleri
         log_controls = QHBoxLayout()
         self.clear_log_btn = QPushButton(self.tr("clear"))
-        self.clear_log_btn.clicked.connect(lambda: self.log_text.clear())
+        self.clear_log_btn.clicked.connect(self.clear_log)
         self.save_log_btn = QPushButton(self.tr("save"))
         self.save_log_btn.clicked.connect(self.save_log)
         log_controls.addWidget(self.clear_log_btn)
         log_controls.addWidget(self.save_log_btn)
         log_controls.addStretch()
+        self.log_lines_label = QLabel(self.tr("log_line_limit"))
+        log_controls.addWidget(self.log_lines_label)
+        self.log_lines = QSpinBox()
+        self.log_lines.setRange(100, 100000)
+        self.log_lines.setSingleStep(1000)
+        self.log_lines.setValue(int(self.settings.value("log_max_lines", 5000)))
+        self.log_lines.setToolTip(self.tr("tooltip_log_line_limit"))
+        self.log_lines.valueChanged.connect(self.set_log_line_limit)
+        log_controls.addWidget(self.log_lines)
         log_layout.addLayout(log_controls)
         
-        self.log_text = QTextEdit()
+        # Satırlar halka tamponda toplanır ve zamanlayıcıyla toplu eklenir
+        self.log_buffer = LogBuffer(self.log_lines.value())
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.log_lines.value())
         log_layout.addWidget(self.log_text)
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(200)
+        self.log_timer.timeout.connect(self.flush_log)
+        self.log_timer.start()
         right_panel.addWidget(self.log_group)
         
-        # İşlem geçmişi
+        # İşlem geçmişi ve seçili işin ayrıntıları yan yana
+        history_row = QHBoxLayout()
         self.history_group = QGroupBox(self.tr("process_history"))
         history_layout = QVBoxLayout(self.history_group)
         
+        # Geçmiş sayfa sayfa okunur; arama yazmayı bitirince uygulanır
+        self.history_page = 0
+        history_search_row = QHBoxLayout()
+        self.history_search = QLineEdit()
+        self.history_search.setPlaceholderText(self.tr("history_search"))
+        self.history_search_timer = QTimer(self)
+        self.history_search_timer.setSingleShot(True)
+        self.history_search_timer.setInterval(250)
+        self.history_search_timer.timeout.connect(self.search_history)
+        self.history_search.textChanged.connect(self.history_search_timer.start)
+        history_search_row.addWidget(self.history_search)
+        self.history_prev_btn = QPushButton("‹")
+        self.history_prev_btn.setMaximumWidth(30)
+        self.history_prev_btn.clicked.connect(lambda: self.change_history_page(-1))
+        self.history_page_label = QLabel("")
+        self.history_next_btn = QPushButton("›")
+        self.history_next_btn.setMaximumWidth(30)
+        self.history_next_btn.clicked.connect(lambda: self.change_history_page(1))
+        history_search_row.addWidget(self.history_prev_btn)
+        history_search_row.addWidget(self.history_page_label)
+        history_search_row.addWidget(self.history_next_btn)
+        history_layout.addLayout(history_search_row)
+
         self.history_list = QListWidget()
         self.history_list.setMaximumHeight(150)
         self.history_list.itemDoubleClicked.connect(self.load_from_history)
+        self.history_list.currentRowChanged.connect(self.show_history_details)
         history_layout.addWidget(self.history_list)
         
         history_controls = QHBoxLayout()
@@ -327,13 +1598,61 @@ class DefaceGUI(QMainWindow):
         self.clear_history_btn.clicked.connect(self.clear_history)
         history_controls.addWidget(self.clear_history_btn)
         history_controls.addStretch()
+        self.history_keep_label = QLabel(self.tr("history_keep"))
+        history_controls.addWidget(self.history_keep_label)
+        self.history_max_entries = QSpinBox()
+        self.history_max_entries.setRange(0, 1000000)
+        self.history_max_entries.setSingleStep(1000)
+        self.history_max_entries.setValue(self.history_max_entries_setting())
+        self.history_max_days = QSpinBox()
+        self.history_max_days.setRange(0, 3650)
+        self.history_max_days.setSingleStep(30)
+        self.history_max_days.setValue(self.history_max_days_setting())
+        for spin in (self.history_max_entries, self.history_max_days):
+            spin.setSpecialValueText(self.tr("unlimited"))
+            spin.setToolTip(self.tr("tooltip_history_keep"))
+            spin.editingFinished.connect(self.set_history_retention)
+            history_controls.addWidget(spin)
+        self.history_max_entries.setSuffix(self.tr("history_entries_suffix"))
+        self.history_max_days.setSuffix(self.tr("history_days_suffix"))
         history_layout.addLayout(history_controls)
         
-        right_panel.addWidget(self.history_group)
+        history_row.addWidget(self.history_group)
+
+        self.details_group = QGroupBox(self.tr("job_details"))
+        details_layout = QVBoxLayout(self.details_group)
+        self.metrics_table = QTableWidget(0, 4)
+        self.metrics_table.setMaximumHeight(150)
+        self.metrics_table.verticalHeader().setVisible(False)
+        self.metrics_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.metrics_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        details_layout.addWidget(self.metrics_table)
+        self.counters_label = QLabel(self.tr("no_metrics"))
+        self.counters_label.setWordWrap(True)
+        details_layout.addWidget(self.counters_label)
+        details_controls = QHBoxLayout()
+        self.export_metrics_btn = QPushButton(self.tr("export_metrics"))
+        self.export_metrics_btn.clicked.connect(self.export_metrics)
+        details_controls.addWidget(self.export_metrics_btn)
+        details_controls.addStretch()
+        details_layout.addLayout(details_controls)
+        history_row.addWidget(self.details_group)
+
+        right_panel.addLayout(history_row)
         
         # Layout'ları birleştir
         main_layout.addLayout(left_panel, 2)
         main_layout.addLayout(right_panel, 1)
+
+        # Önizleme açıksa ayar değişiklikleri kısa bir beklemeyle yansıtılır
+        self.threshold_spin.valueChanged.connect(self.preview_timer.start)
+        self.method_combo.currentIndexChanged.connect(self.preview_timer.start)
+        self.mosaic_size.valueChanged.connect(self.preview_timer.start)
+        self.detection_size.currentIndexChanged.connect(self.preview_timer.start)
+        self.preview_frames.valueChanged.connect(self.preview_timer.start)
+        self.preview_start.valueChanged.connect(self.preview_timer.start)
+        self.preview_window.valueChanged.connect(self.preview_timer.start)
+        self.input_path.textChanged.connect(self.clear_preview)
         
         # Menü çubuğu oluştur
         self.create_menu_bar()
@@ -341,8 +1660,9 @@ class DefaceGUI(QMainWindow):
         # Karanlık tema uygula
         self.apply_dark_theme()
         
-        # Geçmişi yükle
+        # Geçmişi ve izlenen klasörleri yükle
         self.load_history()
+        self.load_watch_folders()
     
     def create_menu_bar(self):
         menubar = self.menuBar()
@@ -405,16 +1725,105 @@ class DefaceGUI(QMainWindow):
         # Seçenekler
         self.options_group.setTitle(self.tr("anonymization_options"))
         self.method_label.setText(self.tr("method"))
+        self.encoder_preset_label.setText(self.tr("encoder_preset"))
+        for index in range(self.encoder_preset.count()):
+            self.encoder_preset.setItemText(index, self.tr("encoder_preset_" + self.encoder_preset.itemData(index)))
+        self.encoder_preset.setToolTip(self.tr("tooltip_encoder_preset"))
+        self.encoder_threads_label.setText(self.tr("encoder_threads"))
+        self.encoder_threads.setSpecialValueText(self.tr("encoder_threads_auto"))
+        self.encoder_threads.setToolTip(self.tr("tooltip_encoder_threads"))
         self.keep_audio.setText(self.tr("keep_audio"))
+        self.keep_audio.setToolTip(self.tr("tooltip_keep_audio"))
         self.preview_mode.setText(self.tr("preview_mode"))
+        self.time_ranges_label.setText(self.tr("time_ranges"))
+        self.time_ranges_edit.setPlaceholderText(self.tr("time_ranges_placeholder"))
+        self.time_ranges_edit.setToolTip(self.tr("tooltip_time_ranges"))
+        self.roi_label.setText(self.tr("roi"))
+        self.roi_draw_btn.setText(self.tr("roi_draw"))
+        self.roi_mask_btn.setText(self.tr("roi_load_mask"))
+        self.roi_clear_btn.setText(self.tr("clear"))
+        for widget in (self.roi_label, self.roi_draw_btn, self.roi_mask_btn, self.roi_summary):
+            widget.setToolTip(self.tr("tooltip_roi"))
+        self.set_roi(self.roi_rects, self.roi_mask_path)
         
         # Gelişmiş ayarlar
         self.advanced_group.setTitle(self.tr("advanced_settings"))
         self.threshold_label.setText(self.tr("detection_threshold"))
         self.mosaic_label.setText(self.tr("mosaic_size"))
         self.threshold_spin.setToolTip(self.tr("tooltip_threshold"))
+        self.interval_label.setText(self.tr("detect_interval"))
+        self.detect_interval.setToolTip(self.tr("tooltip_detect_interval"))
+        self.detection_size_label.setText(self.tr("detection_size"))
+        self.detection_size.setItemText(0, self.tr("detection_size_native"))
+        self.detection_size.setItemText(1, self.tr("detection_size_auto"))
+        self.detection_size.setToolTip(
+            self.tr("tooltip_detection_size").format(defaceengine.AUTO_DETECTION_SIZE))
+        self.tile_threshold_label.setText(self.tr("tile_threshold"))
+        self.tile_threshold.setSpecialValueText(self.tr("tile_threshold_off"))
+        self.tile_threshold.setToolTip(self.tr("tooltip_tile_threshold"))
+        self.batch_size_label.setText(self.tr("batch_size"))
+        self.batch_size.setToolTip(self.tr("tooltip_batch_size"))
+        self.skip_unchanged.setText(self.tr("skip_unchanged"))
+        self.skip_unchanged.setToolTip(self.tr("tooltip_skip_unchanged"))
+        self.dedup_label.setText(self.tr("dedup_mode"))
+        self.dedup_mode.setItemText(0, self.tr("dedup_copy"))
+        self.dedup_mode.setItemText(1, self.tr("dedup_link"))
+        self.dedup_mode.setToolTip(self.tr("tooltip_dedup_mode"))
         self.mosaic_size.setToolTip(self.tr("tooltip_mosaic_size"))
-        
+        self.engine_mode.setText(self.tr("engine_mode"))
+        self.engine_mode.setToolTip(self.tr("tooltip_engine_mode"))
+        self.detection_cache.setText(self.tr("detection_cache"))
+        self.detection_cache.setToolTip(self.tr("tooltip_detection_cache"))
+        self.segments_label.setText(self.tr("video_segments"))
+        self.segments.setToolTip(self.tr("tooltip_video_segments"))
+        self.workers_label.setText(self.tr("worker_count"))
+        self.worker_count.setToolTip(self.tr("tooltip_worker_count"))
+        self.thread_budget_label.setText(self.tr("thread_budget"))
+        self.thread_budget.setSpecialValueText(self.tr("thread_budget_all"))
+        self.thread_budget.setToolTip(self.tr("tooltip_thread_budget"))
+        self.cpu_list_label.setText(self.tr("cpu_list"))
+        self.cpu_list.setPlaceholderText(self.tr("cpu_list_placeholder"))
+        self.cpu_list.setToolTip(self.tr("tooltip_cpu_list"))
+        self.pin_workers.setText(self.tr("pin_workers"))
+        self.pin_workers.setToolTip(self.tr("tooltip_pin_workers"))
+        self.nice_label.setText(self.tr("nice_level"))
+        self.nice_level.setToolTip(self.tr("tooltip_nice_level"))
+        self.io_priority_label.setText(self.tr("io_priority"))
+        for index in range(self.io_priority.count()):
+            self.io_priority.setItemText(index, self.tr("io_priority_" + (self.io_priority.itemData(index) or "normal")))
+        self.io_priority.setToolTip(self.tr("tooltip_io_priority"))
+        self.profile_jobs.setText(self.tr("profile_jobs"))
+        self.profile_jobs.setToolTip(self.tr("tooltip_profile_jobs"))
+
+        # İş kuyruğu
+        self.queue_group.setTitle(self.tr("job_queue"))
+        self.queue_table.setHorizontalHeaderLabels([self.tr("queue_file"), self.tr("queue_status")])
+        self.add_files_btn.setText(self.tr("add_files"))
+        self.add_folder_btn.setText(self.tr("add_folder"))
+        self.clear_queue_btn.setText(self.tr("clear_queue"))
+        self.cancel_selected_btn.setText(self.tr("cancel_selected"))
+        for row, job in enumerate(self.jobs):
+            self.queue_table.item(row, 1).setText(self.tr("status_" + job.status))
+
+        # Hızlı önizleme
+        self.preview_group.setTitle(self.tr("quick_preview"))
+        self.preview_group.setToolTip(self.tr("tooltip_quick_preview"))
+        self.preview_btn.setText(self.tr("preview_button"))
+        self.preview_frames_label.setText(self.tr("preview_frames"))
+        self.preview_start_label.setText(self.tr("preview_start"))
+        self.preview_window_label.setText(self.tr("preview_window"))
+        self.preview_start.setSuffix(self.tr("seconds_suffix"))
+        self.preview_window.setSuffix(self.tr("seconds_suffix"))
+        self.preview_window.setSpecialValueText(self.tr("preview_window_all"))
+
+        # Klasör izleme
+        self.watch_group.setTitle(self.tr("watch_folders"))
+        self.watch_group.setToolTip(self.tr("tooltip_watch_folders"))
+        self.add_watch_btn.setText(self.tr("add_watch_folder"))
+        self.remove_watch_btn.setText(self.tr("remove_watch_folder"))
+        self.watch_btn.setText(self.tr("stop_watch" if self.watch_worker is not None else "start_watch"))
+        self.load_watch_folders()
+
         # Tooltips
         self.method_combo.setItemData(0, self.tr("tooltip_blur"), Qt.ToolTipRole)
         self.method_combo.setItemData(1, self.tr("tooltip_mosaic"), Qt.ToolTipRole)
@@ -422,13 +1831,30 @@ class DefaceGUI(QMainWindow):
         
         # Butonlar
         self.process_btn.setText(self.tr("start_process"))
+        self.pause_btn.setText(self.tr("resume_process" if self.pause_btn.isChecked() else "pause_process"))
+        self.pause_btn.setToolTip(self.tr("tooltip_pause_process"))
+        self.cancel_btn.setText(self.tr("cancel_process"))
+        self.cancel_btn.setToolTip(self.tr("tooltip_cancel_process"))
         self.clear_log_btn.setText(self.tr("clear"))
         self.save_log_btn.setText(self.tr("save"))
+        self.log_lines_label.setText(self.tr("log_line_limit"))
+        self.log_lines.setToolTip(self.tr("tooltip_log_line_limit"))
         self.clear_history_btn.setText(self.tr("clear_history"))
+        self.history_search.setPlaceholderText(self.tr("history_search"))
+        self.history_keep_label.setText(self.tr("history_keep"))
+        for spin in (self.history_max_entries, self.history_max_days):
+            spin.setSpecialValueText(self.tr("unlimited"))
+            spin.setToolTip(self.tr("tooltip_history_keep"))
+        self.history_max_entries.setSuffix(self.tr("history_entries_suffix"))
+        self.history_max_days.setSuffix(self.tr("history_days_suffix"))
+        self.load_history()
+        self.export_metrics_btn.setText(self.tr("export_metrics"))
         
         # Gruplar
         self.log_group.setTitle(self.tr("process_log"))
         self.history_group.setTitle(self.tr("process_history"))
+        self.details_group.setTitle(self.tr("job_details"))
+        self.show_metrics(self.shown_metrics)
         
         # Menüler
         self.file_menu.setTitle(self.tr("file_menu"))
@@ -472,17 +1898,157 @@ class DefaceGUI(QMainWindow):
     
     def dropEvent(self, event):
         files = [u.toLocalFile() for u in event.mimeData().urls()]
-        if files:
+        if len(files) == 1 and os.path.isfile(files[0]):
             self.input_path.setText(files[0])
             self.auto_suggest_output(files[0])
+        elif files:
+            # Birden çok dosya veya klasör kuyruğa eklenir
+            self.add_to_queue(files)
         self.dragLeaveEvent(event)
     
     def auto_suggest_output(self, input_path):
-        if os.path.isfile(input_path):
-            base, ext = os.path.splitext(input_path)
-            self.output_path.setText(f"{base}_anonimlestirilmis{ext}")
+        self.output_path.setText(defaceengine.suggest_output_path(input_path))
+
+    def add_to_queue(self, paths):
+        queued = {job.input_path for job in self.jobs}
+        new_paths = [p for p in defaceengine.collect_inputs(paths) if p not in queued]
+        self.queue_table.setUpdatesEnabled(False)
+        for path in new_paths:
+            self.append_job(defaceengine.Job(path, defaceengine.suggest_output_path(path), job_id=len(self.jobs)))
+        self.queue_table.setUpdatesEnabled(True)
+        self.log_message(self.tr("files_added").format(len(new_paths)))
+
+    def append_job(self, job):
+        self.jobs.append(job)
+        row = self.queue_table.rowCount()
+        self.queue_table.insertRow(row)
+        file_item = QTableWidgetItem(os.path.basename(job.input_path))
+        file_item.setToolTip(f"{job.input_path}\n→ {job.output_path}")
+        self.queue_table.setItem(row, 0, file_item)
+        self.queue_table.setItem(row, 1, QTableWidgetItem(self.tr("status_" + job.status)))
+
+    def offer_resume(self):
+        """Önceki oturumda yarıda kalan toplu işi kaldığı yerden sürdürmeyi önerir
+
+        Birden fazla kayıt varsa en yenisi sorulur; diğerleri sonraki açılışa
+        veya komut satırındaki --resume seçeneğine kalır.
+        """
+        self.job_store = defaceengine.JobStore()
+        batches = self.job_store.unfinished()
+        if not batches or self.jobs:
+            return
+        batch, options, jobs = batches[-1]
+        pending = sum(1 for job in jobs if job.status not in ("done", "skipped"))
+        answer = QMessageBox.question(
+            self, self.tr("resume_title"), self.tr("resume_question").format(pending, len(jobs)),
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if answer != QMessageBox.Yes:
+            self.job_store.finish(batch)
+            return
+        for job in jobs:
+            self.append_job(job)
+        self.resume_batch = (batch, options)
+        self.start_batch()
+        self.log_message(self.tr("batch_resumed").format(pending))
+
+    def browse_queue_files(self):
+        files, _ = QFileDialog.getOpenFileNames(self, self.tr("add_files"), "", self.tr("video_image_files"))
+        if files:
+            self.add_to_queue(files)
+
+    def browse_queue_folder(self):
+        directory = QFileDialog.getExistingDirectory(self, self.tr("add_folder"))
+        if directory:
+            self.add_to_queue([directory])
+
+    def clear_queue(self):
+        if getattr(self, "batch_worker", None) is not None and self.batch_worker.isRunning():
+            return
+        self.jobs = []
+        self.queue_table.setRowCount(0)
+        self.throughput_label.setText("")
+
+    def watch_folders(self):
+        return [defaceengine.WatchFolder.from_dict(entry) for entry in self.file_settings.get("watch_folders", [])]
+
+    def load_watch_folders(self):
+        self.watch_list.clear()
+        for folder in self.watch_folders():
+            output = folder.output_dir or self.tr("watch_next_to_input")
+            self.watch_list.addItem(f"{folder.path} → {output}")
+            self.watch_list.item(self.watch_list.count() - 1).setToolTip(
+                f"{folder.options.method}, {folder.options.threshold:g}")
+
+    def add_watch_folder(self):
+        """Klasörü o anki arayüz seçenekleriyle birlikte izleme listesine kaydeder"""
+        directory = QFileDialog.getExistingDirectory(self, self.tr("add_watch_folder"))
+        if not directory:
+            return
+        output_dir = QFileDialog.getExistingDirectory(self, self.tr("watch_output_title"))
+        folder = defaceengine.WatchFolder(directory, output_dir, self.job_options())
+        self.file_settings.setdefault("watch_folders", []).append(folder.to_dict())
+        self.save_file_settings()
+        self.load_watch_folders()
+
+    def remove_watch_folder(self):
+        row = self.watch_list.currentRow()
+        folders = self.file_settings.get("watch_folders", [])
+        if 0 <= row < len(folders):
+            del folders[row]
+            self.save_file_settings()
+            self.load_watch_folders()
+
+    def toggle_watch(self):
+        if self.watch_worker is not None:
+            self.watch_btn.setEnabled(False)
+            self.log_message(self.tr("watch_stopping"))
+            self.watch_worker.stop.set()
+            return
+        folders = [folder for folder in self.watch_folders() if os.path.isdir(folder.path)]
+        if not folders:
+            return
+        self.watch_worker = WatchWorker(folders, self.worker_count.value())
+        self.watch_worker.watch_event.connect(self.on_watch_event)
+        self.watch_worker.finished.connect(self.watch_finished)
+        self.watch_btn.setText(self.tr("stop_watch"))
+        self.add_watch_btn.setEnabled(False)
+        self.remove_watch_btn.setEnabled(False)
+        self.watch_worker.start()
+
+    def on_watch_event(self, event):
+        if event["type"] == "watching":
+            self.log_message(self.tr("watch_started").format(len(event["folders"]), event["backend"]))
+        elif event["type"] == "queued":
+            self.log_message(self.tr("watch_queued").format(os.path.basename(event["input"])))
+        elif event["type"] == "finished":
+            name = os.path.basename(event["input"])
+            method = self.watch_worker.service.folder_for(event["input"]).options.method
+            history_id = self.add_to_history(event["input"], event["output"], method)
+            self.record_metrics(history_id, event["status"], event["seconds"], event["metrics"])
+            if event["status"] == "failed":
+                self.log_message(self.tr("batch_job_failed").format(name, event["error"]))
+            elif event.get("reason") == "unchanged":
+                self.log_message(self.tr("job_skipped_unchanged").format(name))
+            elif event.get("reason") == "duplicate":
+                self.log_message(self.tr("job_skipped_duplicate").format(name, event["source"]))
+            else:
+                self.log_message(self.tr("watch_done").format(name, event["seconds"]))
+
+    def watch_finished(self, success, message):
+        self.watch_worker = None
+        self.watch_btn.setEnabled(True)
+        self.watch_btn.setText(self.tr("start_watch"))
+        self.add_watch_btn.setEnabled(True)
+        self.remove_watch_btn.setEnabled(True)
+        if success:
+            self.log_message(self.tr("watch_stopped"))
         else:
-            self.output_path.setText(input_path + "_anonimlestirilmis")
+            self.log_message(self.tr("process_error").format(message))
+
+    def set_job_status(self, job_id, status):
+        self.jobs[job_id].status = status
+        self.queue_table.item(job_id, 1).setText(self.tr("status_" + status))
     
     def load_settings(self):
         try:
@@ -490,9 +2056,9 @@ class DefaceGUI(QMainWindow):
                 with open(self.settings_file, 'r') as f:
                     self.file_settings = json.load(f)
             else:
-                self.file_settings = {"history": []}
+                self.file_settings = {}
         except:
-            self.file_settings = {"history": []}
+            self.file_settings = {}
     
     def save_file_settings(self):
         try:
@@ -501,48 +2067,187 @@ class DefaceGUI(QMainWindow):
         except:
             pass
     
+    def migrate_history(self):
+        """Ayar dosyasındaki eski geçmiş listesini geçmiş veritabanına taşır"""
+        entries = self.file_settings.pop("history", None)
+        if entries:
+            self.history.import_entries(entries)
+        if entries is not None:
+            self.save_file_settings()
+        self.history.prune(self.history_max_entries_setting(), self.history_max_days_setting())
+
+    def history_max_entries_setting(self):
+        return int(self.settings.value("history_max_entries", defaceengine.DEFAULT_HISTORY_MAX_ENTRIES))
+
+    def history_max_days_setting(self):
+        return int(self.settings.value("history_max_days", defaceengine.DEFAULT_HISTORY_MAX_DAYS))
+
+    def resource_governor_setting(self):
+        try:
+            return defaceengine.ResourceGovernor.from_dict(json.loads(self.settings.value("resource_governor", "{}")))
+        except (ValueError, TypeError):
+            return defaceengine.ResourceGovernor()
+
+    def set_resource_governor(self):
+        """Kaynak ayarlarını kaydeder; sonraki işçi havuzları bu ayarlarla başlar"""
+        try:
+            cpus = defaceengine.parse_cpu_list(self.cpu_list.text())
+            # Var olmayan çekirdeğe bağlanmaya çalışan işçi havuzu başlayamaz
+            if hasattr(os, "sched_getaffinity") and not set(cpus) <= os.sched_getaffinity(0):
+                raise ValueError(self.cpu_list.text())
+        except ValueError as e:
+            self.cpu_list.setStyleSheet("border: 1px solid #d9534f;")
+            self.log_message(self.tr("invalid_cpu_list").format(e))
+            return
+        self.cpu_list.setStyleSheet("")
+        governor = defaceengine.ResourceGovernor(
+            thread_budget=self.thread_budget.value(),
+            cpus=cpus,
+            pin_workers=self.pin_workers.isChecked(),
+            nice=self.nice_level.value(),
+            ionice=self.io_priority.currentData(),
+        )
+        defaceengine.set_governor(governor)
+        self.settings.setValue("resource_governor", json.dumps(governor.to_dict()))
+
+    def set_history_retention(self):
+        self.settings.setValue("history_max_entries", self.history_max_entries.value())
+        self.settings.setValue("history_max_days", self.history_max_days.value())
+        self.history.prune(self.history_max_entries.value(), self.history_max_days.value())
+        self.load_history()
+
     def load_history(self):
+        """Geçmişin geçerli sayfasını en yeniden eskiye listeler"""
+        page_size = defaceengine.HISTORY_PAGE_SIZE
+        search = self.history_search.text().strip()
+        total = self.history.count(search)
+        pages = max(1, -(-total // page_size))
+        self.history_page = min(self.history_page, pages - 1)
         self.history_list.clear()
-        for item in self.file_settings.get("history", [])[-10:]:
-            self.history_list.addItem(f"{item['date']} - {os.path.basename(item['input'])}")
-    
+        for entry in self.history.page(self.history_page * page_size, page_size, search):
+            item = QListWidgetItem(f"{entry['date']} - {os.path.basename(entry['input'])}")
+            item.setData(Qt.UserRole, entry["id"])
+            item.setToolTip(f"{entry['input']}\n→ {entry['output']}")
+            self.history_list.addItem(item)
+        self.history_page_label.setText(self.tr("history_page").format(self.history_page + 1, pages, total))
+        self.history_prev_btn.setEnabled(self.history_page > 0)
+        self.history_next_btn.setEnabled(self.history_page < pages - 1)
+
+    def search_history(self):
+        self.history_page = 0
+        self.load_history()
+
+    def change_history_page(self, step):
+        self.history_page = max(0, self.history_page + step)
+        self.load_history()
+
     def add_to_history(self, input_path, output_path, method):
-        history_item = {
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M"),
-            "input": input_path,
-            "output": output_path,
-            "method": method
-        }
-        
-        if "history" not in self.file_settings:
-            self.file_settings["history"] = []
-        
-        self.file_settings["history"].append(history_item)
-        self.save_file_settings()
+        """Kaydı ekler ve kimliğini döndürür"""
+        entry_id = self.history.add([(input_path, output_path, method)])[0]
         self.load_history()
-    
+        return entry_id
+
+    def history_entry(self, item):
+        return self.history.get(item.data(Qt.UserRole)) if item is not None else None
+
     def load_from_history(self, item):
-        try:
-            index = self.history_list.row(item)
-            history_item = self.file_settings["history"][-(10-index)]
-            self.input_path.setText(history_item["input"])
-            self.output_path.setText(history_item["output"])
-            method_index = ["blur", "mosaic", "solid"].index(history_item["method"])
-            self.method_combo.setCurrentIndex(method_index)
-        except:
-            pass
-    
+        entry = self.history_entry(item)
+        if entry is None:
+            return
+        self.input_path.setText(entry["input"])
+        self.output_path.setText(entry["output"])
+        if entry["method"] in ("blur", "mosaic", "solid"):
+            self.method_combo.setCurrentIndex(["blur", "mosaic", "solid"].index(entry["method"]))
+
+    def show_history_details(self, row):
+        entry = self.history_entry(self.history_list.item(row))
+        if entry is not None:
+            self.show_metrics(entry["metrics"])
+
+    def show_job_details(self, row):
+        if 0 <= row < len(self.jobs):
+            self.show_metrics(self.jobs[row].metrics)
+
+    def show_metrics(self, metrics):
+        """Bir işin aşama sürelerini ve sayaçlarını ayrıntı panelinde gösterir"""
+        self.shown_metrics = metrics
+        self.metrics_table.setHorizontalHeaderLabels([
+            self.tr("metric_stage"), self.tr("metric_seconds"),
+            self.tr("metric_calls"), self.tr("metric_mean")
+        ])
+        if not metrics:
+            self.metrics_table.setRowCount(0)
+            self.counters_label.setText(self.tr("no_metrics"))
+            return
+        stages = metrics.get("stages", {})
+        self.metrics_table.setRowCount(len(stages))
+        for row, (name, stage) in enumerate(stages.items()):
+            values = [name, f"{stage['seconds']:.2f}", str(stage["calls"]), f"{stage['mean_ms']:.1f}"]
+            for column, value in enumerate(values):
+                self.metrics_table.setItem(row, column, QTableWidgetItem(value))
+        counters = metrics.get("counters", {})
+        text = self.tr("metric_counters").format(
+            counters.get("frames", 0), counters.get("faces", 0),
+            defaceengine.format_size(counters.get("bytes_read")),
+            defaceengine.format_size(counters.get("bytes_written"))
+        )
+        if metrics.get("profile"):
+            text += "\n" + self.tr("profile_saved").format(metrics["profile"])
+        self.counters_label.setText(text)
+
+    def record_metrics(self, history_id, status, seconds, metrics):
+        """Biten işin sonucunu geçmiş kaydına işler ve ayrıntı panelinde gösterir"""
+        if history_id is not None:
+            self.history.update(history_id, status, seconds, metrics)
+        if metrics.get("profile"):
+            self.log_message(self.tr("profile_saved").format(metrics["profile"]))
+        self.show_metrics(metrics)
+
+    def export_metrics(self):
+        filename, _ = QFileDialog.getSaveFileName(
+            self, self.tr("export_metrics"), "defacegui.prom", self.tr("prometheus_files"))
+        if filename:
+            defaceengine.write_prometheus(filename, self.history.metrics_records())
+            self.log_message(self.tr("metrics_exported").format(filename))
+
     def clear_history(self):
-        self.file_settings["history"] = []
-        self.save_file_settings()
+        self.history.clear()
         self.load_history()
     
     def save_log(self):
         filename, _ = QFileDialog.getSaveFileName(self, self.tr("save_log_title"), "deface_log.txt", self.tr("text_files"))
         if filename:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(self.log_text.toPlainText())
+            self.flush_log()
+            self.log_buffer.save(filename)
             self.log_message(self.tr("log_saved"))
+
+    def clear_log(self):
+        self.log_buffer.clear()
+        self.log_text.clear()
+
+    def set_log_line_limit(self, max_lines):
+        self.settings.setValue("log_max_lines", max_lines)
+        self.log_buffer.set_max_lines(max_lines)
+        self.log_text.setMaximumBlockCount(max_lines)
+
+    def flush_log(self):
+        lines = self.log_buffer.take_pending()
+        if lines:
+            self.log_text.appendPlainText("\n".join(lines))
+
+    def closeEvent(self, event):
+        if self.watch_worker is not None:
+            self.watch_worker.stop.set()
+            self.watch_worker.wait()
+        if self.preview_worker is not None:
+            self.preview_worker.wait()
+        # Pencere kapanınca arka planda çalışmaya devam eden süreç kalmaz
+        worker = self.active_worker()
+        if worker is not None:
+            worker.cancel()
+            worker.wait()
+        self.log_buffer.close()
+        super().closeEvent(event)
     
     def apply_dark_theme(self):
         dark_style = """
@@ -634,7 +2339,7 @@ class DefaceGUI(QMainWindow):
             background-color: #0078d4;
             border-radius: 4px;
         }
-        QTextEdit {
+        QPlainTextEdit {
             background-color: #1e1e1e;
             border: 2px solid #555555;
             border-radius: 6px;
@@ -663,14 +2368,84 @@ class DefaceGUI(QMainWindow):
         
     def browse_input(self):
         file_dialog = QFileDialog()
-        file_dialog.setFileMode(QFileDialog.AnyFile)
+        file_dialog.setFileMode(QFileDialog.ExistingFiles)
         file_dialog.setNameFilter(self.tr("video_image_files"))
         
         if file_dialog.exec_():
-            selected = file_dialog.selectedFiles()[0]
+            selected_files = file_dialog.selectedFiles()
+            if len(selected_files) > 1:
+                self.add_to_queue(selected_files)
+                return
+            selected = selected_files[0]
             self.input_path.setText(selected)
             self.auto_suggest_output(selected)
     
+    def update_preview(self):
+        """Girişten örnek kareleri alıp önizlemeyi oluşturur veya yeniler"""
+        path = self.input_path.text()
+        if not os.path.isfile(path):
+            QMessageBox.warning(self, self.tr("warning"), self.tr("select_valid_input"))
+            return
+        key = (path, self.preview_frames.value(), self.preview_start.value(), self.preview_window.value())
+        if self.preview_sampler is None or not self.preview_sampler.matches(*key):
+            self.preview_sampler = defaceengine.PreviewSampler(*key)
+            self.preview_status.setText(self.tr("preview_loading"))
+        self.render_preview()
+
+    def refresh_preview(self):
+        # Önizleme yalnızca kullanıcı bir kez açtıktan sonra kendiliğinden yenilenir
+        if self.preview_sampler is not None:
+            self.update_preview()
+
+    def clear_preview(self):
+        self.preview_sampler = None
+        self.preview_status.setText("")
+        while self.preview_grid.count():
+            self.preview_grid.takeAt(0).widget().deleteLater()
+
+    def render_preview(self):
+        # Çizim sürerken gelen istekler birleştirilir; en son ayarlar bir kez çizilir
+        if self.preview_worker is not None and self.preview_worker.isRunning():
+            self.preview_pending = True
+            return
+        self.preview_pending = False
+        self.preview_worker = PreviewWorker(self.preview_sampler, self.job_options(), self.preview_engine)
+        self.preview_worker.rendered.connect(self.show_preview)
+        self.preview_worker.finished.connect(self.on_preview_done)
+        self.preview_worker.start()
+
+    def on_preview_done(self):
+        # İş parçacığı bittikten sonra bekleyen çizim başlatılır
+        self.preview_worker.wait()
+        self.preview_engine = self.preview_worker.engine
+        if self.preview_pending:
+            self.render_preview()
+
+    def show_preview(self, rendered, seconds, error):
+        sampler = self.preview_worker.sampler
+        # Ayarlar değiştiyse eski sonuç çizilmez; yenisi on_preview_done'da başlar
+        if self.preview_pending:
+            return
+        if sampler is not self.preview_sampler:
+            return
+        if error:
+            self.preview_status.setText(self.tr("preview_error").format(error))
+            return
+        while self.preview_grid.count():
+            self.preview_grid.takeAt(0).widget().deleteLater()
+        columns = 3
+        for index, ((frame, faces), moment) in enumerate(zip(rendered, sampler.times)):
+            height, width = frame.shape[:2]
+            image = QImage(frame.data, width, height, frame.strides[0], QImage.Format_RGB888).copy()
+            label = QLabel()
+            label.setAlignment(Qt.AlignCenter)
+            label.setPixmap(QPixmap.fromImage(image).scaled(200, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            caption = defaceengine.format_duration(moment) if moment is not None else os.path.basename(sampler.input_path)
+            label.setToolTip(self.tr("preview_caption").format(caption, faces))
+            self.preview_grid.addWidget(label, index // columns, index % columns)
+        faces = sum(faces for _, faces in rendered)
+        self.preview_status.setText(self.tr("preview_status").format(len(rendered), faces, seconds * 1000))
+
     def browse_output(self):
         input_path = self.input_path.text()
         if os.path.isfile(input_path):
@@ -690,15 +2465,37 @@ class DefaceGUI(QMainWindow):
                 self.output_path.setText(selected)
 
             return
-        
+
+        directory = QFileDialog.getExistingDirectory(self, self.tr("browse_output"))
+        if directory:
+            self.output_path.setText(directory)
+
+    def start_processing(self):
+        if not self.check_time_ranges():
+            return
+        if self.jobs:
+            self.start_batch()
+            return
+
+        if not self.input_path.text() or not os.path.exists(self.input_path.text()):
+            QMessageBox.warning(self, self.tr("warning"), self.tr("select_valid_input"))
+            return
+        if not self.output_path.text():
+            QMessageBox.warning(self, self.tr("warning"), self.tr("select_output"))
+            return
+
         self.process_btn.setEnabled(False)
+        self.set_controls_active(True)
         self.progress.setVisible(True)
+        # İlk ilerleme olayına kadar belirsiz
         self.progress.setRange(0, 0)
-        self.log_text.clear()
+        self.status_label.setText("")
+        self.status_label.setVisible(True)
+        self.clear_log()
         self.log_message(self.tr("process_starting"))
         
         # Geçmişe ekle
-        self.add_to_history(
+        self.history_id = self.add_to_history(
             self.input_path.text(),
             self.output_path.text(),
             self.method_combo.currentText()
@@ -711,7 +2508,272 @@ class DefaceGUI(QMainWindow):
             self.method_combo.currentText(),
             self.keep_audio.isChecked(),
             self.preview_mode.isChecked(),
+            self.threshold_spin.value(),
+            self.mosaic_size.value(),
+            self.current_language,
+            self.translations,
+            self.engine_mode.isChecked(),
+            self.job_options(),
+            self.worker_count.value()
+        )
+        self.worker.log_signal.connect(self.log_message)
+        self.worker.progress_signal.connect(self.on_progress)
+        self.worker.finished.connect(self.process_finished)
+        self.worker.start()
+
+    def job_options(self):
+        """Arayüzdeki seçeneklerden motor için iş seçeneklerini oluşturur"""
+        return defaceengine.JobOptions(
+            method=self.method_combo.currentText(),
+            threshold=self.threshold_spin.value(),
+            mosaic_size=self.mosaic_size.value(),
+            keep_audio=self.keep_audio.isChecked(),
+            encoder_preset=self.encoder_preset.currentData(),
+            encoder_threads=self.encoder_threads.value(),
+            detection_cache=self.detection_cache.isChecked(),
+            detect_interval=self.detect_interval.value(),
+            detection_size=self.detection_size.currentData(),
+            tile_min_pixels=self.tile_threshold.value() * 1_000_000,
+            batch_size=self.batch_size.value(),
+            skip_unchanged=self.skip_unchanged.isChecked(),
+            dedup=self.dedup_mode.currentData(),
+            segments=self.segments.value(),
+            profile=self.profile_jobs.isChecked(),
+            time_ranges=self.time_ranges,
+            roi=self.roi_rects,
+            roi_mask=self.roi_mask_path,
+        )
+
+    def check_time_ranges(self, warn=True):
+        """Zaman aralıkları alanını çözer; geçersizse alanı işaretler ve False döndürür"""
+        try:
+            self.time_ranges = defaceengine.parse_time_ranges(self.time_ranges_edit.text())
+        except ValueError as e:
+            self.time_ranges_edit.setStyleSheet("border: 1px solid #d9534f;")
+            if warn:
+                QMessageBox.warning(self, self.tr("warning"), self.tr("invalid_time_ranges").format(e))
+            return False
+        self.time_ranges_edit.setStyleSheet("")
+        return True
+
+    def set_roi(self, rects, mask_path):
+        self.roi_rects = rects
+        self.roi_mask_path = mask_path
+        parts = []
+        if rects:
+            parts.append(self.tr("roi_rects").format(len(rects)))
+        if mask_path:
+            parts.append(self.tr("roi_mask_name").format(os.path.basename(mask_path)))
+        self.roi_summary.setText(", ".join(parts) or self.tr("roi_none"))
+        self.preview_timer.start()
+
+    def draw_roi(self):
+        """Girişin ilk karesini gösterip ilgi bölgesini fareyle çizdirir"""
+        path = self.input_path.text() or (self.jobs[0].input_path if self.jobs else "")
+        file_type = defaceengine.get_file_type(path) if path else "notfound"
+        try:
+            if file_type == "video":
+                frame = defaceengine.read_frame_at(path, self.preview_start.value())
+            elif file_type == "image":
+                import imageio.v2 as iio
+
+                frame = iio.imread(path)[..., :3]
+            else:
+                frame = None
+        except Exception as e:
+            self.log_message(self.tr("process_error").format(e))
+            frame = None
+        if frame is None:
+            QMessageBox.warning(self, self.tr("warning"), self.tr("select_valid_input"))
+            return
+        dialog = RoiDialog(self, frame, self.roi_rects, self.current_language, self.translations)
+        if dialog.exec_():
+            self.set_roi(dialog.canvas.rects, self.roi_mask_path)
+
+    def load_roi_mask(self):
+        path, _ = QFileDialog.getOpenFileName(self, self.tr("roi_load_mask"), "", self.tr("image_files"))
+        if path:
+            self.set_roi(self.roi_rects, path)
+
+    def start_batch(self):
+        pending = [job for job in self.jobs if job.status not in ("done", "skipped")]
+        if not pending:
+            return
+
+        self.process_btn.setEnabled(False)
+        self.clear_queue_btn.setEnabled(False)
+        self.set_controls_active(True)
+        self.cancel_selected_btn.setEnabled(True)
+        self.progress.setVisible(True)
+        self.progress.setRange(0, len(pending))
+        self.progress.setValue(0)
+        self.job_fps = {}
+        self.clear_log()
+        for job in pending:
+            self.set_job_status(job.job_id, "queued")
+
+        # Her durum değişimi iş kaydına yazılır; çökme sonrası kaldığı yerden sürer
+        if self.resume_batch is not None:
+            self.store_batch, options = self.resume_batch
+            self.resume_batch = None
+        else:
+            # İptal edilip yeniden başlatılan toplu işin eski kaydı bırakılmaz
+            if self.store_batch is not None:
+                self.job_store.finish(self.store_batch)
+            options = self.job_options()
+            self.store_batch = self.job_store.create(self.jobs, options)
+
+        # Sürdürülen toplu işte yöntem kayıttaki seçeneklerden gelir
+        method = options.method
+        ids = self.history.add([(job.input_path, job.output_path, method) for job in pending])
+        self.batch_history = dict(zip((job.job_id for job in pending), ids))
+        self.history.prune(self.history_max_entries.value(), self.history_max_days.value())
+        self.load_history()
+
+        workers = min(self.worker_count.value(), len(pending))
+        if options.segments > 1 and any(defaceengine.get_file_type(job.input_path) == "video" for job in pending):
+            # Parçalı videolar kuyruk uzunluğundan bağımsız olarak tüm işçileri kullanır
+            workers = self.worker_count.value()
+        self.log_message(self.tr("batch_starting").format(len(pending), workers))
+
+        self.batch_worker = BatchWorker(pending, options, workers)
+        self.batch_worker.job_event.connect(self.on_job_event)
+        self.batch_worker.finished.connect(self.batch_finished)
+        self.batch_worker.start()
+
+    def on_progress(self, event):
+        total = event["total"]
+        if total:
+            self.progress.setRange(0, total)
+            self.progress.setValue(min(event["frames"], total))
+            self.status_label.setText(self.tr("progress_status").format(
+                event["frames"], total, event["fps"], defaceengine.format_duration(event["eta"])))
+        else:
+            self.status_label.setText(self.tr("progress_status_unknown").format(event["frames"], event["fps"]))
+
+    def on_job_event(self, event):
+        self.job_store.update(self.store_batch, event)
+        if event["type"] == "status":
+            self.set_job_status(event["job"], event["status"])
+        elif event["type"] == "progress":
+            self.job_fps[event["job"]] = event["fps"]
+            if event["total"] and not self.pause_btn.isChecked():
+                percent = int(100 * event["frames"] / event["total"])
+                self.queue_table.item(event["job"], 1).setText(self.tr("status_running_percent").format(percent))
+        elif event["type"] == "finished":
+            self.job_fps.pop(event["job"], None)
+            self.set_job_status(event["job"], event["status"])
+            self.jobs[event["job"]].metrics = event["metrics"]
+            self.record_metrics(self.batch_history.get(event["job"]), event["status"],
+                                event["seconds"], event["metrics"])
+            job = self.jobs[event["job"]]
+            if event["status"] == "failed":
+                self.log_message(self.tr("batch_job_failed").format(os.path.basename(job.input_path), event["error"]))
+            elif event.get("reason") == "unchanged":
+                self.log_message(self.tr("job_skipped_unchanged").format(os.path.basename(job.input_path)))
+            elif event.get("reason") == "duplicate":
+                self.log_message(self.tr("job_skipped_duplicate").format(
+                    os.path.basename(job.input_path), event["source"]))
+        elif event["type"] == "throughput":
+            self.progress.setValue(event["done"])
+            self.throughput_label.setText(
+                self.tr("batch_progress").format(
+                    event["done"], event["total"], event["files_per_sec"], sum(self.job_fps.values())))
+
+    def batch_finished(self, success, message):
+        self.process_btn.setEnabled(True)
+        self.clear_queue_btn.setEnabled(True)
+        self.set_controls_active(False)
+        self.cancel_selected_btn.setEnabled(False)
+        self.progress.setVisible(False)
+        if not success:
+            # Kayıt silinmez; toplu iş sonraki açılışta sürdürülebilir
+            self.log_message(self.tr("process_error").format(message))
+            QMessageBox.critical(self, self.tr("error"), self.tr("process_failed").format(message))
+            return
+        cancelled = sum(1 for job in self.jobs if job.status == "cancelled")
+        if cancelled:
+            self.log_message(self.tr("batch_cancelled").format(cancelled))
+        else:
+            self.job_store.finish(self.store_batch)
+        succeeded = sum(1 for job in self.jobs if job.status == "done")
+        failed = sum(1 for job in self.jobs if job.status == "failed")
+        skipped = sum(1 for job in self.jobs if job.status == "skipped")
+        self.log_message(self.tr("batch_completed").format(succeeded, failed))
+        if skipped:
+            self.log_message(self.tr("batch_skipped").format(skipped))
+
+    def active_worker(self):
+        """Çalışan tekli veya toplu işlem iş parçacığını döndürür"""
+        for worker in (getattr(self, "batch_worker", None), getattr(self, "worker", None)):
+            if worker is not None and worker.isRunning():
+                return worker
+        return None
+
+    def set_controls_active(self, active):
+        self.pause_btn.blockSignals(True)
+        self.pause_btn.setChecked(False)
+        self.pause_btn.blockSignals(False)
+        self.pause_btn.setText(self.tr("pause_process"))
+        self.pause_btn.setEnabled(active)
+        self.cancel_btn.setEnabled(active)
+
+    def toggle_pause(self, paused):
+        worker = self.active_worker()
+        if worker is None:
+            return
+        if paused:
+            worker.pause()
+            self.log_message(self.tr("process_paused"))
+        else:
+            worker.resume()
+            self.log_message(self.tr("process_resumed"))
+        self.pause_btn.setText(self.tr("resume_process" if paused else "pause_process"))
+        # Çalışan satırlar duraklatıldığını gösterir
+        for row, job in enumerate(self.jobs):
+            if job.status == "running":
+                self.queue_table.item(row, 1).setText(self.tr("status_paused" if paused else "status_running"))
+
+    def cancel_processing(self):
+        worker = self.active_worker()
+        if worker is None:
+            return
+        self.log_message(self.tr("process_cancelling"))
+        self.cancel_btn.setEnabled(False)
+        self.pause_btn.setEnabled(False)
+        worker.cancel()
+
+    def cancel_selected_jobs(self):
+        """Seçili işleri iptal eder; diğer işler çalışmaya devam eder"""
+        worker = getattr(self, "batch_worker", None)
+        if worker is None or not worker.isRunning():
+            return
+        for index in self.queue_table.selectionModel().selectedRows():
+            job = self.jobs[index.row()]
+            if job.status in ("queued", "running"):
+                worker.control.cancel(job.job_id)
+
+    def report_startup_time(self):
+        elapsed = (time.perf_counter() - STARTUP_TIME) * 1000
+        self.log_message(self.tr("startup_time").format(elapsed))
+
+    def log_message(self, message):
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.log_buffer.append(f"[{timestamp}] {message}")
 
+    def process_finished(self, success, message):
+        self.process_btn.setEnabled(True)
+        self.set_controls_active(False)
+        self.progress.setVisible(False)
+        self.status_label.setVisible(False)
+        cancelled = not success and self.worker.control.is_cancelled()
+        status = "done" if success else "cancelled" if cancelled else "failed"
+        self.record_metrics(self.history_id, status, self.worker.seconds, self.worker.metrics)
+
+        if cancelled:
+            self.log_message(self.tr("process_cancelled"))
+        elif success:
+            self.log_message(self.tr("process_completed"))
             msg = QMessageBox()
             msg.setIcon(QMessageBox.Information)
             msg.setWindowTitle(self.tr("success"))
@@ -731,8 +2793,9 @@ class DefaceGUI(QMainWindow):
 class ProcessWorker(QThread):
     finished = pyqtSignal(bool, str)
     log_signal = pyqtSignal(str)
+    progress_signal = pyqtSignal(object)
     
-    def __init__(self, input_path, output_path, method, keep_audio, preview, threshold, mosaic_size, language, translations):
+    def __init__(self, input_path, output_path, method, keep_audio, preview, threshold, mosaic_size, language, translations, engine_mode=True, options=None, workers=None):
         super().__init__()
         self.input_path = input_path
         self.output_path = output_path
@@ -743,18 +2806,144 @@ class ProcessWorker(QThread):
         self.mosaic_size = mosaic_size
         self.language = language
         self.translations = translations
+        self.engine_mode = engine_mode
+        self.options = options
+        self.workers = workers
+        self.metrics = {}
+        self.seconds = 0.0
+        self.control = defaceengine.JobControl()
+        self.process = None
     
     def tr(self, key):
         return self.translations[self.language].get(key, key)
-    
-   
+
+    def cancel(self):
+        self.control.cancel()
+        self.signal_cli(signal.SIGTERM)
+        # Duraklatılmış süreç grubu SIGTERM'i ancak devam ettirilince işler
+        self.signal_cli(signal.SIGCONT)
+
+    def pause(self):
+        self.control.pause()
+        self.signal_cli(signal.SIGSTOP)
+
+    def resume(self):
+        self.control.resume()
+        self.signal_cli(signal.SIGCONT)
+
+    def signal_cli(self, signum):
+        """deface komutunu ve başlattığı ffmpeg süreçlerini birlikte sinyaller"""
+        process = self.process
+        if process is None or process.poll() is not None or not hasattr(os, "killpg"):
+            return
+        try:
+            os.killpg(process.pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def run(self):
+        start = time.perf_counter()
+        # Önizleme penceresi deface komutunun kendi OpenCV penceresini kullanır
+        if self.engine_mode and not self.preview:
+            self.run_engine()
+        else:
+            self.run_cli()
+        self.seconds = time.perf_counter() - start
+
+    def run_engine(self):
+        """İşi süreç içinde, önbelleğe alınmış CenterFace modeliyle çalıştırır"""
+        try:
+            options = self.options or defaceengine.JobOptions(
+                method=self.method,
+                threshold=self.threshold,
+                mosaic_size=self.mosaic_size,
+                keep_audio=self.keep_audio,
+            )
+            if options.segments > 1 and defaceengine.get_file_type(self.input_path) == "video":
+                self.run_segmented(options)
+                return
+            if not defaceengine.engine_loaded():
+                self.log_signal.emit(self.tr("engine_loading").format(options.backend))
+            governor = defaceengine.current_governor()
+            # Tek iş bu süreçte çalışır; bütçe verilmişse tamamı bu işe ayrılır
+            defaceengine.limit_threads(governor.threads_per_worker(1) if governor.thread_budget else 0)
+            engine = defaceengine.get_engine(options.backend)
+            self.log_signal.emit(self.tr("engine_processing").format(self.input_path))
+            metrics = engine.process(self.input_path, self.output_path, options,
+                                     self.progress_signal.emit, self.control)
+            self.metrics = metrics.to_dict()
+            self.finished.emit(True, "")
+        except defaceengine.JobCancelled:
+            self.finished.emit(False, "")
+        except ImportError:
+            self.finished.emit(False, self.tr("deface_not_found"))
+        except Exception as e:
+            self.finished.emit(False, str(e))
+
+    def run_segmented(self, options):
+        """Videoyu parçalara bölüp işçi havuzunda paralel işler"""
+        def on_event(event):
+            if event["type"] == "progress":
+                self.progress_signal.emit(event)
+            elif event["type"] == "segment":
+                if event["status"] == "done":
+                    self.log_signal.emit(self.tr("segment_done").format(
+                        event["segment"] + 1, event["count"], event["seconds"]))
+                else:
+                    self.log_signal.emit(self.tr("segment_failed").format(event["segment"] + 1, event["error"]))
+
+        self.log_signal.emit(self.tr("segment_splitting").format(options.segments))
+        metrics = defaceengine.SegmentedVideo(options, self.workers).run(
+            self.input_path, self.output_path, on_event, self.control)
+        self.metrics = metrics.to_dict()
+        self.finished.emit(True, "")
+
+    def run_cli(self):
+        try:
+            cmd = [
+                "deface", self.input_path,
+                "-o", self.output_path,
+                "--replacewith", self.method,
+                "--thresh", str(self.threshold),
+            ]
+            if self.method == "mosaic":
+                cmd.extend(["--mosaicsize", str(self.mosaic_size)])
+            if self.keep_audio:
+                cmd.append("--keep-audio")
+            options = self.options or defaceengine.JobOptions()
+            cmd.extend(["--ffmpeg-config", json.dumps(options.ffmpeg_config())])
+            if self.preview:
+                cmd.append("--preview")
+
+            self.log_signal.emit(self.tr("command").format(" ".join(cmd)))
+
+            # deface komutunun iç aşamaları görünmez; toplam süre ve baytlar kaydedilir
+            metrics = defaceengine.JobMetrics()
+            start = time.perf_counter()
+            # Ayrı süreç grubu, duraklatma ve iptal sinyallerinin ffmpeg'e de ulaşmasını sağlar
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                bufsize=1,
+                start_new_session=True
+            )
+            self.process = process
+
             for line in iter(process.stdout.readline, ''):
                 if line.strip():
                     self.log_signal.emit(line.strip())
             
             process.wait()
+            metrics.add_time("deface_cli", time.perf_counter() - start)
+            metrics.count_bytes(self.input_path, self.output_path)
+            self.metrics = metrics.to_dict()
             
-            if process.returncode == 0:
+            if self.control.is_cancelled():
+                defaceengine.discard_output(self.output_path)
+                self.finished.emit(False, "")
+            elif process.returncode == 0:
                 self.finished.emit(True, "")
             else:
                 self.finished.emit(False, self.tr("process_failed_code").format(process.returncode))
@@ -764,6 +2953,188 @@ class ProcessWorker(QThread):
         except Exception as e:
             self.finished.emit(False, str(e))
 
+class PreviewWorker(QThread):
+    rendered = pyqtSignal(object, float, str)
+
+    def __init__(self, sampler, options, engine=None):
+        super().__init__()
+        self.sampler = sampler
+        self.options = options
+        # Önizleme kendi motorunu kullanır; OpenCV ağı iş parçacıkları arasında paylaşılamaz
+        self.engine = engine
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            if self.engine is None:
+                self.engine = defaceengine.AnonymizationEngine(self.options.backend)
+            rendered = self.sampler.render(self.engine, self.options)
+            self.rendered.emit(rendered, time.perf_counter() - start, "")
+        except Exception as e:
+            self.rendered.emit([], 0.0, str(e) or type(e).__name__)
+
+class DefaceCheckWorker(QThread):
+    result = pyqtSignal(bool)
+
+    def run(self):
+        self.result.emit(check_deface_installed())
+
+class BatchWorker(QThread):
+    finished = pyqtSignal(bool, str)
+    job_event = pyqtSignal(object)
+
+    def __init__(self, jobs, options, workers):
+        super().__init__()
+        self.jobs = jobs
+        self.options = options
+        self.workers = workers
+        self.control = defaceengine.JobControl()
+
+    def cancel(self):
+        self.control.cancel()
+
+    def pause(self):
+        self.control.pause()
+
+    def resume(self):
+        self.control.resume()
+
+    def run(self):
+        start = time.perf_counter()
+        reported = set()
+
+        def relay(event):
+            # Havuzun ve parçalı videoların bitişleri tek bir ilerleme sayacında toplanır
+            if event["type"] == "throughput":
+                return
+            self.job_event.emit(event)
+            if event["type"] == "finished" and event["job"] not in reported:
+                reported.add(event["job"])
+                elapsed = time.perf_counter() - start
+                self.job_event.emit({"type": "throughput", "done": len(reported), "total": len(self.jobs),
+                                     "files_per_sec": len(reported) / elapsed if elapsed > 0 else 0.0})
+
+        try:
+            # Parçalı modda videolar tek tek tüm havuzu kullanır, diğer dosyalar birlikte işlenir
+            segmented = []
+            if self.options.segments > 1:
+                segmented = [job for job in self.jobs if defaceengine.get_file_type(job.input_path) == "video"]
+            segmented_ids = {job.job_id for job in segmented}
+            pooled = [job for job in self.jobs if job.job_id not in segmented_ids]
+            if pooled:
+                runner = defaceengine.BatchRunner(self.options, self.workers)
+                runner.run(pooled, relay, self.control)
+            for job in segmented:
+                if self.control.is_cancelled(job.job_id):
+                    defaceengine.BatchRunner.cancel(job, relay)
+                    continue
+                defaceengine.run_segmented_job(job, self.options, self.workers, "spawn", relay, self.control)
+            self.finished.emit(True, "")
+        except Exception as e:
+            self.finished.emit(False, str(e))
+
+class WatchWorker(QThread):
+    finished = pyqtSignal(bool, str)
+    watch_event = pyqtSignal(object)
+
+    def __init__(self, folders, workers):
+        super().__init__()
+        import threading
+
+        self.service = defaceengine.WatchService(folders, workers)
+        self.stop = threading.Event()
+
+    def run(self):
+        try:
+            self.service.run(self.stop, self.watch_event.emit)
+            self.finished.emit(True, "")
+        except Exception as e:
+            self.finished.emit(False, str(e))
+
+class RoiCanvas(QLabel):
+    """Kare üzerinde fareyle dikdörtgen çizilen alan; dikdörtgenler kareye oranla tutulur"""
+
+    def __init__(self, pixmap, rects):
+        super().__init__()
+        self.setPixmap(pixmap)
+        self.setFixedSize(pixmap.size())
+        self.setCursor(Qt.CrossCursor)
+        self.rects = [list(rect) for rect in rects]
+        self.origin = None
+        self.current = None
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.origin = event.pos()
+            self.current = QRect(self.origin, self.origin)
+
+    def mouseMoveEvent(self, event):
+        if self.origin is not None:
+            self.current = QRect(self.origin, event.pos()).normalized()
+            self.update()
+
+    def mouseReleaseEvent(self, event):
+        if self.origin is None:
+            return
+        rect = QRect(self.origin, event.pos()).normalized().intersected(self.rect())
+        self.origin = self.current = None
+        if rect.width() > 4 and rect.height() > 4:
+            width, height = self.width(), self.height()
+            self.rects.append([rect.x() / width, rect.y() / height, rect.width() / width, rect.height() / height])
+        self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setPen(QPen(QColor("#0078d4"), 2))
+        width, height = self.width(), self.height()
+        for x, y, w, h in self.rects:
+            painter.drawRect(QRectF(x * width, y * height, w * width, h * height))
+        if self.current is not None:
+            painter.drawRect(self.current)
+        painter.end()
+
+
+class RoiDialog(QDialog):
+    def __init__(self, parent, frame, rects, language="tr", translations=None):
+        super().__init__(parent)
+        self.language = language
+        self.translations = translations
+        self.setWindowTitle(self.tr("roi_dialog_title"))
+
+        layout = QVBoxLayout(self)
+        hint = QLabel(self.tr("roi_dialog_hint"))
+        hint.setWordWrap(True)
+        layout.addWidget(hint)
+
+        height, width = frame.shape[:2]
+        frame = frame.copy(order="C")
+        image = QImage(frame.data, width, height, frame.strides[0], QImage.Format_RGB888).copy()
+        pixmap = QPixmap.fromImage(image).scaled(960, 540, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.canvas = RoiCanvas(pixmap, rects)
+        layout.addWidget(self.canvas, 0, Qt.AlignCenter)
+
+        button_layout = QHBoxLayout()
+        clear_btn = QPushButton(self.tr("clear"))
+        clear_btn.clicked.connect(self.clear)
+        ok_btn = QPushButton(self.tr("ok"))
+        ok_btn.clicked.connect(self.accept)
+        cancel_btn = QPushButton(self.tr("cancel_process"))
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(clear_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(ok_btn)
+        button_layout.addWidget(cancel_btn)
+        layout.addLayout(button_layout)
+
+    def tr(self, key):
+        return self.translations[self.language].get(key, key)
+
+    def clear(self):
+        self.canvas.rects = []
+        self.canvas.update()
+
+
 class AboutDialog(QDialog):
     def __init__(self, parent=None, language="tr", translations=None):
         super().__init__(parent)
@@ -844,6 +3215,7 @@ class AboutDialog(QDialog):
         designer_label.setStyleSheet("padding: 3px; font-size: 12px;")
         dev_layout.addWidget(designer_label)
         
+        layout.addWidget(dev_group)
 
         # Lisans bilgileri
         license_group = QGroupBox(self.tr("license_info"))
@@ -950,6 +3322,9 @@ class AboutDialog(QDialog):
         return self.translations[self.language].get(key, key)
 
 if __name__ == "__main__":
+    # Paketlenmiş uygulamada işçi süreçlerinin yeniden GUI açmasını engelle
+    multiprocessing.freeze_support()
+
     app = QApplication(sys.argv)
     app.setApplicationName("Deface GUI Enhanced")
     app.setOrganizationName("DefaceGUI")
@@ -961,5 +3336,7 @@ if __name__ == "__main__":
     
     window = DefaceGUI()
     window.show()
+    # İlk olay döngüsü turunda, pencere çizildikten sonra ölç
+    QTimer.singleShot(0, window.report_startup_time)
     
     sys.exit(app.exec_())